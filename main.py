@@ -38,7 +38,7 @@ class ConsoleUI_OLD:
     
     def __init__(self):
         word_gen = get_word_generator()
-        self.game = GameLogic(word_gen.get_words())
+        self.game = GameLogic(word_gen.get_index())
         self.save_manager = SaveManager()
         self.running = True
     
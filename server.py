@@ -10,31 +10,61 @@ import socket
 from datetime import datetime
 from typing import Dict, Set, Optional, Any
 from src.word_generator import get_word_generator
-from src.solo.grid_generator import GridGenerator, GridConfig
+from src.solo.grid_generator import GridGenerator
+from src.solo.game_logic import GameLogic
+from src.solo.grid_store import get_grid_store
+from src.solo.grid_pool import get_grid_pool
+from src.solo.seed_catalog import get_seed_catalog
+from src.solo.grid_scanner import PlacementIndex, word_cells
 
 
 class GameRoom:
     """Représente une salle de jeu multijoueur."""
     
+    # Temps maximal de génération d'une grille au démarrage d'une partie (en millisecondes)
+    GRID_DEADLINE_MS = 250
+    
     def __init__(self, room_id: str, host_name: str, mode: str, level: int, seed: Optional[int] = None):
         self.room_id = room_id
         self.host_name = host_name
         self.mode = mode  # "duel" ou "coop"
         self.level = level
-        self.seed = seed or random.randint(1000, 9999999)
+        # Un seed imposé doit donner la même grille qu'en solo : jamais de budget de temps
+        self.seed_requested = seed is not None
+        # Sans seed imposé, la grille est réservée dès la création (démarrage sans attente)
+        self.prepared = None if seed is not None else get_grid_pool().pop(get_word_generator().get_index(), level)
+        if seed is None:
+            seed = self.prepared[0] if self.prepared else self._pick_seed()
+        self.seed = seed
         self.players: Dict[Any, dict] = {}
         self.max_players = 2
         self.game_started = False
+        self.starting = False  # Génération de la grille en cours (un seul démarrage)
         self.created_at = datetime.now()
         
         # État du jeu
         self.grid = None
         self.words_to_find = []
+        self.placements = PlacementIndex([])  # Mots placés par texte et par cases extrêmes
         self.found_words = {}  # {word: player_name} pour duel, {word: True} pour coop
         self.player_scores = {}  # {player_name: score}
         self.start_time = None
         self.game_duration = self._get_game_duration()
     
+    def _pick_seed(self) -> int:
+        """
+        Choisit un seed : un excellent seed du catalogue, sinon une grille
+        pré-générée (démarrage sans attente), sinon un seed aléatoire.
+        """
+        word_index = get_word_generator().get_index()
+        seed = get_seed_catalog().pick(word_index.language, self.level, word_index.version, GridGenerator.VERSION)
+        if seed is not None:
+            return seed
+        seeds = get_grid_store().seeds(word_index.language, self.level, word_index.version, GridGenerator.VERSION)
+        if seeds:
+            return random.choice(seeds)
+        return random.randint(1000, 9999999)
+    
     def _get_game_duration(self) -> int:
         """Retourne la durée de jeu en secondes selon le niveau."""
         durations = {1: 180, 2: 240, 3: 300, 4: 360, 5: 480}
@@ -70,22 +100,19 @@ class GameRoom:
     
     def start_game(self):
         """Démarre la partie."""
-        # Générer la grille et les mots
+        # Générer la grille et les mots (même tirage que le mode solo pour un seed donné)
         word_gen = get_word_generator()
-        all_words = word_gen.get_words()
-        
-        sizes = {1: (8, 5), 2: (10, 7), 3: (12, 9), 4: (14, 11), 5: (16, 14)}
-        grid_size, word_count = sizes.get(self.level, (10, 7))
-        
-        # Configuration des diagonales et inversions selon le niveau (mêmes paramètres que le solo)
-        allow_diagonal = self.level >= 2  # Diagonales à partir du niveau 2
-        allow_reverse = self.level >= 3   # Inversions à partir du niveau 3
+        word_index = word_gen.get_index()
         
-        generator = GridGenerator(self.seed)
-        selected_words = random.Random(self.seed).sample(all_words, word_count)
-        
-        config = GridConfig(size=grid_size, num_words=word_count, allow_diagonal=allow_diagonal, allow_reverse=allow_reverse)
-        self.grid, self.words_to_find = generator.generate_grid(config, selected_words)
+        if self.prepared is not None:
+            self.seed, self.grid, self.words_to_find = self.prepared
+            self.prepared = None
+        else:
+            deadline_ms = None if self.seed_requested else self.GRID_DEADLINE_MS
+            self.seed, self.grid, self.words_to_find = GameLogic.build_level_grid(
+                word_index, self.level, self.seed, deadline_ms=deadline_ms
+            )
+        self.placements = PlacementIndex(self.words_to_find)
         self.game_started = True
         self.start_time = datetime.now()
         
@@ -100,16 +127,31 @@ class GameRoom:
         word = word.upper()
         
         # Vérifier si le mot existe dans la liste
-        word_data = next((w for w in self.words_to_find if w['word'] == word), None)
+        word_data = self.placements.word(word)
+        if not word_data:
+            return {'valid': False, 'reason': 'not_in_list', 'word': word}
+        return self._claim_word(player_name, word_data)
+    
+    def check_selection(self, player_name: str, start, end) -> dict:
+        """Vérifie une sélection par ses cases extrêmes (même règle que `GameLogic.check_selection`)."""
+        try:
+            word_data = self.placements.between(tuple(start), tuple(end))
+        except TypeError:
+            word_data = None
         if not word_data:
-            return {'valid': False, 'reason': 'not_in_list'}
+            return {'valid': False, 'reason': 'not_placed', 'word': ''}
+        return self._claim_word(player_name, word_data)
+    
+    def _claim_word(self, player_name: str, word_data: dict) -> dict:
+        """Attribue un mot placé au joueur qui l'a trouvé et met à jour les scores."""
+        word = word_data['word']
         
         # Vérifier si le mot a déjà été trouvé
         if word in self.found_words:
             if self.mode == "duel":
-                return {'valid': False, 'reason': 'already_found', 'by': self.found_words[word]}
+                return {'valid': False, 'reason': 'already_found', 'word': word, 'by': self.found_words[word]}
             else:  # coop
-                return {'valid': False, 'reason': 'already_found'}
+                return {'valid': False, 'reason': 'already_found', 'word': word}
         
         # Mot valide!
         if self.mode == "duel":
@@ -124,6 +166,7 @@ class GameRoom:
         return {
             'valid': True,
             'word': word,
+            'cells': word_cells(word_data, len(self.grid)),
             'finder': player_name,
             'scores': self.player_scores,
             'found_count': len(self.found_words),
@@ -274,13 +317,15 @@ class MultiplayerServer:
                                 'player_name': player_name
                             })
                             
-                            if room.all_players_ready():
+                            if room.all_players_ready() and not room.starting:
+                                room.starting = True
                                 # Log de début de partie
                                 mode_text = "Duel" if room.mode == "duel" else "Coop"
                                 print(f"🎮 [{datetime.now().strftime('%H:%M:%S')}] Game starting in room {room.room_id}")
                                 print(f"   └─ Mode: {mode_text} | Level: {room.level} | Players: {', '.join([p['name'] for p in room.players.values()])}")
                                 
-                                room.start_game()
+                                # Génération hors de la boucle asyncio : les autres clients ne sont pas bloqués
+                                await asyncio.get_running_loop().run_in_executor(None, room.start_game)
                                 await self.broadcast_to_room(room, {
                                     'type': 'game_start',
                                     'grid': room.grid,
@@ -289,11 +334,14 @@ class MultiplayerServer:
                                     'seed': room.seed
                                 })
                 
-                elif action == 'check_word':
+                elif action in ('check_word', 'check_selection'):
                     if current_room:
                         room = self.rooms[current_room]
                         player_name = room.players[websocket]['name']
-                        result = room.check_word(player_name, data['word'])
+                        if action == 'check_selection':
+                            result = room.check_selection(player_name, data.get('start'), data.get('end'))
+                        else:
+                            result = room.check_word(player_name, data['word'])
                         
                         if result['valid']:
                             # Log de mot trouvé
@@ -303,6 +351,7 @@ class MultiplayerServer:
                             await self.broadcast_to_room(room, {
                                 'type': 'word_found',
                                 'word': result['word'],
+                                'cells': result['cells'],
                                 'finder': result['finder'],
                                 'scores': result['scores'],
                                 'found_count': result['found_count'],
@@ -312,7 +361,7 @@ class MultiplayerServer:
                             await websocket.send(json.dumps({
                                 'type': 'word_invalid',
                                 'reason': result['reason'],
-                                'word': data['word']
+                                'word': result['word']
                             }))
                         
                         # Vérifier fin de partie
@@ -382,9 +431,17 @@ class MultiplayerServer:
                         del self.rooms[room.room_id]
     
     async def create_room(self, host_name: str, mode: str, level: int, seed: Optional[int] = None) -> GameRoom:
-        """Crée une nouvelle room."""
+        """
+        Crée une nouvelle room.
+        
+        La préparation (dictionnaire, catalogue, réserve de grilles) se fait
+        dans un thread : elle peut lire le disque ou télécharger un
+        dictionnaire sans bloquer les autres clients.
+        """
         room_id = f"ROOM_{random.randint(1000, 9999)}"
-        room = GameRoom(room_id, host_name, mode, level, seed)
+        room = await asyncio.get_running_loop().run_in_executor(
+            None, GameRoom, room_id, host_name, mode, level, seed
+        )
         self.rooms[room_id] = room
         return room
     
@@ -425,6 +482,9 @@ class MultiplayerServer:
         """Starts the server."""
         local_ip = self.get_local_ip()
         
+        # Préparer des grilles pour les niveaux proposés avant l'arrivée des joueurs
+        get_grid_pool().warm(get_word_generator().get_index(), range(1, 6))
+        
         async with websockets.serve(self.handle_client, self.host, self.port):
             print("=" * 70)
             print("🎮 PyWordExplorer - Multiplayer Server")
@@ -0,0 +1,319 @@
+"""
+Préparation du cache hors ligne (dictionnaires, index, grilles).
+Usage : python -m src.word_generator build [--languages fr en] [--grids 50]
+        python -m src.word_generator stats [--levels 1 10] [--seeds 20]
+        python -m src.word_generator catalog [--levels 1 10] [--seeds 500]
+
+Après cette commande, le serveur et l'interface démarrent avec un cache chaud
+et n'écrivent plus jamais dans le dossier du cache.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.word_generator import WordGenerator
+from src.dictionary_fetcher import DictionaryFetcher
+from src.solo.game_logic import GameLogic
+from src.solo.grid_generator import GridGenerator
+from src.solo.grid_batch import generate_many
+from src.solo.grid_store import GridCache, GRID_CACHE_FILE
+from src.solo.seed_catalog import SeedCatalog, SEED_CATALOG_FILE
+
+
+class CacheBuilder:
+    """Construit tous les fichiers du cache et écrit le manifeste."""
+    
+    def __init__(self, languages: List[str], refresh: bool = False, build_dawg: bool = True,
+                 grids_per_level: int = 0, max_level: int = 5, first_seed: int = 1000,
+                 workers: Optional[int] = None):
+        """
+        Initialise la construction.
+        
+        Args:
+            languages: Langues à préparer
+            refresh: Revalider auprès du serveur les dictionnaires déjà présents
+            build_dawg: Construire le graphe de mots de chaque langue
+            grids_per_level: Nombre de grilles à pré-générer par niveau (0 = aucune)
+            max_level: Dernier niveau pré-généré
+            first_seed: Premier seed pré-généré (les suivants sont consécutifs)
+            workers: Nombre de processus pour générer les grilles (None = un seul)
+        """
+        self.languages = languages
+        self.refresh = refresh
+        self.build_dawg = build_dawg
+        self.grids_per_level = grids_per_level
+        self.max_level = max_level
+        self.first_seed = first_seed
+        self.workers = workers
+        self.word_gen = WordGenerator(read_only=False)
+        self.grid_cache = GridCache(os.path.join(WordGenerator.DICT_CACHE_DIR, GRID_CACHE_FILE), read_only=False)
+        self._last_report: Dict[str, str] = {}
+    
+    def _on_progress(self, lang: str, status: str, done: int, total: Optional[int]):
+        """Affiche la progression (une ligne par changement d'état)."""
+        if self._last_report.get(lang) == status:
+            return
+        self._last_report[lang] = status
+        size = f" ({total // 1024} Ko)" if total else ""
+        print(f"   [{lang}] {status}{size}")
+    
+    def run(self) -> Dict:
+        """
+        Exécute toutes les étapes et retourne le manifeste écrit.
+        """
+        start = time.time()
+        self.word_gen.set_progress_callback(self._on_progress)
+        
+        print(f"⏳ Dictionnaires: {', '.join(self.languages)}")
+        statuses = self.word_gen.fetcher.fetch_all(self.languages, revalidate=self.refresh)
+        
+        languages = {}
+        for lang in self.languages:
+            languages[lang] = self._build_language(lang, statuses.get(lang))
+        
+        manifest = {
+            'created': datetime.now().isoformat(),
+            'languages': languages,
+            'grid_generator_version': GridGenerator.VERSION,
+            'grid_cache': GRID_CACHE_FILE,
+        }
+        self.grid_cache.close()
+        path = os.path.join(WordGenerator.DICT_CACHE_DIR, WordGenerator.MANIFEST_FILE)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+        
+        print(f"✓ Cache prêt en {time.time() - start:.1f} s ({path})")
+        return manifest
+    
+    def _build_language(self, lang: str, status: Optional[str]) -> Dict:
+        """Prépare les fichiers d'une langue et retourne son entrée du manifeste."""
+        if status == DictionaryFetcher.FAILED:
+            print(f"⚠ [{lang}] dictionnaire indisponible, mots de secours utilisés")
+        
+        index = self.word_gen.get_index(lang)
+        entry = {
+            'words': len(index),
+            'version': index.version,
+            'dictionary': os.path.basename(self.word_gen._get_compiled_path(lang)),
+        }
+        
+        if self.build_dawg:
+            dawg = self.word_gen.get_dawg(lang)
+            entry['dawg'] = os.path.basename(self.word_gen._get_dawg_path(lang))
+            entry['dawg_nodes'] = dawg.node_count
+            print(f"✓ [{lang}] graphe de mots: {dawg.node_count} nœuds")
+        
+        if self.grids_per_level > 0:
+            entry['grids'] = self._pregenerate_grids(index)
+        
+        return entry
+    
+    def _pregenerate_grids(self, index) -> Dict:
+        """Pré-génère les grilles de chaque niveau pour une plage de seeds."""
+        seeds = range(self.first_seed, self.first_seed + self.grids_per_level)
+        for level in range(1, self.max_level + 1):
+            grids = {}
+            for seed, grid, words in generate_many(seeds, self.workers, level=level, index=index):
+                grids[seed] = (grid, words)
+            self.grid_cache.put_many(index.language, level, index.version, GridGenerator.VERSION, grids,
+                                     pregenerated=True)
+            print(f"✓ [{index.language}] niveau {level}: {len(grids)} grilles")
+        
+        return {'levels': [1, self.max_level], 'seeds': [seeds.start, seeds.stop - 1]}
+    
+
+def report_grid_statistics(languages: List[str], levels: range, seeds: range,
+                           solver: Optional[bool] = None) -> Dict[str, Dict[int, Dict]]:
+    """
+    Génère des grilles et affiche, par niveau, le taux de réussite et le temps de génération.
+    
+    Args:
+        languages: Langues à mesurer
+        levels: Niveaux à mesurer
+        seeds: Seeds utilisés pour chaque niveau
+        solver: Forcer (True) ou désactiver (False) le solveur ; None = réglage du niveau
+    
+    Returns:
+        Statistiques par langue puis par niveau
+    """
+    word_gen = WordGenerator()
+    report = {}
+    for lang in languages:
+        index = word_gen.get_index(lang)
+        report[lang] = {}
+        print(f"\n[{lang}] niveau  taille  mots  complètes  moyenne   max      placements  retours  qualité")
+        for level_number in levels:
+            config = GameLogic.level_grid_config(GameLogic.generate_level(level_number))
+            if solver is not None:
+                config.solver = solver
+            
+            complete = 0
+            times = []
+            nodes = backtracks = 0
+            quality = 0.0
+            for seed in seeds:
+                generator = GridGenerator(seed)
+                words = GameLogic.select_level_words(index, seed, level_number, config)
+                generator.generate_grid(config, words)
+                complete += generator.stats.complete
+                times.append(generator.stats.time_ms)
+                nodes += generator.stats.nodes
+                backtracks += generator.stats.backtracks
+                quality += generator.stats.quality
+            
+            entry = {
+                'solver': config.solver,
+                'success_rate': complete / len(seeds),
+                'mean_ms': sum(times) / len(times),
+                'max_ms': max(times),
+                'mean_nodes': nodes / len(seeds),
+                'mean_backtracks': backtracks / len(seeds),
+                'mean_quality': quality / len(seeds),
+            }
+            report[lang][level_number] = entry
+            print(f"     {level_number:>6}  {config.size:>2}×{config.size:<3} {config.num_words:>4}  "
+                  f"{entry['success_rate']:>8.0%}  {entry['mean_ms']:>6.1f} ms {entry['max_ms']:>6.1f} ms  "
+                  f"{entry['mean_nodes']:>10.1f}  {entry['mean_backtracks']:>7.2f}  {entry['mean_quality']:>7.2f}"
+                  + ("  (solveur)" if config.solver else ""))
+    
+    return report
+    
+
+def build_seed_catalog(languages: List[str], levels: range, seeds: range,
+                       workers: Optional[int] = None) -> Dict[str, Dict[int, Dict]]:
+    """
+    Génère une plage de seeds par niveau et enregistre la note de chaque grille
+    dans le catalogue des meilleurs seeds.
+    
+    Args:
+        languages: Langues à cataloguer
+        levels: Niveaux à cataloguer
+        seeds: Seeds essayés pour chaque niveau
+        workers: Nombre de processus pour générer les grilles (None = un seul)
+    
+    Returns:
+        Résumé du catalogue par langue puis par niveau
+    """
+    word_gen = WordGenerator()
+    catalog = SeedCatalog(os.path.join(WordGenerator.DICT_CACHE_DIR, SEED_CATALOG_FILE), read_only=False)
+    report = {}
+    for lang in languages:
+        index = word_gen.get_index(lang)
+        report[lang] = {}
+        print(f"\n[{lang}] niveau  seeds  complètes  moyenne  meilleure  retenus")
+        for level_number in levels:
+            scores = []
+            for seed, _, _, stats in generate_many(seeds, workers, level=level_number, index=index,
+                                                   with_stats=True):
+                scores.append((seed, stats.quality, stats.complete))
+            catalog.record(lang, level_number, index.version, GridGenerator.VERSION, scores)
+            
+            entry = catalog.summary(lang, level_number, index.version, GridGenerator.VERSION)
+            entry['excellent'] = len(catalog.excellent_seeds(lang, level_number, index.version,
+                                                             GridGenerator.VERSION))
+            report[lang][level_number] = entry
+            print(f"     {level_number:>6}  {entry['seeds']:>5}  {entry['complete_rate']:>8.0%}  "
+                  f"{entry['mean_quality']:>7.2f}  {entry['best_quality']:>9.2f}  {entry['excellent']:>7}")
+    
+    catalog.close()
+    return report
+    
+
+def main(argv: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(
+        prog='python -m src.word_generator',
+        description="Prépare le cache des dictionnaires et des grilles."
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    build = subparsers.add_parser('build', help="télécharger, compiler et indexer les dictionnaires")
+    build.add_argument('--languages', nargs='+', default=sorted(WordGenerator.DICT_URLS),
+                       help="langues à préparer (défaut: toutes)")
+    build.add_argument('--cache-dir', default=WordGenerator.DICT_CACHE_DIR,
+                       help="dossier du cache (défaut: %(default)s)")
+    build.add_argument('--refresh', action='store_true',
+                       help="revalider les dictionnaires déjà présents auprès du serveur")
+    build.add_argument('--no-dawg', action='store_true',
+                       help="ne pas construire les graphes de mots")
+    build.add_argument('--grids', type=int, default=0, metavar='N',
+                       help="nombre de grilles à pré-générer par niveau (défaut: 0)")
+    build.add_argument('--max-level', type=int, default=5,
+                       help="dernier niveau pré-généré (défaut: %(default)s)")
+    build.add_argument('--first-seed', type=int, default=1000,
+                       help="premier seed pré-généré (défaut: %(default)s)")
+    build.add_argument('--workers', type=int, default=None, metavar='N',
+                       help="processus utilisés pour générer les grilles (défaut: un seul)")
+    
+    stats = subparsers.add_parser('stats', help="mesurer la génération des grilles niveau par niveau")
+    stats.add_argument('--languages', nargs='+', default=['fr'],
+                       help="langues à mesurer (défaut: %(default)s)")
+    stats.add_argument('--cache-dir', default=WordGenerator.DICT_CACHE_DIR,
+                       help="dossier du cache (défaut: %(default)s)")
+    stats.add_argument('--levels', nargs=2, type=int, default=[1, 10], metavar=('PREMIER', 'DERNIER'),
+                       help="niveaux mesurés (défaut: 1 10)")
+    stats.add_argument('--seeds', type=int, default=20, metavar='N',
+                       help="nombre de grilles par niveau (défaut: %(default)s)")
+    stats.add_argument('--first-seed', type=int, default=1000,
+                       help="premier seed (défaut: %(default)s)")
+    stats.add_argument('--solver', choices=['auto', 'on', 'off'], default='auto',
+                       help="solveur avec retour arrière (défaut: réglage de chaque niveau)")
+    
+    catalog = subparsers.add_parser('catalog', help="noter des plages de seeds et garder les meilleurs par niveau")
+    catalog.add_argument('--languages', nargs='+', default=['fr'],
+                         help="langues à cataloguer (défaut: %(default)s)")
+    catalog.add_argument('--cache-dir', default=WordGenerator.DICT_CACHE_DIR,
+                         help="dossier du cache (défaut: %(default)s)")
+    catalog.add_argument('--levels', nargs=2, type=int, default=[1, 10], metavar=('PREMIER', 'DERNIER'),
+                         help="niveaux catalogués (défaut: 1 10)")
+    catalog.add_argument('--seeds', type=int, default=500, metavar='N',
+                         help="nombre de seeds essayés par niveau (défaut: %(default)s)")
+    catalog.add_argument('--first-seed', type=int, default=1000,
+                         help="premier seed (défaut: %(default)s)")
+    catalog.add_argument('--workers', type=int, default=None, metavar='N',
+                         help="processus utilisés pour générer les grilles (défaut: un seul)")
+    
+    args = parser.parse_args(argv)
+    if args.command not in ('build', 'stats', 'catalog'):
+        parser.print_help()
+        sys.exit(1)
+    
+    WordGenerator.DICT_CACHE_DIR = args.cache_dir
+    if args.command == 'stats':
+        report_grid_statistics(
+            languages=args.languages,
+            levels=range(args.levels[0], args.levels[1] + 1),
+            seeds=range(args.first_seed, args.first_seed + args.seeds),
+            solver={'auto': None, 'on': True, 'off': False}[args.solver]
+        )
+        return
+    if args.command == 'catalog':
+        build_seed_catalog(
+            languages=args.languages,
+            levels=range(args.levels[0], args.levels[1] + 1),
+            seeds=range(args.first_seed, args.first_seed + args.seeds),
+            workers=args.workers
+        )
+        return
+    
+    if not os.path.exists(args.cache_dir):
+        os.makedirs(args.cache_dir)
+    
+    CacheBuilder(
+        languages=args.languages,
+        refresh=args.refresh,
+        build_dawg=not args.no_dawg,
+        grids_per_level=args.grids,
+        max_level=args.max_level,
+        first_seed=args.first_seed,
+        workers=args.workers
+    ).run()
+    
+
+if __name__ == "__main__":
+    main()
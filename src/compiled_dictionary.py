@@ -0,0 +1,545 @@
+"""
+Format binaire compilé pour les dictionnaires de mots.
+Les mots sont triés par longueur puis par ordre alphabétique, rangés dans un
+tampon contigu et accompagnés d'une table d'offsets. Le fichier est ouvert via
+`mmap` : le chargement est quasi instantané et les pages sont partagées entre
+processus par le cache du système.
+
+Structure du fichier (entiers little-endian) :
+    en-tête      : magic, version du format, longueur max, nombre de mots,
+                   taille des données, empreinte (16 octets, calculée sur les
+                   buckets, les offsets et les données)
+    buckets      : (longueur max + 2) uint32, index du premier mot de chaque longueur
+    offsets      : (nombre de mots + 1) uint32, position de chaque mot dans les données
+    données      : mots encodés en UTF-8, concaténés sans séparateur
+"""
+import codecs
+import contextlib
+import hashlib
+import heapq
+import mmap
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set
+from src.prng import PCG32
+
+
+MAGIC = b'PWXD'
+FORMAT_VERSION = 1
+# Version de l'ordre canonique des mots et de l'algorithme de tirage par seed.
+# À incrémenter si l'un des deux change : les seeds ne redonneraient plus les mêmes mots.
+ORDERING_VERSION = 3
+HEADER = struct.Struct('<4sHHII16s')
+
+
+class CompiledDictionary:
+    """Dictionnaire en lecture seule, trié et indexé par longueur de mot."""
+    
+    def __init__(self, buffer, language: str = '', mapped: Optional[mmap.mmap] = None):
+        """
+        Initialise le dictionnaire depuis un tampon compilé.
+        
+        Args:
+            buffer: Contenu compilé (bytes, bytearray ou mmap)
+            language: Code de langue associé
+            mapped: Objet mmap à fermer avec le dictionnaire
+        """
+        self.language = language
+        self.path: Optional[str] = None  # Fichier d'origine (ouvert via `open`)
+        self._mapped = mapped
+        self._view = memoryview(buffer)
+        
+        if len(self._view) < HEADER.size:
+            raise ValueError("Dictionnaire compilé tronqué")
+        
+        magic, version, max_length, word_count, data_size, digest = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError("Fichier de dictionnaire compilé invalide")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Version de format non supportée: {version}")
+        
+        self.max_length = max_length
+        self.word_count = word_count
+        self.digest = digest
+        
+        buckets_start = HEADER.size
+        offsets_start = buckets_start + 4 * (max_length + 2)
+        data_start = offsets_start + 4 * (word_count + 1)
+        if len(self._view) < data_start + data_size:
+            raise ValueError("Dictionnaire compilé tronqué")
+        
+        self._buckets = self._uint32_view(buckets_start, max_length + 2)
+        self._offsets = self._uint32_view(offsets_start, word_count + 1)
+        self._data = self._view[data_start:data_start + data_size]
+    
+    def _uint32_view(self, start: int, count: int):
+        """Retourne une vue uint32 sur une zone du tampon (copie sur big-endian)."""
+        raw = self._view[start:start + 4 * count]
+        if sys.byteorder == 'little':
+            return raw.cast('I')
+        values = array('I', raw.tobytes())
+        values.byteswap()
+        return values
+    
+    @classmethod
+    def open(cls, path: str, language: str = '') -> 'CompiledDictionary':
+        """
+        Ouvre un dictionnaire compilé via mmap.
+        
+        Args:
+            path: Chemin du fichier compilé
+            language: Code de langue associé
+        
+        Returns:
+            Le dictionnaire ouvert
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            dictionary = cls(mapped, language, mapped)
+        except ValueError:
+            mapped.close()
+            raise
+        dictionary.path = path
+        return dictionary
+    
+    @classmethod
+    def from_words(cls, words: Iterable[str], language: str = '') -> 'CompiledDictionary':
+        """Construit un dictionnaire en mémoire (utilisé pour les mots de secours)."""
+        return cls(build_bytes(words), language)
+    
+    def close(self):
+        """Libère les vues et ferme le mmap sous-jacent."""
+        for view in (self._data, self._offsets, self._buckets):
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+    
+    def tobytes(self) -> bytes:
+        """Retourne le contenu compilé (pour l'envoyer à un autre processus)."""
+        return self._view.tobytes()
+    
+    @property
+    def version(self) -> str:
+        """Empreinte hexadécimale du contenu (change si la liste de mots change)."""
+        return self.digest.hex()
+    
+    def __len__(self) -> int:
+        return self.word_count
+    
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.word_count
+        if not 0 <= index < self.word_count:
+            raise IndexError("Index de mot hors limites")
+        return self._data[self._offsets[index]:self._offsets[index + 1]].tobytes().decode('utf-8')
+    
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.word_count):
+            yield self[index]
+    
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or len(word) > self.max_length:
+            return False
+        bucket = self.bucket_range(len(word), len(word))
+        index = bisect_left(_WordSequence(self, bucket), word)
+        return index < len(bucket) and self[bucket[index]] == word
+    
+    def bucket_range(self, min_length: int, max_length: int) -> range:
+        """
+        Retourne la plage d'index des mots dont la longueur est dans [min, max].
+        
+        Les mots étant triés par longueur, cette plage est toujours contiguë.
+        """
+        min_length = max(0, min_length)
+        max_length = min(self.max_length, max_length)
+        if min_length > max_length:
+            return range(0)
+        return range(self._buckets[min_length], self._buckets[max_length + 1])
+    
+    def count_between(self, min_length: int, max_length: int) -> int:
+        """Retourne le nombre de mots dont la longueur est dans [min, max]."""
+        return len(self.bucket_range(min_length, max_length))
+    
+    def sample(self, count: int, min_length: int = 0, max_length: Optional[int] = None,
+               rng: Optional[PCG32] = None) -> List[str]:
+        """
+        Tire `count` mots distincts dont la longueur est dans [min, max].
+        
+        Seuls les mots tirés sont décodés : le coût est en O(count), quelle que
+        soit la taille du dictionnaire.
+        
+        Args:
+            count: Nombre de mots voulus (réduit s'il n'y a pas assez de mots)
+            min_length: Longueur minimale
+            max_length: Longueur maximale (None = aucune limite)
+            rng: Générateur aléatoire à seed (module `random` par défaut, non reproductible)
+        
+        Returns:
+            Liste de mots dans l'ordre du tirage
+        """
+        if max_length is None:
+            max_length = self.max_length
+        indexes = self.bucket_range(min_length, max_length)
+        picked = (rng or random).sample(indexes, min(count, len(indexes)))
+        return [self[index] for index in picked]
+    
+    def select_words(self, seed: int, level: int, count: int, min_length: int = 3,
+                     max_length: Optional[int] = None) -> List[str]:
+        """
+        Tire les mots d'un niveau de manière déterministe.
+        
+        Le résultat ne dépend que de (seed, niveau, langue) et du contenu du
+        dictionnaire : il est identique d'un processus ou d'un redémarrage à
+        l'autre, ce qui permet de l'utiliser comme clé de cache. Un mot
+        contenu dans un mot déjà tiré (ou le contenant), dans un sens ou dans
+        l'autre, est rejeté et remplacé par un nouveau tirage : il
+        apparaîtrait deux fois dans la grille.
+        
+        Args:
+            seed: Seed de la partie
+            level: Numéro du niveau
+            count: Nombre de mots voulus
+            min_length: Longueur minimale
+            max_length: Longueur maximale (None = aucune limite)
+        
+        Returns:
+            Liste de mots dans l'ordre du tirage
+        """
+        if count <= 0:
+            return []
+        if max_length is None:
+            max_length = self.max_length
+        min_length = max(1, min_length)
+        rng = PCG32(selection_seed(seed, level, self.language))
+        selected: List[str] = []
+        taken = set()  # Mots tirés, dans les deux sens
+        inner = set()  # Parties des mots tirés (assez longues pour être des mots), dans les deux sens
+        for index in rng.iter_sample(self.bucket_range(min_length, max_length)):
+            word = self[index]
+            parts = _word_parts(word, min_length)
+            if word in inner or not taken.isdisjoint(parts):
+                continue
+            selected.append(word)
+            if len(selected) == count:
+                break
+            taken.update((word, word[::-1]))
+            inner.update(parts, _word_parts(word[::-1], min_length))
+        return selected
+    
+
+def _word_parts(word: str, min_length: int) -> Set[str]:
+    """Retourne les sous-chaînes d'un mot d'au moins `min_length` lettres (le mot compris)."""
+    return {word[start:start + length] for length in range(min_length, len(word) + 1)
+            for start in range(len(word) - length + 1)}
+    
+
+class _WordSequence:
+    """Séquence paresseuse des mots d'une plage, pour la recherche dichotomique."""
+    
+    def __init__(self, dictionary: CompiledDictionary, indexes: range):
+        self.dictionary = dictionary
+        self.indexes = indexes
+    
+    def __len__(self) -> int:
+        return len(self.indexes)
+    
+    def __getitem__(self, position: int) -> str:
+        return self.dictionary[self.indexes[position]]
+    
+
+def selection_seed(seed: int, level: int, language: str) -> int:
+    """
+    Dérive le seed du tirage des mots à partir de (seed, niveau, langue).
+    
+    Le hachage SHA-256 est indépendant du processus (contrairement à `hash()`,
+    randomisé pour les chaînes) et de la version de Python.
+    """
+    key = f"{ORDERING_VERSION}:{language}:{level}:{seed}".encode('utf-8')
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+    
+
+def canonical_order(words: Iterable[str]) -> List[str]:
+    """Retourne les mots dédoublonnés dans l'ordre canonique (longueur, puis alphabétique)."""
+    return sorted(set(words), key=lambda w: (len(w), w))
+    
+
+def build_bytes(words: Iterable[str]) -> bytes:
+    """
+    Compile une liste de mots au format binaire.
+    
+    Args:
+        words: Mots à compiler (déjà normalisés en majuscules)
+    
+    Returns:
+        Contenu compilé
+    """
+    ordered = canonical_order(w for w in words if w)
+    max_length = len(ordered[-1]) if ordered else 0
+    
+    buckets = array('I', [0] * (max_length + 2))
+    offsets = array('I', [0] * (len(ordered) + 1))
+    data = bytearray()
+    
+    length = 0
+    for index, word in enumerate(ordered):
+        while length < len(word):
+            length += 1
+            buckets[length] = index
+        offsets[index] = len(data)
+        data += word.encode('utf-8')
+    offsets[len(ordered)] = len(data)
+    while length < max_length + 1:
+        length += 1
+        buckets[length] = len(ordered)
+    
+    if sys.byteorder != 'little':
+        buckets.byteswap()
+        offsets.byteswap()
+    
+    digest = _content_digest(buckets.tobytes(), hashlib.sha256(offsets.tobytes()), hashlib.sha256(data))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, max_length, len(ordered), len(data), digest)
+    return header + buckets.tobytes() + offsets.tobytes() + bytes(data)
+    
+
+class DictionaryBuilder:
+    """
+    Construit un dictionnaire compilé en flux, à mémoire bornée.
+    
+    Les mots sont reçus par morceaux (`feed`) et triés par fusion externe :
+    des séquences triées d'au plus `run_size` mots sont écrites sur disque par
+    longueur, puis fusionnées au moment de `finish`. La mémoire utilisée ne
+    dépend donc pas de la taille du dictionnaire.
+    """
+    
+    RUN_SIZE = 50000
+    COPY_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, path: str, min_length: int = 1, max_length: Optional[int] = None,
+                 alphabetic_only: bool = False, run_size: Optional[int] = None):
+        """
+        Initialise le constructeur.
+        
+        Args:
+            path: Chemin du dictionnaire compilé à produire
+            min_length: Longueur minimale des mots retenus
+            max_length: Longueur maximale des mots retenus (None = aucune limite)
+            alphabetic_only: Ne garder que les mots alphabétiques
+            run_size: Nombre de mots gardés en mémoire avant écriture sur disque
+        """
+        self.path = path
+        self.min_length = min_length
+        self.max_length = max_length
+        self.alphabetic_only = alphabetic_only
+        self.run_size = run_size or self.RUN_SIZE
+        self.word_count = 0
+        
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._pending = ''
+        self._buffers: Dict[int, List[str]] = {}
+        self._buffered = 0
+        self._runs: Dict[int, List[str]] = {}  # {longueur: [fichiers de séquences triées]}
+        self._tmp_dir = tempfile.mkdtemp(prefix='.build-', dir=os.path.dirname(os.path.abspath(path)))
+    
+    def __enter__(self) -> 'DictionaryBuilder':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.abort()
+    
+    def feed(self, chunk: bytes):
+        """Ajoute un morceau de texte brut (UTF-8, un mot par ligne)."""
+        text = self._pending + self._decoder.decode(chunk)
+        lines = text.split('\n')
+        self._pending = lines.pop()
+        self.add_words(lines)
+    
+    def add_words(self, words: Iterable[str]):
+        """Ajoute des mots déjà découpés (normalisés et filtrés ici)."""
+        for line in words:
+            word = line.strip().upper()
+            if len(word) < self.min_length or not word:
+                continue
+            if self.max_length is not None and len(word) > self.max_length:
+                continue
+            if self.alphabetic_only and not word.isalpha():
+                continue
+            
+            self._buffers.setdefault(len(word), []).append(word)
+            self._buffered += 1
+            if self._buffered >= self.run_size:
+                self._flush_runs()
+    
+    def _flush_runs(self):
+        """Écrit les mots en mémoire sous forme de séquences triées, une par longueur."""
+        for length, words in self._buffers.items():
+            runs = self._runs.setdefault(length, [])
+            run_path = os.path.join(self._tmp_dir, f'run-{length}-{len(runs)}.txt')
+            with open(run_path, 'w', encoding='utf-8') as f:
+                for word in sorted(set(words)):
+                    f.write(word + '\n')
+            runs.append(run_path)
+        self._buffers = {}
+        self._buffered = 0
+    
+    def _merge_runs(self, length: int, stack: contextlib.ExitStack) -> Iterator[str]:
+        """Fusionne les séquences triées d'une longueur en supprimant les doublons."""
+        files = [stack.enter_context(open(run_path, 'r', encoding='utf-8'))
+                 for run_path in self._runs[length]]
+        previous = None
+        for line in heapq.merge(*files):
+            word = line.rstrip('\n')
+            if word != previous:
+                previous = word
+                yield word
+    
+    def finish(self) -> int:
+        """
+        Termine la construction et écrit le fichier compilé (atomiquement).
+        
+        Returns:
+            Nombre de mots du dictionnaire
+        """
+        self._pending += self._decoder.decode(b'', final=True)
+        self.add_words([self._pending])
+        self._pending = ''
+        self._flush_runs()
+        
+        lengths = sorted(self._runs)
+        max_length = lengths[-1] if lengths else 0
+        buckets = array('I', [0] * (max_length + 2))
+        offsets_digest = hashlib.sha256()
+        data_digest = hashlib.sha256()
+        offsets_path = os.path.join(self._tmp_dir, 'offsets.bin')
+        data_path = os.path.join(self._tmp_dir, 'data.bin')
+        count = 0
+        position = 0
+        
+        with open(offsets_path, 'wb') as offsets_file, open(data_path, 'wb') as data_file:
+            offsets = array('I')
+            length = 0
+            for word_length in lengths:
+                while length < word_length:
+                    length += 1
+                    buckets[length] = count
+                with contextlib.ExitStack() as stack:
+                    for word in self._merge_runs(word_length, stack):
+                        encoded = word.encode('utf-8')
+                        offsets.append(position)
+                        data_file.write(encoded)
+                        data_digest.update(encoded)
+                        position += len(encoded)
+                        count += 1
+                        if len(offsets) >= self.run_size:
+                            offsets_digest.update(_write_uint32(offsets_file, offsets))
+                            offsets = array('I')
+            offsets.append(position)
+            offsets_digest.update(_write_uint32(offsets_file, offsets))
+            while length < max_length + 1:
+                length += 1
+                buckets[length] = count
+        
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            buckets_bytes = _uint32_bytes(buckets)
+            digest = _content_digest(buckets_bytes, offsets_digest, data_digest)
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, max_length, count, position, digest))
+            f.write(buckets_bytes)
+            for part_path in (offsets_path, data_path):
+                with open(part_path, 'rb') as part:
+                    shutil.copyfileobj(part, f, self.COPY_CHUNK_SIZE)
+        os.replace(tmp_path, self.path)
+        
+        self.word_count = count
+        self.abort()
+        return count
+    
+    def abort(self):
+        """Supprime les fichiers temporaires."""
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+    
+
+def _uint32_bytes(values: array) -> bytes:
+    """Encode un tableau uint32 en little-endian."""
+    if sys.byteorder != 'little':
+        values = array('I', values)
+        values.byteswap()
+    return values.tobytes()
+    
+
+def _write_uint32(f, values: array) -> bytes:
+    """Écrit un tableau uint32 en little-endian et retourne les octets écrits."""
+    encoded = _uint32_bytes(values)
+    f.write(encoded)
+    return encoded
+    
+
+def _content_digest(buckets: bytes, offsets_digest, data_digest) -> bytes:
+    """
+    Calcule l'empreinte d'un dictionnaire compilé.
+    
+    Les offsets et les buckets y figurent : sans eux, {"ABC"} et {"A", "BC"}
+    (mêmes octets de données) auraient la même empreinte.
+    
+    Args:
+        buckets: Table des buckets encodée en little-endian
+        offsets_digest: Hash SHA-256 des offsets encodés en little-endian
+        data_digest: Hash SHA-256 des données
+    
+    Returns:
+        Empreinte sur 16 octets
+    """
+    digest = hashlib.sha256(buckets)
+    digest.update(offsets_digest.digest())
+    digest.update(data_digest.digest())
+    return digest.digest()[:16]
+    
+
+def write_compiled(words: Iterable[str], path: str) -> int:
+    """Écrit un dictionnaire compilé de manière atomique (fichier temporaire + renommage)."""
+    with DictionaryBuilder(path) as builder:
+        builder.add_words(words)
+        return builder.finish()
+    
+
+def compile_stream(stream: BinaryIO, path: str, chunk_size: int = 64 * 1024,
+                   progress: Optional[Callable[[int], None]] = None, **filters) -> int:
+    """
+    Compile un flux binaire (fichier ou réponse HTTP) au fil de la lecture.
+    
+    Args:
+        stream: Flux à lire (méthode `read(n)`)
+        path: Chemin du dictionnaire compilé à produire
+        chunk_size: Taille des morceaux lus
+        progress: Fonction appelée avec le nombre d'octets lus jusqu'ici
+        **filters: Filtres transmis à `DictionaryBuilder`
+    
+    Returns:
+        Nombre de mots du dictionnaire
+    """
+    with DictionaryBuilder(path, **filters) as builder:
+        received = 0
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            builder.feed(chunk)
+            received += len(chunk)
+            if progress:
+                progress(received)
+        return builder.finish()
+    
+
+def compile_text_file(text_path: str, path: str) -> int:
+    """Convertit un cache texte (un mot par ligne) en dictionnaire compilé."""
+    with open(text_path, 'rb') as f:
+        return compile_stream(f, path)
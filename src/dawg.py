@@ -0,0 +1,284 @@
+"""
+Graphe acyclique de mots (DAWG) compact pour les requêtes d'appartenance et de préfixe.
+Le graphe est minimisé (préfixes et suffixes communs partagés) puis aplati en
+tableaux d'entiers : il tient en quelques Mo là où un `set` Python de 600 000
+mots en occupe une soixantaine, et s'ouvre via `mmap` comme le dictionnaire compilé.
+
+Structure du fichier (entiers little-endian) :
+    en-tête      : magic, version du format, nombre de nœuds, nombre d'arcs,
+                   nombre de mots, empreinte du dictionnaire source (16 octets)
+    nœuds        : (nombre de nœuds + 1) uint32, index du premier arc de chaque nœud
+    arcs         : lettres (uint32, points de code) puis cibles (uint32)
+    terminaux    : un octet par nœud (1 si un mot se termine sur ce nœud)
+"""
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+MAGIC = b'PWXG'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHIII16s')
+
+
+class _BuildNode:
+    """Nœud utilisé pendant la construction (algorithme incrémental de Daciuk)."""
+    
+    __slots__ = ('number', 'final', 'edges')
+    
+    def __init__(self, number: int):
+        self.number = number
+        self.final = False
+        self.edges: Dict[str, '_BuildNode'] = {}
+    
+    def signature(self) -> Tuple:
+        return (self.final, tuple((letter, child.number) for letter, child in sorted(self.edges.items())))
+    
+
+class Dawg:
+    """DAWG en lecture seule : appartenance et préfixes en O(longueur du mot)."""
+    
+    def __init__(self, buffer, mapped: Optional[mmap.mmap] = None):
+        """
+        Initialise le graphe depuis un tampon compilé.
+        
+        Args:
+            buffer: Contenu compilé (bytes, bytearray ou mmap)
+            mapped: Objet mmap à fermer avec le graphe
+        """
+        self._mapped = mapped
+        self._view = memoryview(buffer)
+        
+        if len(self._view) < HEADER.size:
+            raise ValueError("DAWG tronqué")
+        
+        magic, version, _, node_count, edge_count, word_count, source_digest = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError("Fichier DAWG invalide")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Version de format non supportée: {version}")
+        
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self.word_count = word_count
+        self.source_digest = source_digest
+        
+        nodes_start = HEADER.size
+        labels_start = nodes_start + 4 * (node_count + 1)
+        targets_start = labels_start + 4 * edge_count
+        finals_start = targets_start + 4 * edge_count
+        if len(self._view) < finals_start + node_count:
+            raise ValueError("DAWG tronqué")
+        
+        self._nodes = self._uint32_view(nodes_start, node_count + 1)
+        self._labels = self._uint32_view(labels_start, edge_count)
+        self._targets = self._uint32_view(targets_start, edge_count)
+        self._finals = self._view[finals_start:finals_start + node_count]
+    
+    def _uint32_view(self, start: int, count: int):
+        """Retourne une vue uint32 sur une zone du tampon (copie sur big-endian)."""
+        raw = self._view[start:start + 4 * count]
+        if sys.byteorder == 'little':
+            return raw.cast('I')
+        values = array('I', raw.tobytes())
+        values.byteswap()
+        return values
+    
+    @classmethod
+    def open(cls, path: str) -> 'Dawg':
+        """Ouvre un DAWG compilé via mmap."""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped, mapped)
+        except ValueError:
+            mapped.close()
+            raise
+    
+    @classmethod
+    def from_words(cls, words: Iterable[str], source_digest: bytes = b'') -> 'Dawg':
+        """Construit un DAWG en mémoire à partir de mots triés."""
+        return cls(build_bytes(words, source_digest))
+    
+    def close(self):
+        """Libère les vues et ferme le mmap sous-jacent."""
+        for view in (self._finals, self._targets, self._labels, self._nodes):
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+    
+    def _child(self, node: int, letter: str) -> int:
+        """Retourne le nœud atteint depuis `node` par `letter`, ou -1."""
+        start = self._nodes[node]
+        end = self._nodes[node + 1]
+        code = ord(letter)
+        index = bisect_left(self._labels, code, start, end)
+        if index < end and self._labels[index] == code:
+            return self._targets[index]
+        return -1
+    
+    def _walk(self, text: str) -> int:
+        """Suit les lettres de `text` depuis la racine (-1 si le chemin n'existe pas)."""
+        node = 0
+        for letter in text:
+            node = self._child(node, letter)
+            if node < 0:
+                return -1
+        return node
+    
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or not self.node_count:
+            return False
+        node = self._walk(word)
+        return node >= 0 and self._finals[node] == 1
+    
+    def __len__(self) -> int:
+        return self.word_count
+    
+    def has_prefix(self, prefix: str) -> bool:
+        """Indique si au moins un mot commence par `prefix`."""
+        return self.node_count > 0 and self._walk(prefix) >= 0
+    
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """Énumère, dans l'ordre alphabétique, les mots commençant par `prefix`."""
+        node = self._walk(prefix) if self.node_count else -1
+        if node < 0:
+            return
+        stack = [(node, prefix)]
+        while stack:
+            node, text = stack.pop()
+            if self._finals[node] == 1:
+                yield text
+            start = self._nodes[node]
+            for index in range(self._nodes[node + 1] - 1, start - 1, -1):
+                stack.append((self._targets[index], text + chr(self._labels[index])))
+    
+
+def lexicographic_words(dictionary) -> Iterator[str]:
+    """
+    Parcourt un dictionnaire compilé dans l'ordre alphabétique.
+    
+    Chaque tranche de longueur est déjà triée : une fusion suffit, sans charger
+    tout le dictionnaire en mémoire.
+    """
+    buckets = [dictionary.bucket_range(length, length) for length in range(1, dictionary.max_length + 1)]
+    return heapq.merge(*((dictionary[index] for index in bucket) for bucket in buckets if bucket))
+    
+
+def build_bytes(words: Iterable[str], source_digest: bytes = b'') -> bytes:
+    """
+    Construit un DAWG minimal et l'aplatit au format binaire.
+    
+    Args:
+        words: Mots triés par ordre alphabétique (les doublons sont ignorés)
+        source_digest: Empreinte du dictionnaire source (pour détecter un DAWG périmé)
+    
+    Returns:
+        Contenu compilé
+    """
+    counter = [0]
+    
+    def new_node() -> _BuildNode:
+        counter[0] += 1
+        return _BuildNode(counter[0] - 1)
+    
+    root = new_node()
+    register: Dict[Tuple, _BuildNode] = {}
+    unchecked: List[Tuple[_BuildNode, str, _BuildNode]] = []
+    previous = ''
+    word_count = 0
+    
+    def minimize(down_to: int):
+        # Remplacer les nœuds non vérifiés par leur équivalent déjà enregistré
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            key = child.signature()
+            if key in register:
+                parent.edges[letter] = register[key]
+            else:
+                register[key] = child
+    
+    for word in words:
+        if not word or (word == previous and word_count):
+            continue
+        if word < previous:
+            raise ValueError("Les mots doivent être triés par ordre alphabétique")
+        
+        common = 0
+        for a, b in zip(word, previous):
+            if a != b:
+                break
+            common += 1
+        minimize(common)
+        
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = new_node()
+            node.edges[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        previous = word
+        word_count += 1
+    minimize(0)
+    
+    return _flatten(root, word_count, source_digest)
+    
+
+def _flatten(root: _BuildNode, word_count: int, source_digest: bytes) -> bytes:
+    """Numérote les nœuds (racine = 0) et écrit les tableaux d'arcs."""
+    order: List[_BuildNode] = []
+    numbers: Dict[int, int] = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in numbers:
+            continue
+        numbers[id(node)] = len(order)
+        order.append(node)
+        for _, child in sorted(node.edges.items(), reverse=True):
+            if id(child) not in numbers:
+                stack.append(child)
+    
+    nodes = array('I')
+    labels = array('I')
+    targets = array('I')
+    finals = bytearray()
+    for node in order:
+        nodes.append(len(labels))
+        finals.append(1 if node.final else 0)
+        for letter, child in sorted(node.edges.items()):
+            labels.append(ord(letter))
+            targets.append(numbers[id(child)])
+    nodes.append(len(labels))
+    
+    if sys.byteorder != 'little':
+        for values in (nodes, labels, targets):
+            values.byteswap()
+    
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(order), len(labels), word_count,
+                         source_digest[:16].ljust(16, b'\0'))
+    return header + nodes.tobytes() + labels.tobytes() + targets.tobytes() + bytes(finals)
+    
+
+def write_dawg(dictionary, path: str) -> int:
+    """
+    Construit le DAWG d'un dictionnaire compilé et l'écrit de manière atomique.
+    
+    Returns:
+        Nombre de nœuds du graphe
+    """
+    content = build_bytes(lexicographic_words(dictionary), dictionary.digest)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return HEADER.unpack_from(content, 0)[3]
@@ -0,0 +1,225 @@
+"""
+Téléchargement des dictionnaires en parallèle, avec reprise et revalidation.
+Chaque langue est téléchargée dans son propre thread vers un fichier `.part`
+(reprise par requête HTTP Range), puis compilée. Un fichier annexe `.meta.json`
+mémorise l'ETag, la date de modification et l'empreinte SHA-256 du contenu,
+pour rafraîchir un cache périmé sans tout retélécharger.
+"""
+import hashlib
+import json
+import os
+import ssl
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+from src.compiled_dictionary import compile_stream
+
+
+# Fonction de progression : (langue, statut, octets reçus, octets attendus ou None)
+ProgressCallback = Callable[[str, str, int, Optional[int]], None]
+
+
+class DictionaryFetcher:
+    """Télécharge et compile les dictionnaires de plusieurs langues."""
+    
+    # Statuts renvoyés par `fetch` et transmis à la fonction de progression
+    CACHED = 'cached'
+    NOT_MODIFIED = 'not_modified'
+    DOWNLOADING = 'downloading'
+    COMPILING = 'compiling'
+    DOWNLOADED = 'downloaded'
+    FAILED = 'failed'
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    # Filtrer les mots valides (3-15 lettres, alphabétiques)
+    WORD_FILTERS = {'min_length': 3, 'max_length': 15, 'alphabetic_only': True}
+    
+    def __init__(self, cache_dir: str, urls: Dict[str, str], timeout: float = 10,
+                 progress: Optional[ProgressCallback] = None):
+        """
+        Initialise le téléchargeur.
+        
+        Args:
+            cache_dir: Dossier du cache des dictionnaires
+            urls: URL du dictionnaire de chaque langue
+            timeout: Délai d'attente réseau en secondes
+            progress: Fonction de progression (appelée depuis les threads de téléchargement)
+        """
+        self.cache_dir = cache_dir
+        self.urls = urls
+        self.timeout = timeout
+        self.progress = progress
+        
+        # Contourner la vérification SSL pour les anciens systèmes
+        self._context = ssl._create_unverified_context()
+    
+    def compiled_path(self, lang: str) -> str:
+        """Retourne le chemin du dictionnaire compilé d'une langue."""
+        return os.path.join(self.cache_dir, f'{lang}_words.pwxd')
+    
+    def _part_path(self, lang: str) -> str:
+        return os.path.join(self.cache_dir, f'{lang}_words.part')
+    
+    def _meta_path(self, lang: str) -> str:
+        return os.path.join(self.cache_dir, f'{lang}_words.meta.json')
+    
+    def _load_meta(self, lang: str) -> Dict:
+        """Charge le fichier annexe d'une langue (vide s'il n'existe pas)."""
+        try:
+            with open(self._meta_path(lang), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_meta(self, lang: str, meta: Dict):
+        """Écrit le fichier annexe de manière atomique."""
+        tmp_path = self._meta_path(lang) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, self._meta_path(lang))
+    
+    def _report(self, lang: str, status: str, done: int = 0, total: Optional[int] = None):
+        if self.progress:
+            self.progress(lang, status, done, total)
+    
+    def fetch_all(self, languages: Optional[Iterable[str]] = None,
+                  revalidate: bool = False) -> Dict[str, str]:
+        """
+        Télécharge plusieurs langues en même temps.
+        
+        Args:
+            languages: Langues à télécharger (toutes par défaut)
+            revalidate: Vérifier auprès du serveur les caches déjà présents
+        
+        Returns:
+            Statut final de chaque langue
+        """
+        languages = [lang for lang in (languages or self.urls) if lang in self.urls]
+        if not languages:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(languages), thread_name_prefix='dict-fetch') as pool:
+            futures = {lang: pool.submit(self.fetch, lang, revalidate) for lang in languages}
+            return {lang: future.result() for lang, future in futures.items()}
+    
+    def fetch(self, lang: str, revalidate: bool = False) -> str:
+        """
+        Télécharge et compile le dictionnaire d'une langue.
+        
+        Args:
+            lang: Code de langue
+            revalidate: Vérifier auprès du serveur un cache déjà présent
+        
+        Returns:
+            Statut final (CACHED, NOT_MODIFIED, DOWNLOADED ou FAILED)
+        """
+        if os.path.exists(self.compiled_path(lang)) and not revalidate:
+            self._report(lang, self.CACHED)
+            return self.CACHED
+        
+        try:
+            return self._fetch(lang)
+        except Exception as e:
+            print(f"⚠ Erreur téléchargement {lang}: {e}")
+            self._report(lang, self.FAILED)
+            return self.FAILED
+    
+    def _fetch(self, lang: str, allow_resume: bool = True) -> str:
+        url = self.urls[lang]
+        compiled_path = self.compiled_path(lang)
+        part_path = self._part_path(lang)
+        meta = self._load_meta(lang)
+        
+        headers = {}
+        offset = 0
+        if allow_resume and os.path.exists(part_path) and meta.get('partial_validator'):
+            # Reprendre un téléchargement interrompu
+            offset = os.path.getsize(part_path)
+            headers['Range'] = f'bytes={offset}-'
+            headers['If-Range'] = meta['partial_validator']
+        elif os.path.exists(compiled_path):
+            # Requête conditionnelle : le serveur répond 304 si rien n'a changé
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            response = urllib.request.urlopen(request, context=self._context, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                self._report(lang, self.NOT_MODIFIED)
+                return self.NOT_MODIFIED
+            if e.code == 416 and offset:
+                # Fichier partiel invalide : recommencer depuis le début
+                os.remove(part_path)
+                return self._fetch(lang, allow_resume=False)
+            raise
+        
+        with response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            
+            if response.status == 206:
+                mode, done = 'ab', offset
+            else:
+                mode, done = 'wb', 0
+            total = _expected_size(response.headers, done)
+            
+            # Mémoriser le validateur pour une éventuelle reprise (ETag fort uniquement)
+            meta['partial_validator'] = etag if etag and not etag.startswith('W/') else last_modified
+            self._save_meta(lang, meta)
+            
+            with open(part_path, mode) as f:
+                while True:
+                    chunk = response.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    self._report(lang, self.DOWNLOADING, done, total)
+        
+        if total is not None and done < total:
+            raise IOError(f"téléchargement incomplet ({done}/{total} octets)")
+        
+        checksum = _file_sha256(part_path)
+        if checksum != meta.get('sha256') or not os.path.exists(compiled_path):
+            self._report(lang, self.COMPILING, done, total)
+            with open(part_path, 'rb') as f:
+                compile_stream(f, compiled_path, **self.WORD_FILTERS)
+        os.remove(part_path)
+        
+        self._save_meta(lang, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'sha256': checksum,
+            'size': done
+        })
+        self._report(lang, self.DOWNLOADED, done, total)
+        return self.DOWNLOADED
+    
+
+def _expected_size(headers, offset: int) -> Optional[int]:
+    """Retourne la taille totale attendue d'après Content-Range ou Content-Length."""
+    content_range = headers.get('Content-Range')
+    if content_range and '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        if total.isdigit():
+            return int(total)
+    length = headers.get('Content-Length')
+    if length and length.isdigit():
+        return offset + int(length)
+    return None
+    
+
+def _file_sha256(path: str) -> str:
+    """Calcule l'empreinte SHA-256 d'un fichier par morceaux."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DictionaryFetcher.CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -33,6 +33,9 @@ class Language:
             'minutes': 'minutes',
             'words': 'mots',
             'back': 'Retour',
+            'marathon': 'Marathon',
+            'marathon_grid': 'Marathon {}×{}',
+            'marathon_dialog': 'Taille de la grille ({} à {}, multiple de {}):\n\nDes centaines de mots à trouver!',
             
             # Jeu
             'time_remaining': 'Temps restant',
@@ -57,6 +60,9 @@ class Language:
             'error': 'Erreur',
             'success': 'Succès',
             'info': 'Info',
+            'loading_dictionary': 'Chargement du dictionnaire...',
+            'downloading_dictionary': 'Téléchargement du dictionnaire ({}%)...',
+            'generating_grid': 'Génération de la grille...',
             
             # Fin de jeu
             'level_complete': 'Niveau Terminé',
@@ -125,6 +131,9 @@ Créé par Inkflow59
             'minutes': 'minutes',
             'words': 'words',
             'back': 'Back',
+            'marathon': 'Marathon',
+            'marathon_grid': 'Marathon {}×{}',
+            'marathon_dialog': 'Grid size ({} to {}, multiple of {}):\n\nHundreds of words to find!',
             
             # Game
             'time_remaining': 'Time remaining',
@@ -149,6 +158,9 @@ Créé par Inkflow59
             'error': 'Error',
             'success': 'Success',
             'info': 'Info',
+            'loading_dictionary': 'Loading dictionary...',
+            'downloading_dictionary': 'Downloading dictionary ({}%)...',
+            'generating_grid': 'Generating grid...',
             
             # End game
             'level_complete': 'Level Complete',
@@ -217,6 +229,9 @@ Created by Inkflow59
             'minutes': 'minutos',
             'words': 'palabras',
             'back': 'Volver',
+            'marathon': 'Maratón',
+            'marathon_grid': 'Maratón {}×{}',
+            'marathon_dialog': 'Tamaño de la cuadrícula ({} a {}, múltiplo de {}):\n\n¡Cientos de palabras por encontrar!',
             
             # Juego
             'time_remaining': 'Tiempo restante',
@@ -241,6 +256,9 @@ Created by Inkflow59
             'error': 'Error',
             'success': 'Éxito',
             'info': 'Info',
+            'loading_dictionary': 'Cargando diccionario...',
+            'downloading_dictionary': 'Descargando diccionario ({}%)...',
+            'generating_grid': 'Generando cuadrícula...',
             
             # Fin del juego
             'level_complete': 'Nivel Completado',
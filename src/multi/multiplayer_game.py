@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Tuple, Optional, Dict
 import time
+from src.solo.grid_boards import segment_between
 
 
 class MultiplayerGameWindow:
@@ -310,33 +311,12 @@ class MultiplayerGameWindow:
     
     def get_cells_in_line(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Retourne toutes les cellules dans une ligne entre start et end."""
-        cells = []
-        row1, col1 = start
-        row2, col2 = end
-        
-        # Calculer la direction
-        dr = row2 - row1
-        dc = col2 - col1
-        
-        # Normaliser la direction pour avoir -1, 0 ou 1
-        steps = max(abs(dr), abs(dc))
-        if steps == 0:
-            return [start]
-        
-        dr = dr / steps
-        dc = dc / steps
-        
-        # Vérifier si c'est une ligne valide (horizontale, verticale ou diagonale)
-        if abs(dr) not in [0, 1] or abs(dc) not in [0, 1]:
+        size = len(self.grid)
+        # Ligne horizontale, verticale ou diagonale seulement (tables des segments partagées)
+        cells = segment_between(size, start, end)
+        if not cells:
             return [start]
-        
-        # Construire la liste des cellules
-        for i in range(steps + 1):
-            row = int(row1 + i * dr)
-            col = int(col1 + i * dc)
-            cells.append((row, col))
-        
-        return cells
+        return [divmod(index, size) for index in cells]
     
     def on_mouse_down(self, event):
         """Gère le clic de souris."""
@@ -366,17 +346,9 @@ class MultiplayerGameWindow:
         
         self.selecting = False
         
-        # Extraire le mot sélectionné
+        # Envoyer les cases extrêmes de la sélection : le serveur retrouve le mot placé
         if self.current_selection:
-            word = ''.join(self.grid[r][c] for r, c in self.current_selection)
-            word_reverse = word[::-1]
-            
-            # Envoyer le mot au serveur (ou son inverse)
-            # Le serveur vérifiera si c'est correct
-            if word in self.words or word_reverse in self.words:
-                # Envoyer le mot qui est dans la liste
-                word_to_send = word if word in self.words else word_reverse
-                self.client.check_word(word_to_send)
+            self.client.check_selection(self.current_selection[0], self.current_selection[-1])
         
         self.current_selection = []
         self.draw_grid()
@@ -459,8 +431,8 @@ class MultiplayerGameWindow:
         word = data['word']
         finder = data['finder']
         
-        # On peut optionnellement recevoir les cellules du serveur, sinon on devine
-        cells = data.get('cells', None)
+        # Cellules du mot envoyées par le serveur (absentes avec un ancien serveur)
+        cells = [tuple(cell) for cell in data['cells']] if data.get('cells') else None
         
         self.mark_word_found(word, finder, cells)
         self.update_scores(data['scores'])
@@ -478,7 +450,9 @@ class MultiplayerGameWindow:
         reason = data['reason']
         word = data.get('word', '')
         
-        if reason == 'not_in_list':
+        if reason == 'not_placed':
+            return  # Sélection qui ne correspond à aucun mot : rien à signaler
+        elif reason == 'not_in_list':
             self.show_message(f"✗ '{word}' n'est pas dans la liste", '#E74C3C')
         elif reason == 'already_found':
             if self.mode == "duel" and 'by' in data:
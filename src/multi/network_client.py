@@ -5,7 +5,7 @@ Gère la communication avec le serveur multijoueur
 import asyncio
 import websockets
 import json
-from typing import Callable, Optional, Any
+from typing import Callable, Optional, Any, Tuple
 import threading
 
 
@@ -171,6 +171,14 @@ class NetworkClient:
             'word': word
         })
     
+    def check_selection(self, start: Tuple[int, int], end: Tuple[int, int]):
+        """Vérifie une sélection par ses cases extrêmes."""
+        self.send({
+            'action': 'check_selection',
+            'start': list(start),
+            'end': list(end)
+        })
+    
     def leave_room(self):
         """Quitte la room actuelle."""
         self.send({'action': 'leave_room'})
@@ -0,0 +1,173 @@
+"""
+Générateur pseudo-aléatoire à seed, stable d'une version de Python à l'autre.
+
+Seule la méthode `random()` de `random.Random` a une suite garantie entre
+versions de Python ; `randrange`, `choice` ou `sample` peuvent changer (et
+coûtent cher à chaque appel). La génération des grilles et le tirage des mots
+utilisent donc ce générateur PCG32 (PCG-XSH-RR 64/32, O'Neill 2014), dont
+tous les tirages sont définis ici : un même seed donne la même grille partout.
+"""
+from itertools import islice
+from typing import Iterator, List, MutableSequence, Sequence, TypeVar
+
+
+T = TypeVar('T')
+
+MASK32 = 0xFFFFFFFF
+MASK64 = 0xFFFFFFFFFFFFFFFF
+MULTIPLIER = 6364136223846793005
+DEFAULT_STREAM = 1442695040888963407
+
+
+class PCG32:
+    """Générateur PCG32 : état de 64 bits, sorties de 32 bits."""
+    
+    def __init__(self, seed: int, stream: int = DEFAULT_STREAM):
+        """
+        Initialise le générateur.
+        
+        Args:
+            seed: Seed (entier positif ou nul ; seuls les 64 bits de poids faible comptent)
+            stream: Numéro de suite (deux suites différentes sont indépendantes)
+        """
+        self.increment = ((stream << 1) | 1) & MASK64
+        self.state = 0
+        self.next32()
+        self.state = (self.state + (seed & MASK64)) & MASK64
+        self.next32()
+    
+    def next32(self) -> int:
+        """Retourne un entier uniforme sur 32 bits."""
+        old = self.state
+        self.state = (old * MULTIPLIER + self.increment) & MASK64
+        xorshifted = (((old >> 18) ^ old) >> 27) & MASK32
+        rotation = old >> 59
+        return ((xorshifted >> rotation) | (xorshifted << (-rotation & 31))) & MASK32
+    
+    def getrandbits(self, bits: int) -> int:
+        """Retourne un entier uniforme de `bits` bits."""
+        value = 0
+        for shift in range(0, bits, 32):
+            value |= self.next32() << shift
+        return value & ((1 << bits) - 1)
+    
+    def below(self, bound: int) -> int:
+        """
+        Retourne un entier uniforme dans [0, bound).
+        
+        Méthode de Lemire (multiplication puis rejet rare) : sans biais et,
+        le plus souvent, un seul tirage de 32 bits.
+        """
+        if bound <= 0:
+            raise ValueError("La borne doit être strictement positive")
+        if bound > MASK32:
+            # Grande borne : rejet sur le nombre de bits nécessaire
+            bits = bound.bit_length()
+            while True:
+                value = self.getrandbits(bits)
+                if value < bound:
+                    return value
+        # Tirage de `next32` écrit en ligne (appel le plus fréquent)
+        old = self.state
+        self.state = (old * MULTIPLIER + self.increment) & MASK64
+        xorshifted = (((old >> 18) ^ old) >> 27) & MASK32
+        rotation = old >> 59
+        product = (((xorshifted >> rotation) | (xorshifted << (-rotation & 31))) & MASK32) * bound
+        if (product & MASK32) < bound:
+            threshold = (-bound & MASK32) % bound
+            while (product & MASK32) < threshold:
+                product = self.next32() * bound
+        return product >> 32
+    
+    # Même nom que `random.Random.randrange` pour les appels à un argument
+    randrange = below
+    
+    def random(self) -> float:
+        """Retourne un flottant uniforme dans [0, 1) (53 bits)."""
+        return ((self.next32() >> 5) * 67108864 + (self.next32() >> 6)) / 9007199254740992.0
+    
+    def choice(self, sequence: Sequence[T]) -> T:
+        """Retourne un élément uniforme d'une séquence non vide."""
+        return sequence[self.below(len(sequence))]
+    
+    def shuffle(self, items: MutableSequence):
+        """Mélange une liste en place (Fisher–Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = self.below(i + 1)
+            items[i], items[j] = items[j], items[i]
+    
+    def sample(self, population: Sequence[T], count: int) -> List[T]:
+        """
+        Tire `count` éléments distincts, dans l'ordre du tirage.
+        
+        Le coût est en O(count) pour une grande population (une `range` de
+        plusieurs centaines de milliers de mots, par exemple).
+        """
+        if not 0 <= count <= len(population):
+            raise ValueError("Échantillon plus grand que la population")
+        return list(islice(self.iter_sample(population), count))
+    
+    def iter_sample(self, population: Sequence[T]) -> Iterator[T]:
+        """
+        Tire des éléments distincts un par un, à la demande.
+        
+        Les `count` premiers éléments sont ceux de `sample(population, count)` :
+        on peut rejeter un élément et en tirer un autre sans fixer le nombre
+        de tirages à l'avance.
+        """
+        size = len(population)
+        # Fisher–Yates partiel sur une table des échanges, sans copier la population
+        swapped = {}
+        for i in range(size):
+            j = i + self.below(size - i)
+            yield population[swapped.get(j, j)]
+            swapped[j] = swapped.get(i, i)
+    
+    def letters(self, alphabet: str, count: int) -> List[str]:
+        """
+        Tire `count` lettres uniformes d'un alphabet.
+        
+        Chaque tirage de 32 bits donne plusieurs lettres, extraites deux par
+        deux (table des paires) : remplir une grille coûte bien moins de
+        tirages qu'une lettre à la fois.
+        """
+        if alphabet not in _pair_tables:
+            _pair_tables[alphabet] = _pair_table(alphabet)
+        pairs, base, per_draw, span, limit = _pair_tables[alphabet]
+        
+        chunks = []
+        append = chunks.append
+        state, increment = self.state, self.increment
+        needed = (count + 1) // 2
+        while needed > 0:
+            # Tirage de `next32` écrit en ligne
+            old = state
+            state = (old * MULTIPLIER + increment) & MASK64
+            xorshifted = (((old >> 18) ^ old) >> 27) & MASK32
+            rotation = old >> 59
+            value = ((xorshifted >> rotation) | (xorshifted << (-rotation & 31))) & MASK32
+            if value >= limit:
+                continue
+            value %= span
+            for _ in range(min(per_draw, needed)):
+                value, digit = divmod(value, base)
+                append(pairs[digit])
+            needed -= per_draw
+        self.state = state
+        return list(''.join(chunks)[:count])
+    
+
+# Paires de lettres et paramètres de tirage, par alphabet
+_pair_tables = {}
+
+
+def _pair_table(alphabet: str):
+    """Prépare le tirage de paires de lettres : (paires, base, paires par tirage, étendue, limite)."""
+    pairs = [a + b for b in alphabet for a in alphabet]
+    base = len(pairs)
+    per_draw = 1
+    while base ** (per_draw + 1) <= 1 << 32:
+        per_draw += 1
+    span = base ** per_draw
+    limit = ((1 << 32) // span) * span  # Rejet : chaque bloc reste uniforme
+    return pairs, base, per_draw, span, limit
@@ -0,0 +1,118 @@
+"""
+Exécution des tâches longues hors du thread Tkinter.
+Mode Solo.
+
+Tkinter n'est pas thread-safe : les tâches (chargement du dictionnaire,
+génération de grille) tournent dans un thread de travail, et leurs résultats
+reviennent par une file que la boucle Tk consulte avec `after`. Seul le
+thread Tk touche à `after` : les autres threads ne font que remplir la file.
+"""
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class BackgroundWorker:
+    """Thread de travail unique dont les résultats sont traités dans la boucle Tk."""
+    
+    POLL_INTERVAL = 50  # en millisecondes
+    
+    def __init__(self, root: tk.Misc):
+        """
+        Initialise le thread de travail.
+        
+        Args:
+            root: Fenêtre dont la boucle d'événements reçoit les résultats
+        """
+        self.root = root
+        self._jobs: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        self._latest: Dict[str, int] = {}
+        self._counter = 0
+        self._current: Tuple[Optional[int], Optional[str]] = (None, None)  # Tâche en cours d'exécution
+        
+        # Les tâches s'exécutent dans l'ordre de soumission (une seule à la fois)
+        self._thread = threading.Thread(target=self._run, name="gui-worker", daemon=True)
+        self._thread.start()
+        # Scrutation permanente, planifiée depuis le thread Tk (celui qui crée le worker)
+        self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll)
+    
+    def submit(self, func: Callable, *args, on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None, key: Optional[str] = None) -> int:
+        """
+        Soumet une tâche au thread de travail.
+        
+        Args:
+            func: Fonction à exécuter (ne doit pas toucher aux widgets)
+            *args: Arguments de la fonction
+            on_done: Appelée dans la boucle Tk avec le résultat
+            on_error: Appelée dans la boucle Tk avec l'exception levée
+            key: Catégorie de la tâche : seul le résultat de la dernière tâche
+                soumise avec la même clé est transmis, et une tâche remplacée
+                avant d'avoir commencé n'est pas exécutée
+        
+        Returns:
+            Identifiant de la tâche
+        """
+        self._counter += 1
+        job_id = self._counter
+        if key is not None:
+            self._latest[key] = job_id
+        self._jobs.put((job_id, key, func, args, on_done, on_error))
+        return job_id
+    
+    def cancel(self, key: str):
+        """Abandonne les tâches d'une clé : leurs résultats ne seront pas transmis."""
+        self._counter += 1
+        self._latest[key] = self._counter
+    
+    def post(self, callback: Callable, *args):
+        """
+        Demande l'exécution d'une fonction dans la boucle Tk.
+        
+        Utilisable depuis n'importe quel thread (progression d'un téléchargement) ;
+        la fonction est exécutée au prochain passage de la scrutation. Appelée
+        pendant une tâche, elle hérite de sa clé : si la tâche a été remplacée
+        entre-temps (tuile d'un marathon abandonné), la fonction est ignorée.
+        """
+        job_id, key = self._current if threading.current_thread() is self._thread else (None, None)
+        self._results.put((job_id, key, callback, args))
+    
+    def _run(self):
+        """Boucle du thread de travail."""
+        while True:
+            job_id, key, func, args, on_done, on_error = self._jobs.get()
+            # Tâche déjà remplacée par une plus récente : inutile de l'exécuter
+            if key is not None and self._latest.get(key) != job_id:
+                self._jobs.task_done()
+                continue
+            self._current = (job_id, key)
+            try:
+                result = func(*args)
+            except Exception as e:
+                if on_error:
+                    self._results.put((job_id, key, on_error, (e,)))
+                else:
+                    print(f"⚠ Erreur de tâche en arrière-plan: {e}")
+            else:
+                if on_done:
+                    self._results.put((job_id, key, on_done, (result,)))
+            finally:
+                self._current = (None, None)
+                self._jobs.task_done()
+    
+    def _poll(self):
+        """Traite les résultats reçus puis se replanifie (thread Tk uniquement)."""
+        while True:
+            try:
+                job_id, key, callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            # Ignorer le résultat d'une tâche remplacée par une plus récente
+            if key is not None and self._latest.get(key) != job_id:
+                continue
+            callback(*args)
+        
+        if self._thread.is_alive():
+            self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll)
@@ -3,9 +3,13 @@ Logique du jeu de mots mêlés avec système de niveaux.
 Mode Solo.
 """
 import time
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
-from src.solo.grid_generator import GridGenerator, GridConfig
+from typing import List, Dict, Set, Tuple, Optional
+from dataclasses import dataclass, replace
+from src.solo.grid_generator import GridGenerator, GridConfig, GenerationStats
+from src.solo.grid_store import get_grid_store
+from src.solo.grid_pool import get_grid_pool, PooledGrid
+from src.solo.grid_scanner import PlacementIndex
+from src.solo.grid_tiles import TiledGridGenerator, TileCallback, TILE_SIZE
 
 
 @dataclass
@@ -17,6 +21,7 @@ class Level:
     time_limit: int  # en secondes
     allow_diagonal: bool
     allow_reverse: bool
+    marathon: bool = False  # Très grande grille générée par tuiles
     
 
 class GameLogic:
@@ -30,6 +35,12 @@ class GameLogic:
         Level(5, 16, 14, 480, True, True),          # Niveau 5: 16×16, 14 mots, 8 min, tout activé
     ]
     
+    # Marathon : numéro hors des niveaux normaux (limités à 999 dans l'interface)
+    MARATHON_LEVEL = 1000
+    MARATHON_SIZES = [100, 200, 300, 500]
+    MARATHON_WORDS_PER_TILE = 5
+    MARATHON_SECONDS_PER_WORD = 30
+    
     @staticmethod
     def generate_level(level_number: int) -> Level:
         """Génère un niveau de manière procédurale pour les niveaux infinis.
@@ -58,33 +69,63 @@ class GameLogic:
         
         return Level(level_number, grid_size, num_words, time_limit, True, True)
     
+    @staticmethod
+    def marathon_level(grid_size: int) -> Level:
+        """
+        Retourne la configuration d'un marathon.
+        
+        Args:
+            grid_size: Taille de la grille (multiple de la taille des tuiles)
+        
+        Returns:
+            Configuration du niveau marathon
+        """
+        if grid_size < TILE_SIZE or grid_size % TILE_SIZE:
+            raise ValueError(f"Taille de marathon invalide: {grid_size}")
+        num_words = (grid_size // TILE_SIZE) ** 2 * GameLogic.MARATHON_WORDS_PER_TILE
+        return Level(GameLogic.MARATHON_LEVEL, grid_size, num_words,
+                     num_words * GameLogic.MARATHON_SECONDS_PER_WORD, True, True, marathon=True)
+    
     def __init__(self, word_list: List[str]):
         """
         Initialise le jeu.
         
         Args:
-            word_list: Liste des mots disponibles
+            word_list: Liste des mots disponibles, ou dictionnaire indexé par
+                longueur (conservé tel quel, sans copie)
         """
-        self.word_list = [word.upper() for word in word_list]
+        if hasattr(word_list, 'sample'):
+            self.word_list = word_list
+        else:
+            self.word_list = [word.upper() for word in word_list]
+        self.language: Optional[str] = getattr(word_list, 'language', None)
         self.current_level: Optional[Level] = None
         self.grid: Optional[List[List[str]]] = None
         self.words_to_find: List[Dict] = []
         self.found_words: List[str] = []
+        self.placements = PlacementIndex([])  # Mots placés par texte et par cases extrêmes
+        self._found: Set[str] = set()  # Mêmes mots que found_words (test en O(1))
         self.seed: Optional[int] = None
         self.start_time: Optional[float] = None
         self.elapsed_time: float = 0
         self.is_paused: bool = False
         self.pause_start: Optional[float] = None
         self.total_pause_time: float = 0
+        self.repaired_cells: List[Tuple[int, int]] = []  # Marathon : cases changées après leur tuile
     
-    def start_level(self, level_number: int, seed: int = None) -> Dict:
+    def start_level(self, level_number: int, seed: int = None,
+                    prepared: Optional[PooledGrid] = None) -> Dict:
         """
         Démarre un niveau.
         
+        Sans seed imposé, la grille est prise dans la réserve de grilles
+        prêtes quand elle n'est pas vide.
+        
         Args:
             level_number: Numéro du niveau (1+)
             seed: Seed optionnel pour la génération
-            
+            prepared: Grille déjà retirée de la réserve (seed, grille, mots)
+        
         Returns:
             Informations sur le niveau démarré
         """
@@ -92,32 +133,63 @@ class GameLogic:
             raise ValueError(f"Niveau invalide: {level_number}")
         
         self.current_level = self.generate_level(level_number)
-        self.found_words = []
-        self.elapsed_time = 0
-        self.total_pause_time = 0
-        self.is_paused = False
+        self._reset_progress()
         
-        # Générer la grille
-        generator = GridGenerator(seed)
-        self.seed = generator.get_seed()
+        # Générer la grille (ou la prendre dans la réserve)
+        if prepared is None and seed is None:
+            prepared = get_grid_pool().pop(self.word_list, level_number)
+        if prepared is not None:
+            self.seed, self.grid, self.words_to_find = prepared
+        else:
+            self.seed, self.grid, self.words_to_find = self.build_level_grid(self.word_list, level_number, seed)
+        return self._level_started()
+    
+    def start_marathon(self, grid_size: int, seed: Optional[int] = None,
+                       on_tile: Optional[TileCallback] = None) -> Dict:
+        """
+        Démarre un marathon : une très grande grille générée tuile par tuile.
         
-        config = GridConfig(
-            size=self.current_level.grid_size,
-            num_words=self.current_level.num_words,
-            allow_diagonal=self.current_level.allow_diagonal,
-            allow_reverse=self.current_level.allow_reverse
-        )
+        Les grilles marathon ne passent ni par le cache ni par la réserve.
         
-        self.grid, self.words_to_find = generator.generate_grid(config, self.word_list)
+        Args:
+            grid_size: Taille de la grille (voir `MARATHON_SIZES`)
+            seed: Seed optionnel pour la génération
+            on_tile: Appelée avec chaque tuile dès qu'elle est générée
+                (affichage progressif)
+        
+        Returns:
+            Informations sur le niveau démarré
+        """
+        self.current_level = self.marathon_level(grid_size)
+        self._reset_progress()
         
+        generator = TiledGridGenerator(seed)
+        self.seed = generator.get_seed()
+        self.grid, self.words_to_find = generator.generate_grid(
+            self.level_grid_config(self.current_level), self.word_list, self.current_level.number, on_tile
+        )
+        self.repaired_cells = generator.repaired_cells
+        return self._level_started()
+    
+    def _reset_progress(self):
+        """Remet à zéro les mots trouvés et le chronomètre."""
+        self.found_words = []
+        self._found = set()
+        self.elapsed_time = 0
+        self.total_pause_time = 0
+        self.is_paused = False
+    
+    def _level_started(self) -> Dict:
+        """Vérifie la grille générée et retourne les informations du niveau démarré."""
         # Vérifier qu'au moins quelques mots ont été placés
         if len(self.words_to_find) == 0:
             raise ValueError("Impossible de générer une grille valide. Aucun mot n'a pu être placé.")
         
+        self._index_words()
         self.start_time = time.time()
         
         return {
-            'level': level_number,
+            'level': self.current_level.number,
             'grid_size': self.current_level.grid_size,
             'num_words': len(self.words_to_find),
             'time_limit': self.current_level.time_limit,
@@ -125,6 +197,114 @@ class GameLogic:
             'words': [w['word'] for w in self.words_to_find]
         }
     
+    @staticmethod
+    def level_grid_config(level: Level) -> GridConfig:
+        """
+        Retourne la configuration de grille d'un niveau.
+        
+        Les niveaux procéduraux (6+) utilisent le solveur : ils contiennent
+        toujours exactement le nombre de mots prévu. Les niveaux prédéfinis,
+        petits et rapides à générer, gardent la meilleure de trois grilles.
+        """
+        procedural = level.number > len(GameLogic.LEVELS)
+        return GridConfig(
+            size=level.grid_size,
+            num_words=level.num_words,
+            allow_diagonal=level.allow_diagonal,
+            allow_reverse=level.allow_reverse,
+            solver=procedural,
+            candidates=1 if procedural else 3
+        )
+    
+    @classmethod
+    def build_level_grid(cls, word_list, level_number: int, seed: Optional[int] = None,
+                         use_cache: bool = True, config: Optional[GridConfig] = None,
+                         deadline_ms: Optional[float] = None) -> Tuple[int, List[List[str]], List[Dict]]:
+        """
+        Construit la grille d'un niveau pour un seed.
+        
+        Partagé par le mode solo, le serveur multijoueur et la commande `build` :
+        une grille déjà générée (ou pré-générée) pour (seed, niveau, langue)
+        est relue depuis le cache au lieu d'être recalculée.
+        
+        Args:
+            word_list: Dictionnaire indexé (ou simple liste)
+            level_number: Numéro du niveau
+            seed: Seed de la partie (None = aléatoire)
+            use_cache: Lire et alimenter le cache des grilles
+            config: Configuration remplaçant celle du niveau (grilles personnalisées)
+            deadline_ms: Budget de temps de la génération (voir `GridGenerator.generate_grid`) ;
+                une grille écourtée par le budget n'est pas mise en cache
+        
+        Returns:
+            Tuple (seed, grille, informations des mots placés)
+        """
+        generator = GridGenerator(seed)
+        seed = generator.get_seed()
+        
+        language = getattr(word_list, 'language', None)
+        dictionary_version = getattr(word_list, 'version', None)
+        # Les grilles personnalisées (config fournie) ne passent pas par le cache
+        use_cache = use_cache and config is None and language and dictionary_version
+        if use_cache:
+            cached = get_grid_store().get(language, level_number, seed, dictionary_version,
+                                          GridGenerator.VERSION)
+            if cached is not None:
+                return (seed,) + cached
+        
+        seed, grid, words, stats = cls.generate_level_grid(word_list, level_number, seed, config, deadline_ms)
+        if use_cache and not stats.deadline_hit:
+            get_grid_store().put(language, level_number, seed, dictionary_version, GridGenerator.VERSION,
+                                 grid, words)
+        return seed, grid, words
+    
+    @classmethod
+    def generate_level_grid(cls, word_list, level_number: int, seed: Optional[int] = None,
+                            config: Optional[GridConfig] = None, deadline_ms: Optional[float] = None
+                            ) -> Tuple[int, List[List[str]], List[Dict], GenerationStats]:
+        """
+        Génère la grille d'un niveau sans passer par le cache.
+        
+        Args:
+            word_list: Dictionnaire indexé (ou simple liste)
+            level_number: Numéro du niveau
+            seed: Seed de la partie (None = aléatoire)
+            config: Configuration remplaçant celle du niveau (grilles personnalisées)
+            deadline_ms: Budget de temps de la génération (voir `GridGenerator.generate_grid`)
+        
+        Returns:
+            Tuple (seed, grille, informations des mots placés, statistiques de la génération)
+        """
+        generator = GridGenerator(seed)
+        seed = generator.get_seed()
+        # Copie : la génération peut ajuster le nombre de mots
+        config = replace(config) if config is not None else cls.level_grid_config(cls.generate_level(level_number))
+        grid, words = generator.generate_grid(
+            config, cls.select_level_words(word_list, seed, level_number, config), deadline_ms
+        )
+        return seed, grid, words, generator.stats
+    
+    @staticmethod
+    def select_level_words(word_list, seed: int, level_number: int, config: GridConfig) -> List[str]:
+        """
+        Sélectionne les mots d'un niveau à partir du seed.
+        
+        Partagé par le mode solo et le serveur multijoueur : un même
+        (seed, niveau, langue) donne toujours les mêmes mots, donc la même grille.
+        
+        Args:
+            word_list: Dictionnaire indexé (ou simple liste pour les anciens appels)
+            seed: Seed de la partie
+            level_number: Numéro du niveau
+            config: Configuration de la grille
+        
+        Returns:
+            Mots à placer dans la grille
+        """
+        if hasattr(word_list, 'select_words'):
+            return word_list.select_words(seed, level_number, config.num_words, 3, config.size)
+        return word_list
+    
     def check_word(self, word: str) -> bool:
         """
         Vérifie si un mot est correct et non déjà trouvé.
@@ -137,15 +317,60 @@ class GameLogic:
         """
         word = word.upper().strip()
         
-        if word in self.found_words:
+        if word in self._found or self.placements.word(word) is None:
             return False
         
-        for word_info in self.words_to_find:
-            if word_info['word'] == word:
-                self.found_words.append(word)
-                return True
+        self._mark_found(word)
+        return True
+    
+    def check_selection(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[Dict]:
+        """
+        Vérifie une sélection par ses cases extrêmes et marque le mot trouvé.
+        
+        Seule la position réelle d'un mot compte (pas une copie de ses lettres
+        ailleurs dans la grille) : le mode solo, la fenêtre multijoueur et le
+        serveur s'accordent ainsi sur les cases de chaque mot trouvé.
+        
+        Args:
+            start: Première case de la sélection
+            end: Dernière case de la sélection (dans un sens ou dans l'autre)
         
-        return False
+        Returns:
+            Informations du mot placé s'il est trouvé pour la première fois, sinon None
+        """
+        word_info = self.placements.between(start, end)
+        if word_info is None or word_info['word'] in self._found:
+            return None
+        
+        self._mark_found(word_info['word'])
+        return word_info
+    
+    def _mark_found(self, word: str):
+        """Ajoute un mot aux mots trouvés."""
+        self.found_words.append(word)
+        self._found.add(word)
+    
+    def word_at(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[Dict]:
+        """
+        Retourne le mot placé entre deux cases, sans relire les lettres de la grille.
+        
+        Args:
+            start: Première case de la sélection
+            end: Dernière case de la sélection (le mot peut être lu dans un sens ou dans l'autre)
+        
+        Returns:
+            Informations du mot placé, ou None si aucun mot n'occupe exactement ces cases
+        """
+        return self.placements.between(start, end)
+    
+    def is_found(self, word: str) -> bool:
+        """Indique si un mot a déjà été trouvé."""
+        return word in self._found
+    
+    def _index_words(self):
+        """Indexe les mots placés et les mots trouvés du niveau en cours."""
+        self.placements = PlacementIndex(self.words_to_find)
+        self._found = set(self.found_words)
     
     def get_remaining_time(self) -> float:
         """
@@ -211,7 +436,7 @@ class GameLogic:
         return {
             'level': self.current_level.number if self.current_level else None,
             'seed': self.seed,
-            'grid': self.grid,
+            'grid': [''.join(row) for row in self.grid] if self.grid else self.grid,  # Une chaîne par ligne
             'words_to_find': self.words_to_find,  # Sauvegarder toutes les infos des mots
             'found_words': self.found_words,
             'remaining_time': self.get_remaining_time(),
@@ -223,7 +448,8 @@ class GameLogic:
                 'num_words': self.current_level.num_words,
                 'time_limit': self.current_level.time_limit,
                 'allow_diagonal': self.current_level.allow_diagonal,
-                'allow_reverse': self.current_level.allow_reverse
+                'allow_reverse': self.current_level.allow_reverse,
+                'marathon': self.current_level.marathon
             } if self.current_level else None
         }
     
@@ -245,14 +471,16 @@ class GameLogic:
                     num_words=level_config['num_words'],
                     time_limit=level_config['time_limit'],
                     allow_diagonal=level_config['allow_diagonal'],
-                    allow_reverse=level_config['allow_reverse']
+                    allow_reverse=level_config['allow_reverse'],
+                    marathon=level_config.get('marathon', False)
                 )
             else:
                 # Fallback pour anciennes sauvegardes
                 self.current_level = self.generate_level(level_number)
         
         self.seed = state.get('seed')
-        self.grid = state.get('grid')
+        grid = state.get('grid')
+        self.grid = [list(row) for row in grid] if grid else grid
         self.found_words = state.get('found_words', [])
         self.elapsed_time = state.get('elapsed_time', 0)
         self.total_pause_time = state.get('total_pause_time', 0)
@@ -267,6 +495,7 @@ class GameLogic:
             # Anciennes sauvegardes avec juste les mots
             self.words_to_find = [{'word': word, 'start': (0, 0), 'direction': 'horizontal', 'length': len(word)} 
                                   for word in words_data]
+        self._index_words()
         
         # Ajuster le temps de début
         if self.current_level:
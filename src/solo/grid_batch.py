@@ -0,0 +1,113 @@
+"""
+Génération de grilles par lots, répartie sur plusieurs processus.
+Mode Solo (défis quotidiens, impressions, pré-génération du cache).
+
+Chaque processus ouvre le dictionnaire une seule fois ; les grilles sont
+rendues au fil de l'eau, dans l'ordre des tâches, et sont identiques à celles
+de `GameLogic.build_level_grid` pour les mêmes (seed, niveau, langue).
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src.compiled_dictionary import CompiledDictionary
+from src.solo.grid_generator import GenerationStats, GridConfig
+
+
+@dataclass
+class GridJob:
+    """Une grille à générer."""
+    seed: int
+    level: int = 1
+    config: Optional[GridConfig] = None  # Remplace la configuration du niveau
+    
+
+JobSpec = Union[int, Tuple[int, int], GridJob]
+GridResult = Tuple[int, List[List[str]], List[Dict]]
+GridStatsResult = Tuple[int, List[List[str]], List[Dict], GenerationStats]
+
+# Dictionnaire ouvert une fois par processus de travail
+_worker_index = None
+
+
+def _as_job(spec: JobSpec, level: int) -> GridJob:
+    """Convertit un seed, un couple (seed, niveau) ou une tâche en `GridJob`."""
+    if isinstance(spec, GridJob):
+        return spec
+    if isinstance(spec, tuple):
+        return GridJob(*spec)
+    return GridJob(spec, level)
+    
+
+def _init_worker(source: Union[str, bytes], language: str, version: str):
+    """
+    Ouvre le dictionnaire d'un processus de travail (une seule fois).
+    
+    Args:
+        source: Chemin du dictionnaire compilé (mmap partagé entre processus)
+            ou contenu compilé d'un dictionnaire construit en mémoire
+        language: Code de langue du dictionnaire
+        version: Empreinte attendue du dictionnaire
+    """
+    global _worker_index
+    if isinstance(source, str):
+        _worker_index = CompiledDictionary.open(source, language)
+    else:
+        _worker_index = CompiledDictionary(source, language)
+    if _worker_index.version != version:
+        raise RuntimeError(f"Dictionnaire {language} différent de celui du processus principal")
+    
+
+def _build(job: GridJob, index=None) -> GridStatsResult:
+    """Génère la grille d'une tâche (même chemin que le mode solo), avec ses statistiques."""
+    from src.solo.game_logic import GameLogic
+    return GameLogic.generate_level_grid(index if index is not None else _worker_index, job.level, job.seed,
+                                         config=job.config)
+    
+
+def generate_many(configs_or_seeds: Iterable[JobSpec], workers: Optional[int] = None,
+                  language: Optional[str] = None, level: int = 1, index=None,
+                  with_stats: bool = False) -> Iterator[Union[GridResult, GridStatsResult]]:
+    """
+    Génère des grilles en parallèle.
+    
+    Args:
+        configs_or_seeds: Seeds (niveau `level`), couples (seed, niveau) ou `GridJob`
+        workers: Nombre de processus (None ou 1 = dans le processus courant)
+        language: Langue du dictionnaire (None = langue courante)
+        level: Niveau des tâches données par un simple seed
+        index: Dictionnaire compilé déjà ouvert (par défaut celui du générateur global)
+        with_stats: Ajouter à chaque résultat les statistiques de la génération
+            (note de la grille, lettres réparées...)
+    
+    Returns:
+        Itérateur de tuples (seed, grille, informations des mots placés[, statistiques]),
+        dans l'ordre des tâches
+    """
+    from src.word_generator import get_word_generator
+    if index is None:
+        index = get_word_generator().get_index(language)
+    jobs = (_as_job(spec, level) for spec in configs_or_seeds)
+    for result in _generate(jobs, workers, index):
+        yield result if with_stats else result[:3]
+    
+
+def _generate(jobs: Iterable[GridJob], workers: Optional[int], index) -> Iterator[GridStatsResult]:
+    """Génère les grilles des tâches, dans le processus courant ou dans un pool."""
+    if not workers or workers <= 1:
+        for job in jobs:
+            yield _build(job, index)
+        return
+    
+    # Les processus ouvrent le dictionnaire fourni, pas celui du cache global
+    source = index.path if index.path is not None else index.tobytes()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(source, index.language, index.version)) as pool:
+        # Garder quelques tâches d'avance par processus, sans tout soumettre d'un coup
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(_build, job))
+            if len(pending) >= workers * 4:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
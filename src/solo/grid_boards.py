@@ -0,0 +1,466 @@
+"""
+Représentations de la grille pendant la génération.
+Mode Solo.
+
+Le générateur ne manipule la grille qu'à travers ces plateaux : énumération
+des positions légales d'un texte, écriture, retour arrière, remplissage des
+cases vides et conversion en liste de listes (format de l'API).
+
+- `ListBoard` : liste de caractères à plat, bibliothèque standard uniquement.
+- `BitBoard` : un entier par lettre (un bit par case) ; une position se
+  vérifie par quelques décalages et ET, sans boucle sur les cases.
+- `NumpyBoard` : tableau `uint8` (NumPy optionnel). Les positions sont
+  trouvées par découpage du tableau et le même seed donne la même grille
+  qu'avec `ListBoard`, sauf si le remplissage vectorisé est demandé.
+"""
+import re
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+    
+
+Step = Tuple[int, int]
+Cell = Tuple[int, int]
+Candidates = Tuple[List[int], Callable[[int], List[int]]]
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Pas (ligne, colonne) de chaque direction de placement
+DIRECTIONS: Dict[str, Step] = {
+    'horizontal': (0, 1),
+    'vertical': (1, 0),
+    'diagonal_down': (1, 1),
+    'diagonal_up': (-1, 1),
+    'horizontal_reverse': (0, -1),
+    'vertical_reverse': (-1, 0),
+    'diagonal_down_reverse': (-1, -1),
+    'diagonal_up_reverse': (1, -1)
+}
+
+# Parcours de la grille ligne par ligne pour chaque (taille, direction), partagé
+_line_orders: Dict[Tuple[int, Step], Tuple[List[int], Callable]] = {}
+
+
+def line_order(size: int, step: Step) -> Tuple[List[int], Callable]:
+    """
+    Retourne le parcours d'une grille dans une direction.
+    
+    Les cases sont listées ligne après ligne (une ligne = une rangée, une
+    colonne ou une diagonale), séparées par l'indice `size * size` qui désigne
+    une case sentinelle hors grille.
+    
+    Returns:
+        Tuple (indices des cases à plat, fonction extrayant ces cases d'une grille à plat)
+    """
+    key = (size, step)
+    if key not in _line_orders:
+        dr, dc = step
+        separator = size * size
+        order = []
+        for row in range(size):
+            for col in range(size):
+                # Une ligne commence sur une case dont la précédente est hors grille
+                if 0 <= row - dr < size and 0 <= col - dc < size:
+                    continue
+                r, c = row, col
+                while 0 <= r < size and 0 <= c < size:
+                    order.append(r * size + c)
+                    r += dr
+                    c += dc
+                order.append(separator)
+        _line_orders[key] = (order, itemgetter(*order))
+    return _line_orders[key]
+    
+
+# Tables des segments par (taille, direction) : position de chaque case dans le parcours
+# et nombre de cases jusqu'au bord (case comprise)
+_line_tables: Dict[Tuple[int, Step], Tuple[List[int], List[int], List[int]]] = {}
+
+
+def line_table(size: int, step: Step) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Retourne la table des segments d'une grille dans une direction.
+    
+    Tout segment (départ, direction, longueur) est une tranche du parcours
+    de `line_order` : la géométrie est calculée une seule fois par taille.
+    
+    Returns:
+        Tuple (parcours, position de chaque case dans le parcours, portée de
+        chaque case jusqu'au bord)
+    """
+    key = (size, step)
+    if key not in _line_tables:
+        order = line_order(size, step)[0]
+        separator = size * size
+        position = [0] * separator
+        reach = [0] * separator
+        remaining = 0
+        for index in range(len(order) - 1, -1, -1):
+            cell = order[index]
+            if cell == separator:
+                remaining = 0
+                continue
+            remaining += 1
+            position[cell] = index
+            reach[cell] = remaining
+        _line_tables[key] = (order, position, reach)
+    return _line_tables[key]
+    
+
+def segment(size: int, start: int, step: Step, length: int) -> Optional[List[int]]:
+    """
+    Retourne les cases (indices à plat) d'un segment, ou None s'il sort de la grille.
+    
+    Args:
+        size: Taille de la grille
+        start: Case de départ (indice à plat)
+        step: Direction (delta ligne, delta colonne)
+        length: Nombre de cases
+    """
+    order, position, reach = line_table(size, step)
+    if not 0 < length <= reach[start]:
+        return None
+    first = position[start]
+    return order[first:first + length]
+    
+
+def segment_between(size: int, first: Cell, last: Cell) -> Optional[List[int]]:
+    """
+    Retourne les cases (indices à plat) d'une ligne droite entre deux cases.
+    
+    Returns:
+        Cases de `first` à `last` incluses, ou None si elles ne sont pas
+        alignées (horizontale, verticale ou diagonale) ou hors de la grille
+    """
+    dr, dc = last[0] - first[0], last[1] - first[1]
+    length = max(abs(dr), abs(dc)) + 1
+    if (dr and dc and abs(dr) != abs(dc)) or not (0 <= first[0] < size and 0 <= first[1] < size):
+        return None
+    step = ((dr > 0) - (dr < 0), (dc > 0) - (dc < 0))
+    if step == (0, 0):
+        return [first[0] * size + first[1]]
+    return segment(size, first[0] * size + first[1], step, length)
+    
+
+def start_range(size: int, length: int, delta: int) -> Tuple[int, int]:
+    """Retourne l'intervalle [début, fin) des coordonnées de départ d'un mot sur un axe."""
+    if delta > 0:
+        return 0, size - length + 1
+    if delta < 0:
+        return length - 1, size
+    return 0, size
+    
+
+class ListBoard:
+    """Grille à plat (liste de caractères, ' ' pour une case vide)."""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.cells = [' '] * (size * size)
+        self._line_texts: Dict[Step, str] = {}
+    
+    def _line_text(self, step: Step) -> str:
+        """Texte de la grille parcourue dans une direction (lignes séparées par '\\n')."""
+        if step not in self._line_texts:
+            getter = line_order(self.size, step)[1]
+            self._line_texts[step] = ''.join(getter(self.cells + ['\n']))
+        return self._line_texts[step]
+    
+    def candidates(self, text: str, steps: List[Step]) -> Candidates:
+        """
+        Compte toutes les positions de départ légales d'un texte, par direction.
+        
+        Chaque lettre du texte devient la classe `[ X]` (case vide ou même
+        lettre) : une seule recherche d'expression régulière par direction
+        trouve toutes les positions compatibles, séparateurs de lignes exclus.
+        
+        Returns:
+            Tuple (nombre de positions par direction, fonction retournant les
+            cases de départ d'une direction, dans l'ordre de lecture)
+        """
+        pattern = re.compile('(?=' + ''.join(f'[ {re.escape(letter)}]' for letter in text) + ')')
+        counts = [len(pattern.findall(self._line_text(step))) for step in steps]
+        
+        def starts(index: int) -> List[int]:
+            order = line_order(self.size, steps[index])[0]
+            return sorted(order[match.start()] for match in pattern.finditer(self._line_text(steps[index])))
+        
+        return counts, starts
+    
+    def write(self, text: str, start: int, step: Step) -> List[int]:
+        """
+        Écrit un texte à partir d'une case.
+        
+        Returns:
+            Indices des cases auparavant vides (pour le retour arrière)
+        """
+        filled = []
+        for index, letter in zip(segment(self.size, start, step, len(text)), text):
+            if self.cells[index] == ' ':
+                filled.append(index)
+            self.cells[index] = letter
+        self._line_texts.clear()
+        return filled
+    
+    def erase(self, filled: List[int]):
+        """Vide à nouveau des cases remplies par `write`."""
+        for index in filled:
+            self.cells[index] = ' '
+        self._line_texts.clear()
+    
+    def snapshot(self):
+        return list(self.cells)
+    
+    def restore(self, snapshot):
+        self.cells[:] = snapshot
+        self._line_texts.clear()
+    
+    def fill(self, rng, vectorized: bool = False):
+        """Remplit les cases vides avec des lettres aléatoires (ligne par ligne)."""
+        empty = [index for index, letter in enumerate(self.cells) if letter == ' ']
+        for index, letter in zip(empty, rng.letters(LETTERS, len(empty))):
+            self.cells[index] = letter
+        self._line_texts.clear()
+    
+    def rows(self) -> List[List[str]]:
+        """Retourne la grille au format de l'API (liste de lignes)."""
+        return [self.cells[row * self.size:(row + 1) * self.size] for row in range(self.size)]
+    
+
+# Cases de départ possibles (dans les limites) par (taille, longueur, direction), en bits
+_start_masks: Dict[Tuple[int, int, Step], int] = {}
+
+
+def start_mask(size: int, length: int, step: Step) -> int:
+    """Retourne le masque des cases d'où un mot de `length` lettres tient dans la grille."""
+    key = (size, length, step)
+    if key not in _start_masks:
+        row_start, row_end = start_range(size, length, step[0])
+        col_start, col_end = start_range(size, length, step[1])
+        row_bits = 0
+        if col_start < col_end:
+            row_bits = ((1 << (col_end - col_start)) - 1) << col_start
+        mask = 0
+        for row in range(row_start, row_end):
+            mask |= row_bits << (row * size)
+        _start_masks[key] = mask
+    return _start_masks[key]
+    
+
+def iter_bits(mask: int) -> List[int]:
+    """Retourne les indices des bits à 1, du plus faible au plus fort."""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+    
+
+class BitBoard(ListBoard):
+    """
+    Grille à plat doublée d'un bitboard par lettre et d'un bitboard des cases occupées.
+    
+    Le bit `ligne * taille + colonne` représente une case. Une case est
+    compatible avec une lettre si elle est libre ou porte déjà cette lettre ;
+    décaler ce masque de `i * pas` aligne la i-ème lettre sur la case de
+    départ, et le ET des masques décalés donne toutes les positions légales.
+    """
+    
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.full = (1 << (size * size)) - 1
+        self.occupied = 0
+        self.letter_bits: Dict[str, int] = {}
+    
+    def candidates(self, text: str, steps: List[Step]) -> Candidates:
+        """
+        Compte toutes les positions de départ légales d'un texte, par direction.
+        
+        Returns:
+            Tuple (nombre de positions par direction, fonction retournant les
+            cases de départ d'une direction, dans l'ordre de lecture)
+        """
+        empty = self.full & ~self.occupied
+        compatible = {letter: empty | self.letter_bits.get(letter, 0) for letter in set(text)}
+        
+        masks = []
+        for dr, dc in steps:
+            offset = dr * self.size + dc
+            mask = start_mask(self.size, len(text), (dr, dc))
+            for i, letter in enumerate(text):
+                if not mask:
+                    break
+                shift = i * offset
+                mask &= compatible[letter] >> shift if shift >= 0 else compatible[letter] << -shift
+            masks.append(mask)
+        
+        def starts(index: int) -> List[int]:
+            return iter_bits(masks[index])
+        
+        return [bin(mask).count('1') for mask in masks], starts
+    
+    def write(self, text: str, start: int, step: Step) -> List[int]:
+        filled = super().write(text, start, step)
+        for index in filled:
+            bit = 1 << index
+            self.occupied |= bit
+            letter = self.cells[index]
+            self.letter_bits[letter] = self.letter_bits.get(letter, 0) | bit
+        return filled
+    
+    def erase(self, filled: List[int]):
+        for index in filled:
+            bit = 1 << index
+            self.occupied &= ~bit
+            self.letter_bits[self.cells[index]] &= ~bit
+        super().erase(filled)
+    
+    def snapshot(self):
+        return list(self.cells), self.occupied, dict(self.letter_bits)
+    
+    def restore(self, snapshot):
+        cells, self.occupied, letter_bits = snapshot
+        self.letter_bits = dict(letter_bits)
+        super().restore(cells)
+    
+    def fill(self, rng, vectorized: bool = False):
+        super().fill(rng, vectorized)
+        self.occupied = self.full
+        self.letter_bits = {}
+        for index, letter in enumerate(self.cells):
+            self.letter_bits[letter] = self.letter_bits.get(letter, 0) | (1 << index)
+    
+
+class NumpyBoard:
+    """Grille stockée dans un tableau `uint8` (0 = case vide, sinon code de la lettre)."""
+    
+    def __init__(self, size: int):
+        if np is None:
+            raise ImportError("NumPy n'est pas installé (pip install numpy)")
+        self.size = size
+        self.grid = np.zeros((size, size), dtype=np.uint8)
+        # Table des lettres : le code d'une lettre est sa position dans la table
+        self.letters = [' ']
+        self.codes: Dict[str, int] = {}
+    
+    def _code(self, letter: str) -> int:
+        if letter not in self.codes:
+            if len(self.letters) > 255:
+                raise ValueError("Trop de lettres différentes pour une grille uint8")
+            self.codes[letter] = len(self.letters)
+            self.letters.append(letter)
+        return self.codes[letter]
+    
+    def candidates(self, text: str, steps: List[Step]) -> Candidates:
+        """
+        Compte toutes les positions de départ légales d'un texte, par direction.
+        
+        Pour chaque lettre, le masque des cases compatibles (vides ou portant
+        cette lettre) est décalé par découpage le long de la direction ; le
+        ET de ces masques donne toutes les cases de départ d'un coup.
+        
+        Returns:
+            Tuple (nombre de positions par direction, fonction retournant les
+            cases de départ d'une direction, dans l'ordre de lecture)
+        """
+        size = self.size
+        length = len(text)
+        empty = self.grid == 0
+        compatible = {letter: empty | (self.grid == self.codes[letter]) if letter in self.codes else empty
+                      for letter in set(text)}
+        
+        masks = []
+        for dr, dc in steps:
+            row_start, row_end = start_range(size, length, dr)
+            col_start, col_end = start_range(size, length, dc)
+            mask = np.zeros((size, size), dtype=bool)
+            if row_start < row_end and col_start < col_end:
+                window = None
+                for i, letter in enumerate(text):
+                    part = compatible[letter][row_start + i * dr:row_end + i * dr,
+                                              col_start + i * dc:col_end + i * dc]
+                    window = part.copy() if window is None else window & part
+                mask[row_start:row_end, col_start:col_end] = window
+            masks.append(mask)
+        
+        def starts(index: int) -> List[int]:
+            return np.flatnonzero(masks[index]).tolist()
+        
+        return [int(np.count_nonzero(mask)) for mask in masks], starts
+    
+    def write(self, text: str, start: int, step: Step) -> List[int]:
+        """
+        Écrit un texte à partir d'une case.
+        
+        Returns:
+            Indices des cases auparavant vides (pour le retour arrière)
+        """
+        flat = self.grid.reshape(-1)
+        indices = np.array(segment(self.size, start, step, len(text)))
+        filled = indices[flat[indices] == 0].tolist()
+        flat[indices] = [self._code(letter) for letter in text]
+        return filled
+    
+    def erase(self, filled: List[int]):
+        """Vide à nouveau des cases remplies par `write`."""
+        self.grid.reshape(-1)[filled] = 0
+    
+    def snapshot(self):
+        return self.grid.copy()
+    
+    def restore(self, snapshot):
+        self.grid[...] = snapshot
+    
+    def fill(self, rng, vectorized: bool = False):
+        """
+        Remplit les cases vides avec des lettres aléatoires.
+        
+        Args:
+            rng: Générateur aléatoire du générateur de grille
+            vectorized: Tirer toutes les lettres en une fois avec NumPy (plus
+                rapide, mais la grille diffère de celle de `ListBoard`)
+        """
+        flat = self.grid.reshape(-1)
+        empty = np.flatnonzero(flat == 0)
+        codes = np.array([self._code(letter) for letter in LETTERS], dtype=np.uint8)
+        if vectorized:
+            draws = np.random.default_rng(rng.getrandbits(64)).integers(0, len(LETTERS), size=len(empty))
+            flat[empty] = codes[draws]
+        else:
+            # Mêmes tirages que ListBoard, dans le même ordre
+            flat[empty] = [self.codes[letter] for letter in rng.letters(LETTERS, len(empty))]
+    
+    def rows(self) -> List[List[str]]:
+        """Retourne la grille au format de l'API (liste de lignes)."""
+        return np.array(self.letters, dtype=object)[self.grid].tolist()
+    
+
+# Taille à partir de laquelle NumPy devient plus rapide que les bitboards
+NUMPY_MIN_SIZE = 48
+
+BOARDS = {
+    'python': ListBoard,
+    'bits': BitBoard,
+    'numpy': NumpyBoard,
+}
+
+
+def create_board(engine: str, size: int):
+    """
+    Crée le plateau d'un moteur.
+    
+    Args:
+        engine: 'python', 'bits', 'numpy' ou 'auto' (bitboards, ou NumPy s'il
+            est installé pour les très grandes grilles)
+        size: Taille de la grille
+    """
+    if engine == 'auto':
+        engine = 'numpy' if np is not None and size >= NUMPY_MIN_SIZE else 'bits'
+    if engine not in BOARDS:
+        raise ValueError(f"Moteur de grille inconnu: {engine}")
+    return BOARDS[engine](size)
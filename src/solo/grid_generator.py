@@ -2,9 +2,16 @@
 Générateur de grilles de mots mêlés avec support de seed.
 Mode Solo.
 """
+import math
 import random
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
+import time
+from concurrent.futures import Executor
+from typing import Iterator, List, Tuple, Dict, Optional
+from dataclasses import dataclass, replace
+from src.prng import PCG32, DEFAULT_STREAM
+from src.solo.grid_boards import create_board, segment, segment_between, DIRECTIONS, LETTERS
+from src.solo.grid_quality import direction_count, score_grid
+from src.solo.grid_scanner import WordScanner, word_endpoints
 
 
 @dataclass
@@ -14,166 +21,485 @@ class GridConfig:
     num_words: int
     allow_diagonal: bool
     allow_reverse: bool
+    solver: bool = False  # Recherche avec retour arrière : tous les mots sont placés
+    solver_budget: int = 5000  # Nombre maximal de placements essayés par le solveur
+    candidates: int = 1  # Grilles candidates générées ; la mieux notée est gardée
+    
+
+@dataclass
+class GenerationStats:
+    """Statistiques de la dernière génération de grille."""
+    requested: int = 0
+    placed: int = 0
+    attempts: int = 0  # Grilles essayées (mode aléatoire)
+    nodes: int = 0  # Placements essayés (solveur)
+    backtracks: int = 0
+    repaired: int = 0  # Lettres de remplissage retirées pour qu'un mot reste unique
+    spread: int = 0  # Directions différentes (sens compris) parmi les mots placés
+    solver: bool = False
+    candidates: int = 1  # Grilles candidates comparées
+    quality: float = 0.0  # Note de la grille retenue (voir `grid_quality`)
+    time_ms: float = 0.0
+    deadline_hit: bool = False  # Budget de temps épuisé : meilleure grille trouvée jusque-là
+    
+    @property
+    def complete(self) -> bool:
+        """Indique si tous les mots demandés ont été placés."""
+        return self.requested > 0 and self.placed == self.requested
     
 
 class GridGenerator:
     """Génère des grilles de mots mêlés aléatoires."""
     
-    DIRECTIONS = {
-        'horizontal': (0, 1),
-        'vertical': (1, 0),
-        'diagonal_down': (1, 1),
-        'diagonal_up': (-1, 1),
-        'horizontal_reverse': (0, -1),
-        'vertical_reverse': (-1, 0),
-        'diagonal_down_reverse': (-1, -1),
-        'diagonal_up_reverse': (1, -1)
+    # Version de l'algorithme : à incrémenter dès qu'un même seed donne une autre grille
+    # (invalide les grilles pré-générées et mises en cache)
+    VERSION = 9
+    
+    DIRECTIONS = DIRECTIONS
+    
+    # Nombre maximal de passes pour casser les occurrences en trop des mots
+    MAX_REPAIR_ROUNDS = 8
+    
+    # Part des mots demandés à placer avant que le budget de temps puisse interrompre la génération
+    MIN_DEADLINE_PLACEMENT = 0.75
+    
+    # Directions de placement et leur poids (diagonales 4 fois plus fréquentes si activées)
+    PLACEMENT_WEIGHTS = {
+        'horizontal': 1,
+        'vertical': 1,
+        'diagonal_down': 4,
+        'diagonal_up': 4
     }
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, engine: str = 'auto', vectorized_fill: bool = False,
+                 stream: int = 0):
         """
         Initialise le générateur.
         
         Args:
             seed: Seed pour la génération aléatoire (reproductibilité)
+            engine: Représentation de la grille : 'python', 'bits', 'numpy'
+                (optionnel) ou 'auto' ; à seed égal, tous les moteurs donnent
+                la même grille
+            vectorized_fill: Remplir les cases vides en un seul tirage NumPy
+                (plus rapide, mais la grille ne correspond plus au seed des
+                autres moteurs : à réserver aux grilles non partagées)
+            stream: Suite de tirages du seed (une par grille candidate)
         """
         self.seed = seed if seed is not None else random.randint(0, 999999)
-        self.rng = random.Random(self.seed)
-        
-    def generate_grid(self, config: GridConfig, word_list: List[str]) -> Tuple[List[List[str]], List[Dict]]:
+        # Générateur propre : mêmes tirages quelle que soit la version de Python
+        self.rng = PCG32(self.seed, DEFAULT_STREAM + stream)
+        self.engine = engine
+        self.vectorized_fill = vectorized_fill
+        self.stats = GenerationStats()
+        self._deadline: Optional[float] = None
+        self._deadline_min_placed = 0  # Mots à placer avant de respecter le budget de temps
+    
+    def generate_grid(self, config: GridConfig, word_list: List[str], deadline_ms: Optional[float] = None,
+                      executor: Optional[Executor] = None) -> Tuple[List[List[str]], List[Dict]]:
         """
         Génère une grille de mots mêlés.
         
+        Les tentatives sont comparées selon le nombre de mots placés, puis la
+        variété des directions ; la meilleure est gardée. Avec
+        `config.candidates` > 1, plusieurs grilles complètes sont générées
+        (une suite de tirages chacune) et la mieux notée est retournée.
+        
         Args:
             config: Configuration de la grille
-            word_list: Liste de mots à placer
-            
+            word_list: Liste de mots à placer, ou dictionnaire indexé par
+                longueur (méthode `sample`) pour éviter de filtrer toute la liste
+            deadline_ms: Budget de temps en millisecondes (None = sans limite).
+                La recherche est la même qu'en l'absence de budget : s'il
+                suffit, la grille est celle du seed ; sinon la meilleure grille
+                trouvée jusque-là est retournée et `stats.deadline_hit` est vrai.
+                Le budget n'est respecté qu'une fois `MIN_DEADLINE_PLACEMENT`
+                des mots placés : une grille n'est jamais presque vide
+            executor: Pool de processus où générer les candidates en parallèle
+                (`word_list` doit alors être une simple liste de mots)
+        
         Returns:
             Tuple contenant la grille et les informations des mots placés
         """
+        if config.candidates > 1:
+            return self._race(config, word_list, deadline_ms, executor)
+        
+        start_time = time.perf_counter()
+        self.stats = GenerationStats(solver=config.solver)
+        self._deadline = start_time + deadline_ms / 1000 if deadline_ms is not None else None
+        
         # Filtrer les mots qui sont trop longs pour tenir dans la grille
         max_word_length = config.size
-        suitable_words = [w for w in word_list if len(w) <= max_word_length and len(w) >= 3]
+        if hasattr(word_list, 'sample'):
+            # Dictionnaire indexé par longueur : tirage sans parcourir la liste
+            suitable_words = None
+            available_words = word_list.count_between(3, max_word_length)
+        else:
+            suitable_words = [w for w in word_list if len(w) <= max_word_length and len(w) >= 3]
+            available_words = len(suitable_words)
         
-        if len(suitable_words) < config.num_words:
+        if available_words < config.num_words:
             # Ajuster le nombre de mots si pas assez de mots appropriés
-            config.num_words = max(3, len(suitable_words))  # Au minimum 3 mots
+            config.num_words = max(3, available_words)  # Au minimum 3 mots
+        self._deadline_min_placed = math.ceil(config.num_words * self.MIN_DEADLINE_PLACEMENT)
         
-        # Essayer de générer une grille valide (avec au moins 50% des mots demandés)
+        # Essayer de placer tous les mots ; garder la meilleure tentative sinon
         max_grid_attempts = 5
-        min_required_words = max(3, config.num_words // 2)
+        best = None
         
         for attempt in range(max_grid_attempts):
-            # Initialiser la grille avec des espaces vides
-            grid = [[' ' for _ in range(config.size)] for _ in range(config.size)]
+            if attempt and self._out_of_time(best[0][0]):
+                break
+            self.stats.attempts += 1
+            
+            board = create_board(self.engine, config.size)
             placed_words = []
             
             # Sélectionner les mots à utiliser
-            words_to_place = self.rng.sample(suitable_words, min(config.num_words, len(suitable_words)))
+            if suitable_words is None:
+                words_to_place = word_list.sample(config.num_words, 3, max_word_length, self.rng)
+            else:
+                words_to_place = self.rng.sample(suitable_words, min(config.num_words, len(suitable_words)))
             words_to_place.sort(key=len, reverse=True)  # Placer les plus longs d'abord
+            self.stats.requested = len(words_to_place)
             
-            # Placer chaque mot
-            for word in words_to_place:
-                word = word.upper()
-                placement = self._try_place_word(grid, word, config)
-                if placement:
-                    placed_words.append(placement)
+            if config.solver:
+                placed_words = self._solve(board, [word.upper() for word in words_to_place], config)
+            else:
+                # Placer chaque mot
+                for word in words_to_place:
+                    if self._out_of_time(len(placed_words)):
+                        break
+                    word = word.upper()
+                    placement = self._try_place_word(board, word, config)
+                    if placement:
+                        placed_words.append(placement)
             
-            # Vérifier si assez de mots ont été placés
-            if len(placed_words) >= min_required_words:
-                # Remplir les cases vides avec des lettres aléatoires
-                self._fill_empty_cells(grid)
-                return grid, placed_words
-        
-        # Si après plusieurs tentatives, pas assez de mots, retourner ce qu'on a
-        # (ce cas devrait être rare avec les filtres en place)
+            # Un mot répété par les mots placés (contenu dans un autre) ne compte pas :
+            # la grille est rejetée au profit d'une autre tentative
+            repeated = WordScanner(self._separable_words([info['word'] for info in placed_words])).ambiguous(
+                board.rows()
+            )
+            score = (len(placed_words) - len(repeated), self._spread(placed_words))
+            if best is None or score > best[0]:
+                best = (score, board, placed_words)
+            # Le solveur a déjà exploré toutes les combinaisons permises par son budget
+            if config.solver or score[0] == len(words_to_place):
+                break
+        
+        _, board, placed_words = best
         if placed_words:
-            self._fill_empty_cells(grid)
-            return grid, placed_words
+            # Remplir les cases vides avec des lettres aléatoires
+            board.fill(self.rng, self.vectorized_fill)
+            grid = board.rows()
+        else:
+            # Cas extrême : générer une grille minimale avec des mots courts garantis
+            if suitable_words is None:
+                suitable_words = word_list.sample(config.num_words, 3, config.size // 2, self.rng)
+            grid, placed_words = self._generate_fallback_grid(config, suitable_words)
         
-        # Cas extrême : générer une grille minimale avec des mots courts garantis
-        return self._generate_fallback_grid(config, suitable_words)
+        placed_words = self._make_unambiguous(grid, placed_words)
+        self.stats.placed = len(placed_words)
+        self.stats.spread = self._spread(placed_words)
+        self.stats.quality = score_grid(config.size, placed_words, self.stats.requested,
+                                        direction_count(config.allow_diagonal, config.allow_reverse),
+                                        self.stats.repaired).total
+        self.stats.time_ms = (time.perf_counter() - start_time) * 1000
+        return grid, placed_words
+    
+    def _race(self, config: GridConfig, word_list: List[str], deadline_ms: Optional[float],
+              executor: Optional[Executor]) -> Tuple[List[List[str]], List[Dict]]:
+        """
+        Génère `config.candidates` grilles et retourne la mieux notée.
+        
+        La candidate k utilise la k-ième suite de tirages du seed : le
+        résultat est le même en série ou en parallèle, et la candidate 0 est
+        la grille qu'aurait donnée une génération simple. Chaque candidate
+        dispose du budget de temps entier, comme dans un pool de processus.
+        """
+        start_time = time.perf_counter()
+        single = replace(config, candidates=1)
+        streams = range(config.candidates)
+        
+        if executor is not None:
+            futures = [executor.submit(_generate_candidate, self.seed, stream, self.engine, self.vectorized_fill,
+                                       single, word_list, deadline_ms) for stream in streams]
+            results = [future.result() for future in futures]
+        else:
+            results = [_generate_candidate(self.seed, stream, self.engine, self.vectorized_fill,
+                                           single, word_list, deadline_ms) for stream in streams]
+        
+        # Meilleure note ; à égalité, la première candidate
+        best = max(range(len(results)), key=lambda index: (results[index][2].quality, -index))
+        grid, placed_words, self.stats, config.num_words = results[best]
+        self.stats.candidates = len(results)
+        self.stats.deadline_hit = any(stats.deadline_hit for _, _, stats, _ in results)
+        self.stats.time_ms = (time.perf_counter() - start_time) * 1000
+        return grid, placed_words
+    
+    def _out_of_time(self, placed: int) -> bool:
+        """
+        Indique si le budget de temps de la génération en cours est épuisé.
+        
+        Args:
+            placed: Mots placés dans la meilleure grille trouvée jusque-là ;
+                en dessous du minimum, la génération continue malgré le budget
+        """
+        if placed < self._deadline_min_placed:
+            return False
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            self.stats.deadline_hit = True
+            return True
+        return False
+    
+    @staticmethod
+    def _spread(placed_words: List[Dict]) -> int:
+        """Nombre de directions différentes (sens compris) parmi les mots placés."""
+        return len({(info['direction'], info.get('reversed', False)) for info in placed_words})
+    
+    def _placement_directions(self, config: GridConfig) -> Tuple[List[str], List[int]]:
+        """Retourne les directions de placement autorisées et leur poids."""
+        directions = ['horizontal', 'vertical']
+        if config.allow_diagonal:
+            directions.extend(['diagonal_down', 'diagonal_up'])
+        return directions, [self.PLACEMENT_WEIGHTS[name] for name in directions]
+    
+    def _write_word(self, board, word: str, text: str, start: int, direction_name: str,
+                    is_reversed: bool) -> Tuple[Dict, List[int]]:
+        """
+        Écrit un texte dans la grille.
+        
+        Returns:
+            Tuple (informations du mot placé, indices des cases auparavant vides)
+        """
+        filled = board.write(text, start, self.DIRECTIONS[direction_name])
+        row, col = divmod(start, board.size)
+        info = {
+            'word': word,  # On retourne toujours le mot original
+            'start': (row, col),
+            'direction': direction_name,
+            'length': len(word),
+            'reversed': is_reversed
+        }
+        return info, filled
     
-    def _try_place_word(self, grid: List[List[str]], word: str, config: GridConfig, max_attempts: Optional[int] = None) -> Optional[Dict]:
+    def _try_place_word(self, board, word: str, config: GridConfig) -> Optional[Dict]:
         """
-        Tente de placer un mot dans la grille.
+        Place un mot sur l'une de ses positions légales, tirée au hasard.
+        
+        Toutes les positions possibles sont énumérées : un échec est détecté
+        immédiatement, sans tentatives aléatoires rejetées.
         
         Args:
-            grid: La grille de jeu
+            board: La grille en cours de génération (voir `grid_boards`)
             word: Le mot à placer
             config: Configuration de la grille
-            max_attempts: Nombre maximum de tentatives
-            
+        
         Returns:
             Dictionnaire avec les infos du mot placé, ou None si échec
         """
-        # Adapter le nombre de tentatives à la taille de la grille
-        if max_attempts is None:
-            max_attempts = max(200, config.size * 20)
+        directions, weights = self._placement_directions(config)
+        steps = [self.DIRECTIONS[name] for name in directions]
         
-        # Déterminer les directions autorisées (en donnant beaucoup plus de poids aux diagonales si activées)
-        available_directions = ['horizontal', 'vertical']
-        if config.allow_diagonal:
-            # Ajouter les diagonales plusieurs fois pour augmenter significativement leur fréquence (ratio 4:1)
-            available_directions.extend(['diagonal_down', 'diagonal_up'] * 4)
-        
-        # Décider si on inverse le mot (60% de chance si allow_reverse est activé)
-        word_to_place = word
-        is_reversed = False
-        if config.allow_reverse and self.rng.random() < 0.6:
-            word_to_place = word[::-1]  # Inverser les lettres
-            is_reversed = True
-        
-        for _ in range(max_attempts):
-            # Choisir une position et direction aléatoires
-            row = self.rng.randint(0, config.size - 1)
-            col = self.rng.randint(0, config.size - 1)
-            direction_name = self.rng.choice(available_directions)
-            direction = self.DIRECTIONS[direction_name]
+        # Décider si on inverse le mot (60% de chance si allow_reverse est activé),
+        # puis essayer l'autre sens si aucune position n'existe
+        orientations = [False]
+        if config.allow_reverse:
+            orientations = [True, False] if self.rng.below(5) < 3 else [False, True]
+        
+        for is_reversed in orientations:
+            word_to_place = word[::-1] if is_reversed else word
+            counts, starts = board.candidates(word_to_place, steps)
+            total = sum(weight * count for weight, count in zip(weights, counts))
+            if total == 0:
+                continue
             
-            # Vérifier si le mot peut être placé
-            if self._can_place_word(grid, word_to_place, row, col, direction, config.size):
-                # Placer le mot
-                self._place_word(grid, word_to_place, row, col, direction)
-                return {
-                    'word': word,  # On retourne toujours le mot original
-                    'start': (row, col),
-                    'direction': direction_name,
-                    'length': len(word),
-                    'reversed': is_reversed
-                }
+            # Un seul tirage : direction au prorata (poids × positions), puis position uniforme
+            pick = self.rng.below(total)
+            for index, (weight, count) in enumerate(zip(weights, counts)):
+                if pick < weight * count:
+                    break
+                pick -= weight * count
+            
+            start = starts(index)[pick // weight]
+            info, _ = self._write_word(board, word, word_to_place, start, directions[index], is_reversed)
+            return info
         
         return None
     
-    def _can_place_word(self, grid: List[List[str]], word: str, row: int, col: int, 
-                       direction: Tuple[int, int], grid_size: int) -> bool:
-        """Vérifie si un mot peut être placé à une position donnée."""
-        dr, dc = direction
+    def _solve(self, board, words: List[str], config: GridConfig) -> List[Dict]:
+        """
+        Place tous les mots par recherche avec retour arrière.
         
-        for i, letter in enumerate(word):
-            new_row = row + i * dr
-            new_col = col + i * dc
-            
-            # Vérifier les limites
-            if not (0 <= new_row < grid_size and 0 <= new_col < grid_size):
+        Le mot ayant le moins de positions légales est placé en premier ; dès
+        qu'un mot restant n'a plus aucune position, la branche est abandonnée
+        (vérification en avant). Après chaque placement, les lignes des cases
+        remplies sont relues : une branche où un mot apparaît plusieurs fois
+        est abandonnée aussitôt (les lettres écrites ne changent plus dans la
+        branche, l'occurrence en trop y resterait). Les positions d'un mot sont essayées dans un
+        ordre aléatoire qui respecte le poids des directions. Le budget compte
+        les placements essayés, pas le temps : le résultat ne dépend que du seed
+        (sauf si le budget de temps de `generate_grid` est épuisé avant).
+        
+        Args:
+            board: La grille en cours de génération, remplie en place
+            words: Mots à placer (en majuscules)
+            config: Configuration de la grille
+        
+        Returns:
+            Informations des mots placés (le plus grand placement partiel
+            rencontré si le budget est épuisé)
+        """
+        directions, weights = self._placement_directions(config)
+        steps = [self.DIRECTIONS[name] for name in directions]
+        orientations = (False, True) if config.allow_reverse else (False,)
+        placed: List[Dict] = []
+        best = ([], board.snapshot())
+        scanner = WordScanner(self._separable_words(words))
+        # Copie à plat des lettres écrites et nombre d'occurrences de chaque mot
+        cells = [' '] * (board.size * board.size)
+        occurrences: Dict[str, int] = {}
+        
+        def candidate_order(found: List[Tuple]) -> Iterator[Tuple[int, int, bool, str]]:
+            # Tirage pondéré sans remise, positions matérialisées à la demande
+            groups = [[weights[index] * count, weights[index], None, starts, index, is_reversed, text]
+                      for is_reversed, text, counts, starts in found
+                      for index, count in enumerate(counts) if count]
+            total = sum(group[0] for group in groups)
+            while total > 0:
+                pick = self.rng.below(total)
+                for group in groups:
+                    if pick < group[0]:
+                        break
+                    pick -= group[0]
+                group_total, weight, positions, starts, index, is_reversed, text = group
+                if positions is None:
+                    positions = group[2] = starts(index)
+                # Retirer la position tirée (échange avec la dernière)
+                position = pick // weight
+                start = positions[position]
+                positions[position] = positions[-1]
+                positions.pop()
+                group[0] -= weight
+                total -= weight
+                yield index, start, is_reversed, text
+        
+        def search(remaining: List[str]) -> bool:
+            nonlocal best
+            if not remaining:
+                # Vérification finale sur toute la grille (les placements ont déjà été contrôlés)
+                return not scanner.ambiguous(board.rows())
+            if self._out_of_time(len(best[0])):
                 return False
             
-            # Vérifier si la case est vide ou contient la même lettre
-            current = grid[new_row][new_col]
-            if current != ' ' and current != letter:
-                return False
+            # Choisir le mot le plus contraint (le plus long en cas d'égalité)
+            chosen = None
+            for position, word in enumerate(remaining):
+                found = []
+                total = 0
+                for is_reversed in orientations:
+                    text = word[::-1] if is_reversed else word
+                    counts, starts = board.candidates(text, steps)
+                    found.append((is_reversed, text, counts, starts))
+                    total += sum(counts)
+                if total == 0:
+                    return False
+                if chosen is None or (total, -len(word)) < chosen[0]:
+                    chosen = ((total, -len(word)), position, found)
+            
+            _, position, found = chosen
+            word = remaining[position]
+            rest = remaining[:position] + remaining[position + 1:]
+            
+            for index, start, is_reversed, text in candidate_order(found):
+                if self.stats.nodes >= config.solver_budget or self._out_of_time(len(best[0])):
+                    return False
+                self.stats.nodes += 1
+                
+                info, filled = self._write_word(board, word, text, start, directions[index], is_reversed)
+                for cell, letter in zip(segment(board.size, start, steps[index], len(text)), text):
+                    cells[cell] = letter
+                # Nouvelles occurrences : elles passent forcément par une case qui vient d'être remplie
+                appeared = scanner.count_through(cells, board.size, filled) if filled else {}
+                for found_word, count in appeared.items():
+                    occurrences[found_word] = occurrences.get(found_word, 0) + count
+                
+                if all(occurrences[found_word] == 1 for found_word in appeared):
+                    placed.append(info)
+                    if len(placed) > len(best[0]):
+                        best = (list(placed), board.snapshot())
+                    if search(rest):
+                        return True
+                    placed.pop()
+                
+                # Retour arrière
+                for found_word, count in appeared.items():
+                    occurrences[found_word] -= count
+                for cell in filled:
+                    cells[cell] = ' '
+                board.erase(filled)
+                self.stats.backtracks += 1
+            
+            return False
         
-        return True
+        if search(list(words)):
+            return placed
+        board.restore(best[1])
+        return best[0]
+    
+    @staticmethod
+    def _separable_words(words: List[str]) -> List[str]:
+        """Retourne les mots qui ne sont pas contenus dans un autre (ni à l'envers)."""
+        return [word for word in words
+                if not any(other != word and (word in other or word[::-1] in other) for other in words)]
     
-    def _place_word(self, grid: List[List[str]], word: str, row: int, col: int, 
-                   direction: Tuple[int, int]):
-        """Place un mot dans la grille."""
-        dr, dc = direction
+    def _make_unambiguous(self, grid: List[List[str]], placed_words: List[Dict]) -> List[Dict]:
+        """
+        Garantit que chaque mot à trouver n'apparaît qu'une fois dans la grille.
+        
+        Toutes les occurrences sont trouvées en une passe (`WordScanner`). Une
+        occurrence en trop créée par le remplissage est cassée en retirant une
+        de ses lettres de remplissage ; un mot répété par les mots placés
+        eux-mêmes (mot contenu dans un autre) est retiré de la liste.
         
-        for i, letter in enumerate(word):
-            new_row = row + i * dr
-            new_col = col + i * dc
-            grid[new_row][new_col] = letter
+        Args:
+            grid: Grille remplie, modifiée en place
+            placed_words: Informations des mots placés
+        
+        Returns:
+            Informations des mots à trouver, chacun présent une seule fois
+        """
+        size = len(grid)
+        placed_cells = set()
+        expected = {}
+        for info in placed_words:
+            first, last = word_endpoints(info)
+            placed_cells.update(segment_between(size, first, last))
+            expected[info['word']] = {first, last}
+        
+        words = [info['word'] for info in placed_words]
+        for _ in range(self.MAX_REPAIR_ROUNDS):
+            ambiguous = WordScanner(words).ambiguous(grid)
+            if not ambiguous:
+                break
+            for word, occurrences in ambiguous.items():
+                for first, last in occurrences:
+                    if {first, last} == expected[word]:
+                        continue
+                    free = [cell for cell in segment_between(size, first, last) if cell not in placed_cells]
+                    if not free:
+                        # Occurrence formée par les mots placés : le mot n'est plus à trouver
+                        words.remove(word)
+                        break
+                    row, col = divmod(self.rng.choice(free), size)
+                    grid[row][col] = self.rng.choice(LETTERS.replace(grid[row][col], ''))
+                    self.stats.repaired += 1
+        else:
+            # Dernier recours : retirer les mots encore présents plusieurs fois
+            words = [word for word in words if word not in WordScanner(words).ambiguous(grid)]
+        
+        kept = set(words)
+        return [info for info in placed_words if info['word'] in kept]
     
     def _fill_empty_cells(self, grid: List[List[str]]):
         """Remplit les cases vides avec des lettres aléatoires."""
@@ -223,3 +549,18 @@ class GridGenerator:
     def get_seed(self) -> int:
         """Retourne le seed utilisé pour la génération."""
         return self.seed
+    
+
+def _generate_candidate(seed: int, stream: int, engine: str, vectorized_fill: bool, config: GridConfig,
+                        word_list: List[str], deadline_ms: Optional[float]):
+    """
+    Génère une grille candidate (fonction de module : utilisable dans un autre processus).
+    
+    Chaque candidate travaille sur sa propre copie de la configuration, en
+    série comme dans un autre processus ; le nombre de mots retenu est
+    retourné avec la grille.
+    """
+    config = replace(config)
+    generator = GridGenerator(seed, engine, vectorized_fill, stream)
+    grid, placed_words = generator.generate_grid(config, word_list, deadline_ms)
+    return grid, placed_words, generator.stats, config.num_words
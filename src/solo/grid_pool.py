@@ -0,0 +1,177 @@
+"""
+Réserve de grilles prêtes à jouer, remplie en arrière-plan.
+Mode Solo (partagé avec le serveur multijoueur).
+
+Pour chaque (langue, version du dictionnaire, niveau) demandé, la réserve
+garde quelques grilles générées d'avance, avec un seed tiré du catalogue des
+meilleurs seeds s'il couvre le niveau (aléatoire sinon). Un thread
+de fond la complète dès qu'elle passe sous un seuil bas : démarrer une
+partie revient alors à retirer une grille, sans attendre la génération.
+"""
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+PoolKey = Tuple[str, str, int]
+PooledGrid = Tuple[int, List[List[str]], List[Dict]]
+
+
+class GridPool:
+    """Réserve de grilles par niveau et par langue, complétée par un thread de fond."""
+    
+    def __init__(self, capacity: int = 4, low_water: int = 2, max_levels: int = 16):
+        """
+        Initialise la réserve.
+        
+        Args:
+            capacity: Nombre de grilles prêtes visé par niveau
+            low_water: Seuil sous lequel la réserve d'un niveau est complétée
+            max_levels: Nombre de niveaux suivis (les moins récemment demandés sont oubliés)
+        """
+        self.capacity = capacity
+        self.low_water = low_water
+        self.max_levels = max_levels
+        self._grids: 'OrderedDict[PoolKey, Deque[PooledGrid]]' = OrderedDict()
+        self._indexes: Dict[PoolKey, object] = {}
+        self._refilling: Dict[PoolKey, bool] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+    
+    @staticmethod
+    def _key(word_index, level: int) -> Optional[PoolKey]:
+        """Clé de la réserve d'un niveau (None si le dictionnaire n'est pas versionné)."""
+        language = getattr(word_index, 'language', None)
+        version = getattr(word_index, 'version', None)
+        if not language or not version:
+            return None
+        return language, version, level
+    
+    def _track(self, key: PoolKey, word_index):
+        """Suit un niveau (appelé sous le verrou) et réveille le thread si besoin."""
+        if key not in self._grids:
+            self._grids[key] = deque()
+            self._indexes[key] = word_index
+        self._grids.move_to_end(key)
+        while len(self._grids) > self.max_levels:
+            old_key, _ = self._grids.popitem(last=False)
+            self._indexes.pop(old_key, None)
+            self._refilling.pop(old_key, None)
+        
+        if len(self._grids[key]) < self.low_water:
+            self._refilling[key] = True
+        if self._refilling.get(key):
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="grid-pool", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def warm(self, word_index, levels: Iterable[int]):
+        """
+        Prépare la réserve de plusieurs niveaux (sans attendre).
+        
+        Args:
+            word_index: Dictionnaire indexé de la langue
+            levels: Numéros des niveaux
+        """
+        with self._condition:
+            for level in levels:
+                key = self._key(word_index, level)
+                if key is not None:
+                    self._track(key, word_index)
+    
+    def pop(self, word_index, level: int) -> Optional[PooledGrid]:
+        """
+        Retire une grille prête d'un niveau.
+        
+        Le niveau suivant est aussi préparé, le joueur y passant souvent ensuite.
+        
+        Args:
+            word_index: Dictionnaire indexé de la langue
+            level: Numéro du niveau
+        
+        Returns:
+            Tuple (seed, grille, informations des mots placés), ou None si la
+            réserve est vide (la grille doit alors être générée directement)
+        """
+        key = self._key(word_index, level)
+        if key is None:
+            return None
+        with self._condition:
+            grids = self._grids.get(key)
+            entry = grids.popleft() if grids else None
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._track(key, word_index)
+            next_key = self._key(word_index, level + 1)
+            self._track(next_key, word_index)
+            self._grids.move_to_end(key)
+            return entry
+    
+    def _next_job(self) -> Tuple[PoolKey, object]:
+        """Attend un niveau à compléter (le plus récemment demandé d'abord)."""
+        with self._condition:
+            while True:
+                for key in reversed(self._grids):
+                    if self._refilling.get(key):
+                        return key, self._indexes[key]
+                self._condition.wait()
+    
+    def _run(self):
+        """Boucle du thread de remplissage."""
+        from src.solo.game_logic import GameLogic
+        from src.solo.grid_generator import GridGenerator
+        from src.solo.seed_catalog import get_seed_catalog
+        while True:
+            key, word_index = self._next_job()
+            try:
+                language, version, level = key
+                seed = get_seed_catalog().pick(language, level, version, GridGenerator.VERSION)
+                entry = GameLogic.build_level_grid(word_index, level, seed=seed, use_cache=False)
+            except Exception as e:
+                print(f"⚠ Réserve de grilles (niveau {key[2]}): {e}")
+                with self._condition:
+                    self._refilling.pop(key, None)
+                continue
+            
+            with self._condition:
+                grids = self._grids.get(key)
+                if grids is None:
+                    continue  # Niveau oublié entre-temps
+                if entry[2]:
+                    grids.append(entry)
+                    self.generated += 1
+                if len(grids) >= self.capacity or not entry[2]:
+                    self._refilling.pop(key, None)
+    
+    def stats(self) -> Dict:
+        """Retourne les compteurs de la réserve."""
+        with self._condition:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'generated': self.generated,
+                'ready': {f"{language}/{level}": len(grids)
+                          for (language, _, level), grids in self._grids.items()},
+            }
+    
+
+# Instance globale
+_grid_pool_instance = None
+_grid_pool_lock = threading.Lock()  # Création unique, même depuis plusieurs threads
+
+def get_grid_pool() -> GridPool:
+    """Retourne l'instance globale de la réserve de grilles."""
+    global _grid_pool_instance
+    if _grid_pool_instance is None:
+        with _grid_pool_lock:
+            if _grid_pool_instance is None:
+                _grid_pool_instance = GridPool()
+    return _grid_pool_instance
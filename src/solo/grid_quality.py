@@ -0,0 +1,115 @@
+"""
+Note de qualité d'une grille générée.
+Mode Solo.
+
+Une grille est jugée sur le nombre de mots placés, la variété des directions,
+la répartition des mots sur la surface, les croisements entre mots et les
+mots formés par accident au remplissage. Les cases des mots sont des masques
+de bits (comme `BitBoard`) : chevauchements et répartition par zone se
+comptent par ET et comptage de bits, sans parcourir les cases.
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, List
+from src.solo.grid_boards import DIRECTIONS, segment
+
+
+@dataclass
+class GridQuality:
+    """Composantes de la note d'une grille (chacune entre 0 et 1)."""
+    placement: float = 0.0  # Part des mots demandés effectivement placés
+    direction_mix: float = 0.0  # Entropie des directions (sens compris), normalisée
+    spatial_spread: float = 0.0  # Régularité de la répartition des lettres des mots par zone
+    overlap: float = 0.0  # Part des lettres de mots partagées par un croisement
+    accidental: int = 0  # Occurrences accidentelles cassées au remplissage
+    total: float = 0.0
+    
+
+# Poids des composantes dans la note totale
+QUALITY_WEIGHTS = {
+    'placement': 10.0,
+    'direction_mix': 1.0,
+    'spatial_spread': 1.0,
+    'overlap': 0.5,
+    'accidental': -0.1,
+}
+
+# Découpage de la grille en zones pour mesurer la répartition
+SPREAD_ZONES = 3
+
+# Masques des zones par taille de grille
+_zone_masks: Dict[int, List[int]] = {}
+
+
+def zone_masks(size: int) -> List[int]:
+    """Retourne les masques des SPREAD_ZONES × SPREAD_ZONES zones d'une grille."""
+    if size not in _zone_masks:
+        zones = min(SPREAD_ZONES, size)
+        masks = [0] * (zones * zones)
+        for row in range(size):
+            for col in range(size):
+                zone = (row * zones // size) * zones + col * zones // size
+                masks[zone] |= 1 << (row * size + col)
+        _zone_masks[size] = masks
+    return _zone_masks[size]
+    
+
+def direction_count(allow_diagonal: bool, allow_reverse: bool) -> int:
+    """Retourne le nombre de directions de placement permises (sens compris)."""
+    return (4 if allow_diagonal else 2) * (2 if allow_reverse else 1)
+    
+
+def score_grid(size: int, placed_words: List[Dict], requested: int, allowed_directions: int,
+               accidental: int = 0) -> GridQuality:
+    """
+    Calcule la note d'une grille.
+    
+    Args:
+        size: Taille de la grille
+        placed_words: Informations des mots placés (voir `GridGenerator`)
+        requested: Nombre de mots demandés
+        allowed_directions: Nombre de directions permises (sens compris)
+        accidental: Occurrences accidentelles cassées au remplissage
+    
+    Returns:
+        Composantes et note totale
+    """
+    quality = GridQuality(accidental=accidental)
+    if not placed_words:
+        return quality
+    quality.placement = len(placed_words) / requested if requested else 1.0
+    
+    # Variété des directions : entropie normalisée par le maximum atteignable
+    counts: Dict = {}
+    for info in placed_words:
+        key = (info['direction'], info.get('reversed', False))
+        counts[key] = counts.get(key, 0) + 1
+    classes = min(len(placed_words), allowed_directions)
+    if classes > 1:
+        entropy = sum(count / len(placed_words) * math.log(len(placed_words) / count)
+                      for count in counts.values())
+        quality.direction_mix = entropy / math.log(classes)
+    else:
+        quality.direction_mix = 1.0
+    
+    # Masques des cases des mots : croisements et répartition par zone
+    covered = 0
+    letters = 0
+    for info in placed_words:
+        row, col = info['start']
+        cells = segment(size, row * size + col, DIRECTIONS[info['direction']], info['length']) or []
+        for index in cells:
+            covered |= 1 << index
+        letters += len(cells)
+    covered_count = bin(covered).count('1')
+    quality.overlap = (letters - covered_count) / letters if letters else 0.0
+    
+    # Densité des lettres de mots par zone (les zones n'ont pas toutes la même surface)
+    densities = [bin(covered & mask).count('1') / bin(mask).count('1') for mask in zone_masks(size)]
+    mean = sum(densities) / len(densities)
+    if mean:
+        deviation = math.sqrt(sum((density - mean) ** 2 for density in densities) / len(densities))
+        quality.spatial_spread = max(0.0, 1.0 - deviation / mean)
+    
+    quality.total = sum(weight * getattr(quality, name) for name, weight in QUALITY_WEIGHTS.items())
+    return quality
@@ -0,0 +1,242 @@
+"""
+Recherche de tous les mots d'une liste dans une grille, dans les 8 directions.
+Mode Solo.
+
+Un automate d'Aho–Corasick est construit sur les mots et sur leurs inverses :
+parcourir chaque rangée, colonne et diagonale une seule fois, dans un seul
+sens, trouve alors toutes les occurrences dans les deux sens de lecture.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.solo.grid_boards import DIRECTIONS, line_order, line_table, segment
+
+
+Cell = Tuple[int, int]
+Occurrence = Tuple[Cell, Cell]  # (première lettre, dernière lettre) dans le sens de lecture
+
+# Rangées, colonnes et diagonales ; le sens inverse est couvert par les mots inversés
+SCAN_STEPS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+# Début (position dans le parcours) de la ligne de chaque case, par (taille, direction)
+_line_starts: Dict[Tuple[int, Tuple[int, int]], List[int]] = {}
+
+
+def _line_start_table(size: int, step: Tuple[int, int]) -> List[int]:
+    """Retourne, pour chaque case, la position du début de sa ligne dans le parcours."""
+    key = (size, step)
+    if key not in _line_starts:
+        order = line_order(size, step)[0]
+        separator = size * size
+        starts = [0] * separator
+        line_start = 0
+        for index, cell in enumerate(order):
+            if cell == separator:
+                line_start = index + 1
+            else:
+                starts[cell] = line_start
+        _line_starts[key] = starts
+    return _line_starts[key]
+    
+
+
+class WordScanner:
+    """Automate d'Aho–Corasick sur une liste de mots et leurs inverses."""
+    
+    def __init__(self, words: Iterable[str]):
+        """
+        Construit l'automate.
+        
+        Args:
+            words: Mots à rechercher (en majuscules)
+        """
+        self.words = list(dict.fromkeys(words))
+        
+        # Arbre des préfixes : motifs = (indice du mot, texte, inversé)
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, int, bool]]] = [[]]
+        for index, word in enumerate(self.words):
+            for is_reversed in (False, True):
+                state = 0
+                for letter in (word[::-1] if is_reversed else word):
+                    if letter not in goto[state]:
+                        goto.append({})
+                        outputs.append([])
+                        goto[state][letter] = len(goto) - 1
+                    state = goto[state][letter]
+                outputs[state].append((index, len(word), is_reversed))
+        
+        # Liens d'échec (parcours en largeur) : construction linéaire en la taille des mots
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for letter, child in goto[state].items():
+                fallback = fail[state]
+                while fallback and letter not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(letter, 0)
+                queue.append(child)
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+    
+    def scan(self, grid: List[List[str]]) -> Dict[str, List[Occurrence]]:
+        """
+        Trouve toutes les occurrences des mots dans la grille.
+        
+        Un palindrome lu dans les deux sens sur les mêmes cases ne compte
+        qu'une fois.
+        
+        Args:
+            grid: Grille (liste de lignes)
+        
+        Returns:
+            Occurrences de chaque mot, sous forme (première case, dernière case)
+        """
+        size = len(grid)
+        cells = [letter for row in grid for letter in row] + ['\n']
+        found: Dict[str, List[Occurrence]] = {word: [] for word in self.words}
+        seen = set()
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        
+        for step in SCAN_STEPS:
+            order, getter = line_order(size, step)
+            state = 0
+            for position, letter in enumerate(getter(cells)):
+                while state and letter not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(letter, 0)
+                for index, length, is_reversed in outputs[state]:
+                    first, last = order[position - length + 1], order[position]
+                    if is_reversed:
+                        first, last = last, first
+                    # Un palindrome est trouvé une fois dans chaque sens
+                    segment = (index, min(first, last), max(first, last))
+                    if segment in seen:
+                        continue
+                    seen.add(segment)
+                    found[self.words[index]].append((divmod(first, size), divmod(last, size)))
+        return found
+    
+    def count_through(self, cells: List[str], size: int, touched: Iterable[int]) -> Dict[str, int]:
+        """
+        Compte les occurrences passant par au moins une des cases données.
+        
+        Seules les lignes de ces cases sont parcourues. Quand ces cases
+        viennent d'être remplies (les autres restant inchangées), le résultat
+        est exactement le nombre d'occurrences apparues.
+        
+        Args:
+            cells: Grille à plat (' ' pour une case vide)
+            size: Taille de la grille
+            touched: Indices à plat des cases à considérer
+        
+        Returns:
+            Nombre d'occurrences de chaque mot concerné
+        """
+        touched = set(touched)
+        counts: Dict[str, int] = {}
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        
+        for step in SCAN_STEPS:
+            order, position, reach = line_table(size, step)
+            line_starts = _line_start_table(size, step)
+            lines = {line_starts[cell]: position[cell] + reach[cell] for cell in touched}
+            for first, end in lines.items():
+                seen = set()
+                state = 0
+                marked = -1  # Dernière position d'une case considérée
+                for index in range(first, end):
+                    cell = order[index]
+                    if cell in touched:
+                        marked = index
+                    letter = cells[cell]
+                    while state and letter not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(letter, 0)
+                    for word_index, length, _ in outputs[state]:
+                        # Occurrence ne passant par aucune des cases, ou palindrome déjà compté
+                        if marked <= index - length or (word_index, index) in seen:
+                            continue
+                        seen.add((word_index, index))
+                        word = self.words[word_index]
+                        counts[word] = counts.get(word, 0) + 1
+        return counts
+    
+    def ambiguous(self, grid: List[List[str]]) -> Dict[str, List[Occurrence]]:
+        """Retourne les mots présents plus d'une fois dans la grille."""
+        return {word: occurrences for word, occurrences in self.scan(grid).items()
+                if len(occurrences) > 1}
+    
+
+def word_cells(word_info: Dict, size: int) -> List[Cell]:
+    """
+    Retourne les cases d'un mot placé, depuis sa case de départ.
+    
+    Args:
+        word_info: Informations du mot placé (voir `GridGenerator`)
+        size: Taille de la grille
+    
+    Returns:
+        Liste de (ligne, colonne), vide si le mot sort de la grille
+    """
+    row, col = word_info['start']
+    if not (0 <= row < size and 0 <= col < size):
+        return []
+    step = DIRECTIONS.get(word_info['direction'], (0, 1))
+    cells = segment(size, row * size + col, step, word_info['length'])
+    return [divmod(index, size) for index in cells] if cells else []
+    
+
+def word_endpoints(word_info: Dict) -> Occurrence:
+    """
+    Retourne les cases extrêmes d'un mot placé, dans son sens de lecture.
+    
+    Args:
+        word_info: Informations du mot placé (voir `GridGenerator`)
+    """
+    dr, dc = DIRECTIONS[word_info['direction']]
+    row, col = word_info['start']
+    length = word_info['length']
+    end = (row + (length - 1) * dr, col + (length - 1) * dc)
+    # Un mot inversé est écrit à partir de sa dernière lettre
+    if word_info.get('reversed'):
+        return end, (row, col)
+    return (row, col), end
+    
+
+class PlacementIndex:
+    """
+    Index des mots placés d'une grille, par texte et par cases extrêmes.
+    
+    Construit une fois au démarrage du niveau : retrouver un mot, ou le mot
+    placé entre deux cases (dans un sens ou dans l'autre), se fait en O(1).
+    """
+    
+    def __init__(self, placed_words: Iterable[Dict]):
+        """
+        Construit l'index.
+        
+        Args:
+            placed_words: Informations des mots placés (voir `GridGenerator`)
+        """
+        self.by_word: Dict[str, Dict] = {}
+        self.by_endpoints: Dict[Occurrence, Dict] = {}
+        for info in placed_words:
+            self.by_word[info['word']] = info
+            first, last = word_endpoints(info)
+            self.by_endpoints[(first, last)] = info
+            self.by_endpoints[(last, first)] = info
+    
+    def word(self, word: str) -> Optional[Dict]:
+        """Retourne les informations d'un mot placé (None s'il n'est pas dans la grille)."""
+        return self.by_word.get(word)
+    
+    def between(self, start: Cell, end: Cell) -> Optional[Dict]:
+        """Retourne le mot placé exactement entre deux cases, lu dans un sens ou dans l'autre."""
+        return self.by_endpoints.get((tuple(start), tuple(end)))
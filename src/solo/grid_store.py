@@ -0,0 +1,285 @@
+"""
+Cache des grilles générées, en deux niveaux : mémoire (LRU) puis disque.
+Mode Solo (partagé avec le serveur multijoueur et la commande `build`).
+
+Une grille est identifiée par (langue, niveau, seed, version du dictionnaire,
+version du générateur) : changer d'algorithme ou de dictionnaire invalide
+automatiquement les anciennes entrées. Le niveau disque est une base SQLite
+(bibliothèque standard) où chaque grille tient en une ligne compacte ; il
+contient aussi les grilles pré-générées par `build`, qui ne sont jamais évincées.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+Grid = List[List[str]]
+Key = Tuple[str, int, int, str, int]
+
+
+def open_database(path: Optional[str], read_only: bool, schema: Iterable[str],
+                  name: str) -> Optional[sqlite3.Connection]:
+    """
+    Ouvre une base SQLite de cache (None si indisponible).
+    
+    En lecture seule, la base n'est ni créée ni modifiée ; sinon son dossier
+    et ses tables sont créés au besoin.
+    
+    Args:
+        path: Fichier de la base (None = pas de base)
+        read_only: Ouvrir la base en lecture seule
+        schema: Instructions de création des tables et des index
+        name: Nom de la base dans les messages d'erreur
+    
+    Returns:
+        Connexion partageable entre threads, ou None
+    """
+    if not path or (read_only and not os.path.exists(path)):
+        return None
+    try:
+        if read_only:
+            uri = 'file:' + os.path.abspath(path).replace('\\', '/') + '?mode=ro'
+            return sqlite3.connect(uri, uri=True, check_same_thread=False)
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        db = sqlite3.connect(path, check_same_thread=False)
+        for statement in schema:
+            db.execute(statement)
+        db.commit()
+        return db
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠ {name} indisponible: {e}")
+        return None
+    
+
+
+class GridCache:
+    """Cache des grilles : LRU en mémoire devant une base SQLite bornée."""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS grids (
+            language TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            seed INTEGER NOT NULL,
+            dictionary_version TEXT NOT NULL,
+            generator_version INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            letters TEXT NOT NULL,
+            words TEXT NOT NULL,
+            pregenerated INTEGER NOT NULL DEFAULT 0,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (language, level, seed, dictionary_version, generator_version)
+        )
+    """
+    
+    def __init__(self, path: Optional[str], max_memory: int = 64, max_disk: int = 10000,
+                 read_only: bool = False):
+        """
+        Initialise le cache.
+        
+        Args:
+            path: Fichier de la base (None = mémoire uniquement)
+            max_memory: Nombre de grilles gardées en mémoire
+            max_disk: Nombre de grilles gardées sur disque (hors grilles pré-générées)
+            read_only: Ne jamais écrire sur le disque (cache préparé par `build`)
+        """
+        self.path = path
+        self.max_memory = max_memory
+        self.max_disk = max_disk
+        self.read_only = read_only
+        self._memory: 'OrderedDict[Key, Tuple[int, str, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_opened = False
+        
+        # Compteurs
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+    
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Ouvre la base à la première utilisation (None si indisponible)."""
+        if not self._db_opened:
+            self._db_opened = True
+            self._db = open_database(self.path, self.read_only, [self.SCHEMA], "Cache des grilles")
+        return self._db
+    
+    @staticmethod
+    def _encode(grid: Grid, words: List[Dict]) -> Tuple[int, str, str]:
+        """Forme compacte : taille, lettres ligne par ligne, mots en JSON."""
+        return len(grid), ''.join(''.join(row) for row in grid), json.dumps(words, ensure_ascii=False,
+                                                                            separators=(',', ':'))
+    
+    @staticmethod
+    def _decode(entry: Tuple[int, str, str]) -> Tuple[Grid, List[Dict]]:
+        """Reconstruit une copie neuve de la grille et des mots."""
+        size, letters, words = entry
+        grid = [list(letters[row * size:(row + 1) * size]) for row in range(size)]
+        return grid, [dict(info, start=tuple(info['start'])) for info in json.loads(words)]
+    
+    def _remember(self, key: Key, entry: Tuple[int, str, str]):
+        """Ajoute une entrée en mémoire en évinçant la moins récemment utilisée."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+    
+    def get(self, language: str, level: int, seed: int, dictionary_version: str,
+            generator_version: int) -> Optional[Tuple[Grid, List[Dict]]]:
+        """
+        Retourne la grille en cache d'un seed, ou None.
+        
+        Returns:
+            Tuple (grille, informations des mots placés) ou None
+        """
+        key = (language, level, seed, dictionary_version, generator_version)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._decode(entry)
+            
+            db = self._connection()
+            row = None
+            if db is not None:
+                row = db.execute(
+                    "SELECT size, letters, words FROM grids WHERE language = ? AND level = ? AND seed = ? "
+                    "AND dictionary_version = ? AND generator_version = ?", key
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            
+            self.disk_hits += 1
+            if not self.read_only:
+                db.execute(
+                    "UPDATE grids SET last_used = ? WHERE language = ? AND level = ? AND seed = ? "
+                    "AND dictionary_version = ? AND generator_version = ?", (time.time(),) + key
+                )
+                db.commit()
+            self._remember(key, tuple(row))
+            return self._decode(tuple(row))
+    
+    def put(self, language: str, level: int, seed: int, dictionary_version: str, generator_version: int,
+            grid: Grid, words: List[Dict], pregenerated: bool = False):
+        """Ajoute une grille au cache (mémoire, puis disque s'il est accessible en écriture)."""
+        self.put_many(language, level, dictionary_version, generator_version, {seed: (grid, words)},
+                      pregenerated=pregenerated, remember=True)
+    
+    def put_many(self, language: str, level: int, dictionary_version: str, generator_version: int,
+                 grids: Dict[int, Tuple[Grid, List[Dict]]], pregenerated: bool = False,
+                 remember: bool = False):
+        """
+        Ajoute plusieurs grilles d'un niveau en une seule transaction.
+        
+        Les entrées de la même langue produites avec un autre dictionnaire ou
+        un autre générateur sont supprimées au passage.
+        
+        Args:
+            grids: Grille et mots par seed
+            pregenerated: Grilles de la commande `build` (jamais évincées)
+            remember: Garder aussi les grilles en mémoire
+        """
+        entries = {seed: self._encode(grid, words) for seed, (grid, words) in grids.items()}
+        with self._lock:
+            if remember:
+                for seed, entry in entries.items():
+                    self._remember((language, level, seed, dictionary_version, generator_version), entry)
+            
+            db = self._connection()
+            if db is None or self.read_only:
+                return
+            now = time.time()
+            db.execute(
+                "DELETE FROM grids WHERE language = ? AND (dictionary_version != ? OR generator_version != ?)",
+                (language, dictionary_version, generator_version)
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO grids VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(language, level, seed, dictionary_version, generator_version, size, letters, words,
+                  int(pregenerated), now) for seed, (size, letters, words) in entries.items()]
+            )
+            self._evict_disk(db)
+            db.commit()
+    
+    def _evict_disk(self, db: sqlite3.Connection):
+        """Supprime les grilles les moins récemment utilisées au-delà de `max_disk`."""
+        count = db.execute("SELECT COUNT(*) FROM grids WHERE pregenerated = 0").fetchone()[0]
+        excess = count - self.max_disk
+        if excess > 0:
+            db.execute(
+                "DELETE FROM grids WHERE rowid IN (SELECT rowid FROM grids WHERE pregenerated = 0 "
+                "ORDER BY last_used LIMIT ?)", (excess,)
+            )
+            self.disk_evictions += excess
+    
+    def seeds(self, language: str, level: int, dictionary_version: str, generator_version: int,
+              pregenerated_only: bool = True) -> List[int]:
+        """Retourne les seeds en cache d'un niveau (par défaut, ceux pré-générés)."""
+        with self._lock:
+            db = self._connection()
+            if db is None:
+                return []
+            query = ("SELECT seed FROM grids WHERE language = ? AND level = ? AND dictionary_version = ? "
+                     "AND generator_version = ?")
+            if pregenerated_only:
+                query += " AND pregenerated = 1"
+            rows = db.execute(query + " ORDER BY seed",
+                              (language, level, dictionary_version, generator_version)).fetchall()
+            return [row[0] for row in rows]
+    
+    def stats(self) -> Dict:
+        """Retourne les compteurs du cache."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            db = self._connection()
+            disk_entries = db.execute("SELECT COUNT(*) FROM grids").fetchone()[0] if db is not None else 0
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                'memory_evictions': self.memory_evictions,
+                'disk_evictions': self.disk_evictions,
+                'memory_entries': len(self._memory),
+                'disk_entries': disk_entries,
+            }
+    
+    def close(self):
+        """Ferme la base."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+
+GRID_CACHE_FILE = 'grids.sqlite3'
+
+# Instance globale
+_grid_store_instance = None
+_grid_store_lock = threading.Lock()  # Création unique, même depuis plusieurs threads
+
+def get_grid_store() -> GridCache:
+    """
+    Retourne l'instance globale du cache (dans le dossier du cache des dictionnaires).
+    
+    Le disque n'est pas modifié si le cache a été préparé par la commande `build`.
+    """
+    global _grid_store_instance
+    if _grid_store_instance is None:
+        from src.word_generator import WordGenerator
+        with _grid_store_lock:
+            if _grid_store_instance is None:
+                read_only = os.path.exists(os.path.join(WordGenerator.DICT_CACHE_DIR, WordGenerator.MANIFEST_FILE))
+                _grid_store_instance = GridCache(os.path.join(WordGenerator.DICT_CACHE_DIR, GRID_CACHE_FILE),
+                                                 read_only=read_only)
+    return _grid_store_instance
@@ -0,0 +1,117 @@
+"""
+Génération par tuiles des très grandes grilles (mode marathon).
+Mode Solo.
+
+Une grille de 100×100 à 500×500 est découpée en tuiles carrées, générées
+l'une après l'autre par `GridGenerator` (une suite de tirages du seed par
+tuile) : la mémoire et le temps de génération croissent linéairement avec le
+nombre de cases, et chaque tuile peut être affichée dès qu'elle est prête.
+Une dernière passe sur la grille entière garantit qu'aucun mot n'apparaît une
+seconde fois dans une autre tuile.
+"""
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from src.prng import PCG32
+from src.solo.grid_generator import GridConfig, GridGenerator
+
+
+# Côté d'une tuile (la taille d'une grille marathon en est un multiple)
+TILE_SIZE = 20
+
+# Longueur minimale des mots : sur 250 000 cases, un mot de 3 ou 4 lettres
+# apparaîtrait des dizaines de fois par hasard
+MARATHON_MIN_LENGTH = 5
+
+
+@dataclass
+class GridTile:
+    """Une tuile générée, à sa place dans la grille."""
+    index: int
+    row: int  # Première ligne de la tuile dans la grille
+    col: int  # Première colonne de la tuile dans la grille
+    letters: List[List[str]]
+    words: List[Dict]  # Positions exprimées dans la grille entière
+    
+
+TileCallback = Callable[[GridTile], None]
+
+
+class TiledGridGenerator:
+    """Génère une très grande grille tuile par tuile."""
+    
+    def __init__(self, seed: Optional[int] = None, tile_size: int = TILE_SIZE):
+        """
+        Initialise le générateur.
+        
+        Args:
+            seed: Seed de la grille (None = aléatoire)
+            tile_size: Côté des tuiles
+        """
+        self.seed = seed if seed is not None else random.randint(0, 999999)
+        self.tile_size = tile_size
+        self.repaired_cells: List[Tuple[int, int]] = []  # Cases changées après l'envoi de leur tuile
+    
+    def tile_origins(self, size: int) -> List[Tuple[int, int]]:
+        """Retourne la première case de chaque tuile, ligne par ligne."""
+        if size % self.tile_size:
+            raise ValueError(f"La taille de la grille ({size}) doit être un multiple de {self.tile_size}")
+        return [(row, col) for row in range(0, size, self.tile_size) for col in range(0, size, self.tile_size)]
+    
+    def generate_grid(self, config: GridConfig, words: List[str], level_number: int,
+                      on_tile: Optional[TileCallback] = None) -> Tuple[List[List[str]], List[Dict]]:
+        """
+        Génère la grille entière.
+        
+        Args:
+            config: Configuration de la grille (taille, nombre total de mots, directions)
+            words: Dictionnaire indexé (ou simple liste de mots)
+            level_number: Numéro du niveau (tirage des mots)
+            on_tile: Appelée avec chaque tuile dès qu'elle est générée
+        
+        Returns:
+            Tuple contenant la grille et les informations des mots placés
+        """
+        origins = self.tile_origins(config.size)
+        selected = self._select_words(words, config.num_words, level_number)
+        grid = [[' '] * config.size for _ in range(config.size)]
+        placed_words: List[Dict] = []
+        
+        for index, (row, col) in enumerate(origins):
+            # Mots de la tuile : une part égale de la liste, sans doublon d'une tuile à l'autre
+            tile_words = selected[index::len(origins)]
+            if not tile_words:
+                continue
+            tile_config = GridConfig(self.tile_size, len(tile_words), config.allow_diagonal, config.allow_reverse,
+                                     solver=True)
+            generator = GridGenerator(self.seed, stream=index)
+            letters, tile_placed = generator.generate_grid(tile_config, tile_words)
+            
+            for offset, line in enumerate(letters):
+                grid[row + offset][col:col + self.tile_size] = line
+            tile_placed = [dict(info, start=(info['start'][0] + row, info['start'][1] + col))
+                           for info in tile_placed]
+            placed_words.extend(tile_placed)
+            if on_tile:
+                on_tile(GridTile(index, row, col, letters, tile_placed))
+        
+        # Un mot d'une tuile peut se retrouver par hasard dans une autre (ou à cheval sur deux)
+        tiled = [line[:] for line in grid]
+        placed_words = GridGenerator(self.seed, stream=len(origins))._make_unambiguous(grid, placed_words)
+        self.repaired_cells = [(row, col) for row, (before, after) in enumerate(zip(tiled, grid))
+                               for col in range(config.size) if before[col] != after[col]]
+        return grid, placed_words
+    
+    def _select_words(self, words, count: int, level_number: int) -> List[str]:
+        """Tire les mots de toute la grille (assez longs pour ne pas se répéter par hasard)."""
+        if hasattr(words, 'select_words'):
+            selected = words.select_words(self.seed, level_number, count, MARATHON_MIN_LENGTH, self.tile_size)
+        else:
+            suitable = [word for word in dict.fromkeys(words)
+                        if MARATHON_MIN_LENGTH <= len(word) <= self.tile_size]
+            selected = PCG32(self.seed).sample(suitable, min(count, len(suitable)))
+        return [word.upper() for word in selected]
+    
+    def get_seed(self) -> int:
+        """Retourne le seed utilisé pour la génération."""
+        return self.seed
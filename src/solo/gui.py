@@ -6,9 +6,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import List, Tuple, Optional, Dict
 import math
+import time
 from src.solo.game_logic import GameLogic
 from src.solo.save_manager import SaveManager
+from src.solo.background import BackgroundWorker
+from src.solo.grid_pool import get_grid_pool
+from src.solo.grid_boards import segment_between
+from src.solo.grid_scanner import word_cells
+from src.solo.grid_tiles import TILE_SIZE
 from src.word_generator import get_word_generator
+from src.dictionary_fetcher import DictionaryFetcher
 from src.language import get_language
 
 
@@ -26,6 +33,10 @@ class WordSearchGUI:
     COLOR_WORD_LIST = "#34495E"
     COLOR_WORD_FOUND = "#27AE60"
     
+    # Marathon : taille fixe des cases (la grille défile) et lignes dessinées par passage de la boucle Tk
+    MARATHON_CELL_SIZE = 24
+    MARATHON_ROWS_PER_FRAME = TILE_SIZE
+    
     # Couleurs pour les mots trouvés (variées, pas blanc ni trop clair)
     WORD_COLORS = [
         "#E74C3C",  # Rouge
@@ -50,13 +61,16 @@ class WordSearchGUI:
         self.root.geometry("1200x800")
         self.root.configure(bg=self.COLOR_BG)
         
-        # Language and word generator
+        # Language and word generator (le dictionnaire est chargé en arrière-plan)
         self.lang = get_language()
         self.word_gen = get_word_generator()
-        self.word_gen.set_language(self.lang.current_language)
+        self.worker = BackgroundWorker(self.root)
+        self.word_gen.set_progress_callback(
+            lambda *args: self.worker.post(self.on_dictionary_progress, *args)
+        )
         
-        # Game logic
-        self.game = GameLogic(self.word_gen.get_words())
+        # Game logic (remplacée au démarrage de chaque niveau)
+        self.game = GameLogic([])
         self.save_manager = SaveManager()
         
         # Update title
@@ -81,14 +95,24 @@ class WordSearchGUI:
         self.timer_label = None
         self.score_label = None
         self.level_label = None
+        self.seed_label = None
+        self.words_list = None
         self.word_labels = {}
+        self.status_label = None
+        self.status_text = ""
+        self.loading_message = ""
         
         # Timer
         self.timer_running = False
         self.timer_id = None
         
+        # Dessin progressif (marathon)
+        self.draw_id = None
+        self.marathon_pending = False
+        
         self.create_menu()
         self.show_main_menu()
+        self.load_dictionary(self.lang.current_language)
     
     def update_title(self):
         """Met à jour le titre de la fenêtre."""
@@ -128,10 +152,19 @@ class WordSearchGUI:
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
+        if self.draw_id:
+            self.root.after_cancel(self.draw_id)
+            self.draw_id = None
         self.timer_running = False
+        self.marathon_pending = False
+        self.canvas = None
+        self.status_label = None
+        self.loading_message = ""
     
     def show_main_menu(self):
         """Affiche le menu principal."""
+        # Une grille encore en génération ne doit plus remplacer le menu
+        self.worker.cancel('level')
         self.clear_window()
         
         frame = tk.Frame(self.root, bg=self.COLOR_BG)
@@ -183,6 +216,76 @@ class WordSearchGUI:
         tk.Button(frame, text=self.lang.get('settings'), command=self.show_settings, **button_style).pack(pady=10)
         tk.Button(frame, text=self.lang.get('quit'), command=self.root.quit, bg="#E74C3C", fg="white", 
                  font=("Arial", 14), width=25, height=2, relief="flat").pack(pady=20)
+        
+        # État du chargement du dictionnaire
+        self.status_label = tk.Label(
+            frame,
+            text=self.status_text,
+            font=("Arial", 11),
+            bg=self.COLOR_BG,
+            fg="#BDC3C7"
+        )
+        self.status_label.pack(pady=5)
+    
+    def set_status(self, text: str):
+        """Met à jour le message d'état (menu principal ou écran de chargement)."""
+        self.status_text = text
+        if self.status_label is not None and self.status_label.winfo_exists():
+            self.status_label.config(text=text or self.loading_message)
+    
+    def load_dictionary(self, language: str):
+        """Charge le dictionnaire d'une langue dans le thread de travail."""
+        if self.word_gen.is_loaded(language):
+            self.word_gen.set_language(language)
+            self.warm_grid_pool(language)
+            return
+        self.set_status(self.lang.get('loading_dictionary'))
+        self.worker.submit(
+            self.word_gen.set_language, language,
+            on_done=lambda _: (self.set_status(""), self.warm_grid_pool(language)),
+            on_error=lambda e: self.set_status(f"⚠ {e}"),
+            key='dictionary'
+        )
+    
+    def warm_grid_pool(self, language: str):
+        """Prépare en arrière-plan des grilles des niveaux prédéfinis."""
+        get_grid_pool().warm(self.word_gen.get_index(language), range(1, len(GameLogic.LEVELS) + 1))
+    
+    def on_dictionary_progress(self, lang: str, status: str, done: int, total: Optional[int]):
+        """Affiche la progression du téléchargement (appelée dans la boucle Tk)."""
+        if status == DictionaryFetcher.DOWNLOADING and total:
+            self.set_status(self.lang.get('downloading_dictionary', done * 100 // total))
+        elif status == DictionaryFetcher.COMPILING:
+            self.set_status(self.lang.get('loading_dictionary'))
+    
+    def show_loading_screen(self, message: str):
+        """Affiche un écran d'attente pendant une tâche en arrière-plan."""
+        self.clear_window()
+        
+        frame = tk.Frame(self.root, bg=self.COLOR_BG)
+        frame.pack(expand=True)
+        
+        tk.Label(
+            frame,
+            text=f"🔤 {self.lang.get('app_title')} 🔤",
+            font=("Arial", 28, "bold"),
+            bg=self.COLOR_BG,
+            fg="#ECF0F1"
+        ).pack(pady=20)
+        
+        progress = ttk.Progressbar(frame, mode='indeterminate', length=300)
+        progress.pack(pady=10)
+        progress.start(15)
+        
+        self.loading_message = message
+        self.status_label = tk.Label(
+            frame,
+            text=self.status_text or message,
+            font=("Arial", 12),
+            bg=self.COLOR_BG,
+            fg="#BDC3C7"
+        )
+        self.status_label.pack(pady=10)
     
     def new_game_dialog(self):
         """Affiche le dialogue de sélection de niveau."""
@@ -261,6 +364,19 @@ class WordSearchGUI:
             fg="#BDC3C7"
         ).pack(pady=5)
         
+        tk.Button(
+            custom_frame,
+            text=f"🏃 {self.lang.get('marathon')}",
+            font=("Arial", 14, "bold"),
+            width=25,
+            height=2,
+            bg="#E67E22",
+            fg="white",
+            relief="flat",
+            cursor="hand2",
+            command=self.marathon_dialog
+        ).pack(pady=(10, 0))
+        
         tk.Button(
             frame,
             text=self.lang.get('back'),
@@ -283,18 +399,123 @@ class WordSearchGUI:
         if level:
             self.start_level(level)
     
+    def marathon_dialog(self):
+        """Dialogue pour choisir la taille d'une grille marathon."""
+        sizes = GameLogic.MARATHON_SIZES
+        grid_size = simpledialog.askinteger(
+            self.lang.get('marathon'),
+            self.lang.get('marathon_dialog', sizes[0], sizes[-1], TILE_SIZE),
+            initialvalue=sizes[0],
+            minvalue=sizes[0],
+            maxvalue=sizes[-1]
+        )
+        if grid_size:
+            self.start_marathon(grid_size - grid_size % TILE_SIZE)
+    
+    def start_marathon(self, grid_size: int, seed: Optional[int] = None):
+        """
+        Démarre un marathon.
+        
+        La grille est générée tuile par tuile dans le thread de travail ;
+        chaque tuile est dessinée dès qu'elle arrive, puis la liste des mots
+        et le chronomètre apparaissent quand la grille est complète.
+        """
+        language = self.lang.current_language
+        # Partie provisoire (grille vide) pour mettre l'écran en place pendant la génération
+        placeholder = GameLogic([])
+        placeholder.current_level = GameLogic.marathon_level(grid_size)
+        placeholder.grid = [[' '] * grid_size for _ in range(grid_size)]
+        placeholder.seed = seed
+        self.game = placeholder
+        self.found_cells = []
+        self.cell_colors = {}
+        self.color_index = 0
+        self.show_game_screen()
+        self.marathon_pending = True
+        self.set_status(f"{self.lang.get('generating_grid')} 0/{(grid_size // TILE_SIZE) ** 2}")
+        
+        self.worker.submit(
+            self.build_marathon, grid_size, seed, language,
+            on_done=self.on_marathon_ready,
+            on_error=self.on_level_error,
+            key='level'
+        )
+    
+    def build_marathon(self, grid_size: int, seed: Optional[int], language: str) -> GameLogic:
+        """Génère la grille marathon (thread de travail, sans widgets)."""
+        game = GameLogic(self.word_gen.get_index(language))
+        game.start_marathon(grid_size, seed, on_tile=lambda tile: self.worker.post(self.on_marathon_tile, tile))
+        return game
+    
+    def on_marathon_tile(self, tile):
+        """Dessine une tuile de la grille marathon dès qu'elle est générée."""
+        if not self.marathon_pending or self.canvas is None:
+            return
+        for offset, line in enumerate(tile.letters):
+            self.game.grid[tile.row + offset][tile.col:tile.col + len(line)] = line
+        self.draw_cells(range(tile.row, tile.row + len(tile.letters)),
+                        range(tile.col, tile.col + len(tile.letters)))
+        tiles = (len(self.game.grid) // TILE_SIZE) ** 2
+        self.set_status(f"{self.lang.get('generating_grid')} {tile.index + 1}/{tiles}")
+    
+    def on_marathon_ready(self, game: GameLogic):
+        """Termine l'affichage du marathon une fois la grille complète."""
+        if not self.marathon_pending or self.canvas is None:
+            return
+        self.marathon_pending = False
+        self.game = game
+        self.game.start_time = time.time()
+        # Lettres changées par la dernière passe, après le dessin de leur tuile
+        for row, col in game.repaired_cells:
+            if self.cell_texts[row][col] is not None:
+                self.canvas.itemconfig(self.cell_texts[row][col], text=game.grid[row][col])
+        self.seed_label.config(text=f"{self.lang.get('seed')}: {game.seed}")
+        self.set_status("")
+        self.fill_word_list()
+        self.start_timer()
+    
     def start_level(self, level: int, seed: Optional[int] = None):
-        """Démarre un niveau."""
-        try:
-            # Mettre à jour les mots selon la langue
-            self.game = GameLogic(self.word_gen.get_words())
-            info = self.game.start_level(level, seed)
-            self.found_cells = []
-            self.cell_colors = {}
-            self.color_index = 0
-            self.show_game_screen()
-        except Exception as e:
-            messagebox.showerror(self.lang.get('error'), f"{e}")
+        """Démarre un niveau (la grille est générée dans le thread de travail)."""
+        language = self.lang.current_language
+        if seed is None and self.word_gen.is_loaded(language):
+            # Grille prête dans la réserve : démarrage immédiat
+            word_index = self.word_gen.get_index(language)
+            prepared = get_grid_pool().pop(word_index, level)
+            if prepared is not None:
+                self.worker.cancel('level')
+                game = GameLogic(word_index)
+                game.start_level(level, prepared=prepared)
+                self.on_level_ready(game)
+                return
+        
+        self.show_loading_screen(self.lang.get('generating_grid'))
+        self.worker.submit(
+            self.build_level, level, seed, language,
+            on_done=self.on_level_ready,
+            on_error=self.on_level_error,
+            key='level'
+        )
+    
+    def build_level(self, level: int, seed: Optional[int], language: str) -> GameLogic:
+        """Prépare la partie d'un niveau (thread de travail, sans widgets)."""
+        # Mettre à jour les mots selon la langue
+        game = GameLogic(self.word_gen.get_index(language))
+        game.start_level(level, seed)
+        return game
+    
+    def on_level_ready(self, game: GameLogic):
+        """Affiche le niveau une fois la grille générée."""
+        self.game = game
+        self.game.start_time = time.time()
+        self.found_cells = []
+        self.cell_colors = {}
+        self.color_index = 0
+        self.show_game_screen()
+    
+    def on_level_error(self, error: Exception):
+        """Signale l'échec de la génération et revient au menu."""
+        messagebox.showerror(self.lang.get('error'), f"{error}")
+        self.show_main_menu()
     
     def continue_game(self):
         """Continue la dernière partie sauvegardée."""
@@ -355,6 +576,8 @@ class WordSearchGUI:
     
     def save_game_dialog(self):
         """Dialogue pour sauvegarder la partie."""
+        if self.marathon_pending:
+            return
         save_name = simpledialog.askstring(self.lang.get('save'), self.lang.get('save_dialog'))
         if save_name:
             self.save_manager.save_game(self.game.get_game_state(), save_name)
@@ -412,14 +635,19 @@ class WordSearchGUI:
         )
         self.score_label.pack(side=tk.RIGHT)
         
-        seed_label = tk.Label(
+        self.seed_label = tk.Label(
             header,
             text=f"{self.lang.get('seed')}: {self.game.seed}",
             font=("Arial", 12),
             bg=self.COLOR_BG,
             fg="#95A5A6"
         )
-        seed_label.pack(side=tk.LEFT, padx=20)
+        self.seed_label.pack(side=tk.LEFT, padx=20)
+        
+        if self.game.current_level.marathon:
+            self.level_label.config(text=self.lang.get('marathon_grid', len(self.game.grid), len(self.game.grid)))
+            self.status_label = tk.Label(header, text="", font=("Arial", 11), bg=self.COLOR_BG, fg="#BDC3C7")
+            self.status_label.pack(side=tk.LEFT, padx=10)
         
         # Container pour la grille et la liste
         game_container = tk.Frame(main_frame, bg=self.COLOR_BG)
@@ -430,18 +658,29 @@ class WordSearchGUI:
         canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         grid_size = len(self.game.grid)
-        self.cell_size = min(40, 600 // grid_size)
+        marathon = self.game.current_level.marathon
+        self.cell_size = self.MARATHON_CELL_SIZE if marathon else min(40, 600 // grid_size)
         canvas_width = grid_size * self.cell_size + 2 * self.grid_offset_x
         canvas_height = grid_size * self.cell_size + 2 * self.grid_offset_y
         
         self.canvas = tk.Canvas(
             canvas_frame,
-            width=canvas_width,
-            height=canvas_height,
+            width=min(canvas_width, 700) if marathon else canvas_width,
+            height=min(canvas_height, 650) if marathon else canvas_height,
             bg=self.COLOR_GRID_BG,
             highlightthickness=0
         )
-        self.canvas.pack()
+        if marathon:
+            # Grille plus grande que la fenêtre : barres de défilement et molette
+            self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
+            x_scroll = ttk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
+            y_scroll = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+            self.canvas.configure(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+            x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+            y_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+            self.canvas.bind("<MouseWheel>", self.on_grid_mousewheel)
+            self.canvas.bind("<Shift-MouseWheel>", self.on_grid_mousewheel)
+        self.canvas.pack(side=tk.LEFT, anchor="n")
         
         # Bindings pour la sélection
         self.canvas.bind("<Button-1>", self.on_mouse_down)
@@ -485,11 +724,24 @@ class WordSearchGUI:
         words_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        self.words_list = words_list
+        self.fill_word_list()
+        
+        # Partie provisoire d'un marathon en cours de génération : les tuiles sont dessinées à leur arrivée
+        if marathon and not self.game.words_to_find:
+            self.reset_cell_items()
+            return
+        
+        self.draw_grid()
+        self.start_timer()
+    
+    def fill_word_list(self):
+        """Remplit la liste des mots à trouver et marque ceux déjà trouvés."""
         self.word_labels = {}
         for word_info in self.game.words_to_find:
             word = word_info['word']
             label = tk.Label(
-                words_list,
+                self.words_list,
                 text=f"  {word}",
                 font=("Arial", 14),
                 bg=self.COLOR_WORD_LIST,
@@ -501,36 +753,61 @@ class WordSearchGUI:
         
         # Marquer les mots déjà trouvés (pour le chargement de sauvegarde)
         self.update_found_words_display()
-        
-        self.draw_grid()
-        self.start_timer()
+    
+    def reset_cell_items(self):
+        """Efface le canvas et prépare les tables des rectangles et des lettres (cases non dessinées)."""
+        self.canvas.delete("all")
+        grid_size = len(self.game.grid)
+        self.cell_rects = [[None] * grid_size for _ in range(grid_size)]
+        self.cell_texts = [[None] * grid_size for _ in range(grid_size)]
     
     def draw_grid(self):
-        """Dessine la grille de mots mêlés."""
+        """
+        Dessine la grille de mots mêlés.
+        
+        Une grille marathon est dessinée par bandes de lignes, une bande par
+        passage de la boucle Tk, pour que la fenêtre reste réactive.
+        """
         if not self.canvas or not self.game.grid:
             return
         
-        self.canvas.delete("all")
-        self.cell_rects = []
-        self.cell_texts = []
-        
+        if self.draw_id:
+            self.root.after_cancel(self.draw_id)
+            self.draw_id = None
+        self.reset_cell_items()
         grid_size = len(self.game.grid)
-        
-        for i in range(grid_size):
-            row_rects = []
-            row_texts = []
-            for j in range(grid_size):
+        if self.game.current_level and self.game.current_level.marathon:
+            self.draw_band(0)
+        else:
+            self.draw_cells(range(grid_size), range(grid_size))
+    
+    def draw_band(self, first_row: int):
+        """Dessine une bande de lignes de la grille puis planifie la suivante."""
+        self.draw_id = None
+        grid_size = len(self.game.grid)
+        last_row = min(first_row + self.MARATHON_ROWS_PER_FRAME, grid_size)
+        self.draw_cells(range(first_row, last_row), range(grid_size))
+        if last_row < grid_size:
+            self.draw_id = self.root.after(1, self.draw_band, last_row)
+    
+    def cell_color(self, cell: Tuple[int, int]) -> str:
+        """Retourne la couleur de fond d'une cellule."""
+        if cell in self.cell_colors:
+            # Utiliser la couleur spécifique assignée à cette cellule
+            return self.cell_colors[cell]
+        if cell in self.current_selection:
+            return self.COLOR_SELECTED
+        return self.COLOR_CELL
+    
+    def draw_cells(self, rows: range, cols: range):
+        """Dessine un bloc de cellules (rectangle et lettre de chaque case)."""
+        for i in rows:
+            row_rects = self.cell_rects[i]
+            row_texts = self.cell_texts[i]
+            for j in cols:
                 x = self.grid_offset_x + j * self.cell_size
                 y = self.grid_offset_y + i * self.cell_size
-                
-                # Déterminer la couleur
-                if (i, j) in self.found_cells:
-                    # Utiliser la couleur spécifique assignée à cette cellule
-                    color = self.cell_colors.get((i, j), self.COLOR_FOUND)
-                elif (i, j) in self.current_selection:
-                    color = self.COLOR_SELECTED
-                else:
-                    color = self.COLOR_CELL
+                color = self.cell_color((i, j))
                 
                 # Dessiner la cellule
                 rect = self.canvas.create_rectangle(
@@ -549,20 +826,33 @@ class WordSearchGUI:
                     fill=self.COLOR_TEXT
                 )
                 
-                row_rects.append(rect)
-                row_texts.append(text)
-            
-            self.cell_rects.append(row_rects)
-            self.cell_texts.append(row_texts)
+                row_rects[j] = rect
+                row_texts[j] = text
+    
+    def refresh_cells(self, cells: List[Tuple[int, int]]):
+        """Recolore quelques cellules sans redessiner la grille."""
+        for row, col in cells:
+            rect = self.cell_rects[row][col]
+            if rect is not None:
+                self.canvas.itemconfig(rect, fill=self.cell_color((row, col)))
+    
+    def on_grid_mousewheel(self, event):
+        """Fait défiler la grille marathon avec la molette (Maj : horizontalement)."""
+        steps = int(-1 * (event.delta / 120))
+        if event.state & 0x0001:
+            self.canvas.xview_scroll(steps, "units")
+        else:
+            self.canvas.yview_scroll(steps, "units")
+        return "break"
     
     def get_cell_from_coords(self, x: int, y: int) -> Optional[Tuple[int, int]]:
-        """Convertit les coordonnées canvas en indices de cellule."""
-        if not self.game.grid:
+        """Convertit les coordonnées de l'événement (canvas éventuellement défilé) en indices de cellule."""
+        if not self.game.grid or self.marathon_pending:
             return None
         
         grid_size = len(self.game.grid)
-        col = (x - self.grid_offset_x) // self.cell_size
-        row = (y - self.grid_offset_y) // self.cell_size
+        col = int(self.canvas.canvasx(x) - self.grid_offset_x) // self.cell_size
+        row = int(self.canvas.canvasy(y) - self.grid_offset_y) // self.cell_size
         
         if 0 <= row < grid_size and 0 <= col < grid_size:
             return (row, col)
@@ -576,84 +866,38 @@ class WordSearchGUI:
         
         # Pour chaque mot trouvé, retrouver ses cellules
         for found_word in self.game.found_words:
-            # Chercher le mot dans words_to_find pour obtenir sa position
-            for word_info in self.game.words_to_find:
-                if word_info['word'] == found_word:
-                    # Reconstruire la liste des cellules pour ce mot
-                    cells = self.get_cells_from_word_info(word_info)
-                    
-                    if cells:  # Vérifier que des cellules ont bien été trouvées
-                        # Assigner une couleur à ce mot
-                        word_color = self.WORD_COLORS[self.color_index % len(self.WORD_COLORS)]
-                        self.color_index += 1
-                        
-                        # Ajouter les cellules
-                        self.found_cells.extend(cells)
-                        for cell in cells:
-                            self.cell_colors[cell] = word_color
-                    break
+            # Position du mot (index des mots placés)
+            word_info = self.game.placements.word(found_word)
+            if word_info is None:
+                continue
+            
+            # Reconstruire la liste des cellules pour ce mot
+            cells = self.get_cells_from_word_info(word_info)
+            
+            if cells:  # Vérifier que des cellules ont bien été trouvées
+                # Assigner une couleur à ce mot
+                word_color = self.WORD_COLORS[self.color_index % len(self.WORD_COLORS)]
+                self.color_index += 1
+                
+                # Ajouter les cellules
+                self.found_cells.extend(cells)
+                for cell in cells:
+                    self.cell_colors[cell] = word_color
     
     def get_cells_from_word_info(self, word_info: Dict) -> List[Tuple[int, int]]:
         """Retourne la liste des cellules pour un mot donné depuis word_info."""
-        cells = []
-        row, col = word_info['start']
-        direction = word_info['direction']
-        length = word_info['length']
-        
-        # Déterminer les deltas selon la direction
-        deltas = {
-            'horizontal': (0, 1),
-            'vertical': (1, 0),
-            'diagonal_down': (1, 1),
-            'diagonal_up': (-1, 1)
-        }
-        
-        dr, dc = deltas.get(direction, (0, 1))
-        
         # Le point 'start' est déjà le point de départ du mot tel qu'il est placé dans la grille
-        # (qu'il soit inversé ou non), donc on suit simplement la direction
-        for i in range(length):
-            r = row + i * dr
-            c = col + i * dc
-            # Vérifier que les coordonnées sont valides
-            if 0 <= r < len(self.game.grid) and 0 <= c < len(self.game.grid[0]):
-                cells.append((r, c))
-            else:
-                # Si une cellule est hors limites, on arrête et retourne une liste vide
-                # pour indiquer qu'il y a un problème
-                return []
-        
-        return cells
+        # (qu'il soit inversé ou non) ; liste vide si le mot sort de la grille
+        return word_cells(word_info, len(self.game.grid))
     
     def get_cells_in_line(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Retourne toutes les cellules dans une ligne entre start et end."""
-        cells = []
-        row1, col1 = start
-        row2, col2 = end
-        
-        # Calculer la direction
-        dr = row2 - row1
-        dc = col2 - col1
-        
-        # Normaliser la direction pour avoir -1, 0 ou 1
-        steps = max(abs(dr), abs(dc))
-        if steps == 0:
+        size = len(self.game.grid)
+        # Ligne horizontale, verticale ou diagonale seulement (tables des segments partagées)
+        cells = segment_between(size, start, end)
+        if not cells:
             return [start]
-        
-        dr = dr / steps
-        dc = dc / steps
-        
-        # Vérifier si c'est une ligne valide (horizontale, verticale ou diagonale)
-        if abs(dr) not in [0, 1] or abs(dc) not in [0, 1]:
-            return [start]
-        
-        # Construire la liste des cellules
-        for i in range(steps + 1):
-            row = int(row1 + i * dr)
-            col = int(col1 + i * dc)
-            cells.append((row, col))
-        
-        return cells
+        return [divmod(index, size) for index in cells]
     
     def on_mouse_down(self, event):
         """Gère le clic de souris."""
@@ -662,8 +906,9 @@ class WordSearchGUI:
             self.selecting = True
             self.selection_start = cell
             self.selection_end = cell
+            previous = self.current_selection
             self.current_selection = [cell]
-            self.draw_grid()
+            self.refresh_cells(previous + self.current_selection)
     
     def on_mouse_drag(self, event):
         """Gère le glissement de souris."""
@@ -673,8 +918,9 @@ class WordSearchGUI:
         cell = self.get_cell_from_coords(event.x, event.y)
         if cell and cell != self.selection_end:
             self.selection_end = cell
+            previous = self.current_selection
             self.current_selection = self.get_cells_in_line(self.selection_start, self.selection_end)
-            self.draw_grid()
+            self.refresh_cells(previous + self.current_selection)
     
     def on_mouse_up(self, event):
         """Gère le relâchement de souris."""
@@ -682,38 +928,34 @@ class WordSearchGUI:
             return
         
         self.selecting = False
+        canvas, selection = self.canvas, self.current_selection
         
-        # Extraire le mot sélectionné
+        # Vérifier la sélection par ses cases extrêmes (dans un sens ou dans l'autre)
         if self.current_selection:
-            word = ''.join(self.game.grid[r][c] for r, c in self.current_selection)
-            word_reverse = word[::-1]
-            
-            # Vérifier si le mot ou son inverse est correct
-            if self.game.check_word(word):
-                self.on_word_found(word, self.current_selection)
-            elif self.game.check_word(word_reverse):
-                self.on_word_found(word_reverse, self.current_selection)
+            word_info = self.game.check_selection(self.current_selection[0], self.current_selection[-1])
+            if word_info:
+                self.on_word_found(word_info['word'], self.get_cells_from_word_info(word_info))
         
         self.current_selection = []
-        self.draw_grid()
+        # Le niveau suivant a pu être affiché entre-temps (nouveau canvas)
+        if self.canvas is canvas:
+            self.refresh_cells(selection)
     
     def update_found_words_display(self):
         """Met à jour l'affichage des mots trouvés dans la liste."""
         # Parcourir les mots trouvés et leur appliquer la couleur
-        for i, found_word in enumerate(self.game.found_words):
-            if found_word in self.word_labels:
+        for found_word in self.game.found_words:
+            word_info = self.game.placements.word(found_word)
+            if found_word in self.word_labels and word_info is not None:
                 # Trouver la couleur associée à ce mot
                 # On cherche la première cellule de ce mot pour obtenir sa couleur
-                for word_info in self.game.words_to_find:
-                    if word_info['word'] == found_word:
-                        cells = self.get_cells_from_word_info(word_info)
-                        if cells and cells[0] in self.cell_colors:
-                            word_color = self.cell_colors[cells[0]]
-                            self.word_labels[found_word].config(
-                                fg=word_color,
-                                font=("Arial", 14, "bold", "overstrike")
-                            )
-                        break
+                cells = self.get_cells_from_word_info(word_info)
+                if cells and cells[0] in self.cell_colors:
+                    word_color = self.cell_colors[cells[0]]
+                    self.word_labels[found_word].config(
+                        fg=word_color,
+                        font=("Arial", 14, "bold", "overstrike")
+                    )
     
     def on_word_found(self, word: str, cells: List[Tuple[int, int]]):
         """Appelé quand un mot est trouvé."""
@@ -733,6 +975,8 @@ class WordSearchGUI:
                 font=("Arial", 14, "bold", "overstrike")
             )
         
+        self.refresh_cells(cells)
+        
         # Mettre à jour le score
         self.update_score()
         
@@ -740,8 +984,6 @@ class WordSearchGUI:
         if self.game.is_level_complete():
             self.timer_running = False
             self.level_complete()
-        
-        self.draw_grid()
     
     def start_timer(self):
         """Démarre le chronomètre."""
@@ -796,7 +1038,9 @@ class WordSearchGUI:
             msg + "\n\n" + self.lang.get('continue_question')
         )
         
-        if result == 'yes':
+        if result == 'yes' and self.game.current_level.marathon:
+            self.start_marathon(len(self.game.grid))
+        elif result == 'yes':
             self.start_level(level + 1)
         else:
             self.show_main_menu()
@@ -870,7 +1114,6 @@ class WordSearchGUI:
             new_lang = lang_var.get()
             if new_lang != self.lang.current_language:
                 self.lang.set_language(new_lang)
-                self.word_gen.set_language(new_lang)
                 messagebox.showinfo(
                     self.lang.get('success'),
                     self.lang.get('language_changed')
@@ -880,6 +1123,7 @@ class WordSearchGUI:
                 self.update_title()
                 self.create_menu()
                 self.show_main_menu()
+                self.load_dictionary(new_lang)
             else:
                 dialog.destroy()
         
@@ -0,0 +1,175 @@
+"""
+Catalogue des meilleurs seeds par niveau et par langue.
+Mode Solo (partagé avec le serveur multijoueur et la réserve de grilles).
+
+La commande `python -m src.word_generator catalog` génère hors ligne des
+plages de seeds et enregistre la note de chaque grille (voir `grid_quality`).
+En jeu, choisir un excellent seed se fait alors en O(1), sans générer puis
+rejeter des grilles. Le catalogue est une petite base SQLite ; comme le cache
+des grilles, ses entrées sont liées aux versions du dictionnaire et du
+générateur, et celles d'une autre version sont ignorées puis remplacées.
+"""
+import os
+import random
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.solo.grid_store import open_database
+
+
+CatalogKey = Tuple[str, int, str, int]
+
+
+class SeedCatalog:
+    """Notes des grilles par seed, et liste des meilleurs seeds de chaque niveau."""
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS seeds (
+            language TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            dictionary_version TEXT NOT NULL,
+            generator_version INTEGER NOT NULL,
+            seed INTEGER NOT NULL,
+            quality REAL NOT NULL,
+            complete INTEGER NOT NULL,
+            PRIMARY KEY (language, level, dictionary_version, generator_version, seed)
+        )
+    """
+    INDEX = """
+        CREATE INDEX IF NOT EXISTS seeds_by_quality
+        ON seeds (language, level, dictionary_version, generator_version, complete, quality)
+    """
+    
+    # Part des seeds complets gardés comme « excellents » (les mieux notés)
+    EXCELLENT_SHARE = 0.25
+    
+    def __init__(self, path: Optional[str], read_only: bool = False):
+        """
+        Initialise le catalogue.
+        
+        Args:
+            path: Fichier de la base
+            read_only: Ne jamais écrire sur le disque (cache préparé par `build`)
+        """
+        self.path = path
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_opened = False
+        self._excellent: Dict[CatalogKey, List[int]] = {}
+    
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Ouvre la base à la première utilisation (None si indisponible)."""
+        if not self._db_opened:
+            self._db_opened = True
+            self._db = open_database(self.path, self.read_only, [self.SCHEMA, self.INDEX], "Catalogue des seeds")
+        return self._db
+    
+    def record(self, language: str, level: int, dictionary_version: str, generator_version: int,
+               scores: Iterable[Tuple[int, float, bool]]):
+        """
+        Enregistre les notes d'une plage de seeds d'un niveau.
+        
+        Les entrées de la même langue produites avec un autre dictionnaire ou
+        un autre générateur sont supprimées au passage.
+        
+        Args:
+            scores: Tuples (seed, note, tous les mots placés)
+        """
+        with self._lock:
+            db = self._connection()
+            if db is None or self.read_only:
+                return
+            db.execute(
+                "DELETE FROM seeds WHERE language = ? AND (dictionary_version != ? OR generator_version != ?)",
+                (language, dictionary_version, generator_version)
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO seeds VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(language, level, dictionary_version, generator_version, seed, quality, int(complete))
+                 for seed, quality, complete in scores]
+            )
+            db.commit()
+            self._excellent.clear()
+    
+    def excellent_seeds(self, language: str, level: int, dictionary_version: str,
+                        generator_version: int) -> List[int]:
+        """
+        Retourne les meilleurs seeds d'un niveau (grilles complètes les mieux notées).
+        
+        La liste est lue une fois puis gardée en mémoire.
+        """
+        key = (language, level, dictionary_version, generator_version)
+        with self._lock:
+            if key not in self._excellent:
+                seeds: List[int] = []
+                db = self._connection()
+                if db is not None:
+                    rows = db.execute(
+                        "SELECT seed FROM seeds WHERE language = ? AND level = ? AND dictionary_version = ? "
+                        "AND generator_version = ? AND complete = 1 ORDER BY quality DESC, seed", key
+                    ).fetchall()
+                    if rows:
+                        seeds = [row[0] for row in rows[:max(1, int(len(rows) * self.EXCELLENT_SHARE))]]
+                self._excellent[key] = seeds
+            return self._excellent[key]
+    
+    def pick(self, language: str, level: int, dictionary_version: str, generator_version: int,
+             rng=random) -> Optional[int]:
+        """
+        Tire un excellent seed d'un niveau (None si le niveau n'est pas catalogué).
+        
+        Args:
+            rng: Générateur aléatoire (module `random` par défaut)
+        """
+        seeds = self.excellent_seeds(language, level, dictionary_version, generator_version)
+        return rng.choice(seeds) if seeds else None
+    
+    def summary(self, language: str, level: int, dictionary_version: str,
+                generator_version: int) -> Dict:
+        """Retourne le nombre de seeds notés, la part de grilles complètes et les notes d'un niveau."""
+        with self._lock:
+            db = self._connection()
+            if db is None:
+                return {'seeds': 0}
+            count, complete, mean, best = db.execute(
+                "SELECT COUNT(*), SUM(complete), AVG(quality), MAX(quality) FROM seeds WHERE language = ? "
+                "AND level = ? AND dictionary_version = ? AND generator_version = ?",
+                (language, level, dictionary_version, generator_version)
+            ).fetchone()
+        return {
+            'seeds': count,
+            'complete_rate': (complete or 0) / count if count else 0.0,
+            'mean_quality': mean or 0.0,
+            'best_quality': best or 0.0,
+        }
+    
+    def close(self):
+        """Ferme la base."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+
+SEED_CATALOG_FILE = 'seeds.sqlite3'
+
+# Instance globale
+_seed_catalog_instance = None
+_seed_catalog_lock = threading.Lock()  # Création unique, même depuis plusieurs threads
+
+def get_seed_catalog() -> SeedCatalog:
+    """
+    Retourne l'instance globale du catalogue (dans le dossier du cache des dictionnaires).
+    
+    Le disque n'est pas modifié si le cache a été préparé par la commande `build`.
+    """
+    global _seed_catalog_instance
+    if _seed_catalog_instance is None:
+        from src.word_generator import WordGenerator
+        with _seed_catalog_lock:
+            if _seed_catalog_instance is None:
+                read_only = os.path.exists(os.path.join(WordGenerator.DICT_CACHE_DIR, WordGenerator.MANIFEST_FILE))
+                _seed_catalog_instance = SeedCatalog(os.path.join(WordGenerator.DICT_CACHE_DIR, SEED_CATALOG_FILE),
+                                                     read_only=read_only)
+    return _seed_catalog_instance
@@ -3,10 +3,14 @@ Générateur de mots dynamique pour différentes langues.
 Utilise des dictionnaires aléatoires via des bibliothèques externes.
 """
 import random
-from typing import List, Set
+from typing import List, Optional, Iterable, Sequence, Dict
+import json
 import os
-import urllib.request
-import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.compiled_dictionary import CompiledDictionary, compile_text_file
+from src.dawg import Dawg, lexicographic_words, write_dawg
+from src.dictionary_fetcher import DictionaryFetcher, ProgressCallback
 
 
 class WordGenerator:
@@ -22,6 +26,9 @@ class WordGenerator:
     # Cache local des dictionnaires
     DICT_CACHE_DIR = 'dict_cache'
     
+    # Manifeste écrit par `python -m src.word_generator build`
+    MANIFEST_FILE = 'manifest.json'
+    
     # Mots de secours si le téléchargement échoue
     FALLBACK_FRENCH_WORDS = [
         # Animaux
@@ -140,28 +147,84 @@ class WordGenerator:
         "COCHE", "TREN", "AVION", "BARCO", "BICICLETA", "MOTOCICLETA",
     ]
     
-    def __init__(self, language: str = 'fr'):
+    def __init__(self, language: str = 'fr', read_only: Optional[bool] = None):
         """
         Initialise le générateur.
         
+        Les dictionnaires ne sont plus chargés ici : chaque langue est lue
+        à la première demande (voir `_get_language_words`).
+        
         Args:
             language: Code de langue ('fr', 'en', 'es')
+            read_only: Ne jamais écrire dans le cache (None = automatique : oui
+                si le cache a été préparé par la commande `build`)
         """
         self.language = language
-        self.word_cache: dict = {}  # Cache des mots chargés
+        self.manifest = self._load_manifest()
+        self.read_only = self.manifest is not None if read_only is None else read_only
+        self.word_cache: dict = {}  # Cache des mots chargés (par langue)
+        self.dawg_cache: dict = {}  # Graphes de mots (appartenance / préfixes) par langue
+        self._cache_lock = threading.Lock()  # Protège les tables des verrous et des caches
+        self._language_locks: Dict[str, threading.Lock] = {}  # Chargement d'une langue (téléchargement compris)
+        self._prefetch_thread: Optional[threading.Thread] = None
         self._ensure_cache_dir()
-        self._load_dictionaries()
+        self.fetcher = DictionaryFetcher(self.DICT_CACHE_DIR, self.DICT_URLS)
     
     def _ensure_cache_dir(self):
         """Crée le dossier de cache s'il n'existe pas."""
-        if not os.path.exists(self.DICT_CACHE_DIR):
+        if not self.read_only and not os.path.exists(self.DICT_CACHE_DIR):
             os.makedirs(self.DICT_CACHE_DIR)
     
+    def _load_manifest(self) -> Optional[Dict]:
+        """Charge le manifeste du cache préparé, s'il existe."""
+        try:
+            with open(os.path.join(self.DICT_CACHE_DIR, self.MANIFEST_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
     def _get_cache_path(self, lang: str) -> str:
-        """Retourne le chemin du fichier de cache pour une langue."""
+        """Retourne le chemin du fichier de cache texte pour une langue."""
         return os.path.join(self.DICT_CACHE_DIR, f'{lang}_words.txt')
     
-    def _download_dictionary(self, lang: str) -> Set[str]:
+    def _get_compiled_path(self, lang: str) -> str:
+        """Retourne le chemin du dictionnaire compilé pour une langue."""
+        return self.fetcher.compiled_path(lang)
+    
+    def _get_dawg_path(self, lang: str) -> str:
+        """Retourne le chemin du graphe de mots (DAWG) pour une langue."""
+        return os.path.join(self.DICT_CACHE_DIR, f'{lang}_words.dawg')
+    
+    def set_progress_callback(self, callback: Optional[ProgressCallback]):
+        """
+        Définit la fonction de progression des téléchargements.
+        
+        Elle reçoit (langue, statut, octets reçus, octets attendus ou None) et
+        est appelée depuis les threads de téléchargement.
+        """
+        self.fetcher.progress = callback
+    
+    def _open_compiled(self, lang: str) -> Optional[CompiledDictionary]:
+        """Ouvre le dictionnaire compilé s'il existe, en convertissant le cache texte au besoin."""
+        compiled_path = self._get_compiled_path(lang)
+        cache_path = self._get_cache_path(lang)
+        
+        try:
+            if not os.path.exists(compiled_path) and os.path.exists(cache_path) and not self.read_only:
+                print(f"⏳ Conversion du cache {lang} au format compilé...")
+                compile_text_file(cache_path, compiled_path)
+            
+            if os.path.exists(compiled_path):
+                words = CompiledDictionary.open(compiled_path, lang)
+                if len(words):
+                    return words
+                words.close()
+        except (OSError, ValueError) as e:
+            print(f"⚠ Erreur lecture cache {lang}: {e}")
+        
+        return None
+    
+    def _download_dictionary(self, lang: str) -> Optional[CompiledDictionary]:
         """
         Télécharge un dictionnaire depuis GitHub.
         
@@ -169,72 +232,226 @@ class WordGenerator:
             lang: Code de langue
             
         Returns:
-            Ensemble de mots
+            Dictionnaire compilé, ou None en cas d'échec
         """
-        cache_path = self._get_cache_path(lang)
-        
         # Vérifier si le cache existe
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    words = set(line.strip().upper() for line in f if line.strip())
-                if words:
-                    print(f"✓ Dictionnaire {lang} chargé depuis le cache ({len(words)} mots)")
-                    return words
-            except Exception as e:
-                print(f"⚠ Erreur lecture cache {lang}: {e}")
+        words = self._open_compiled(lang)
+        if words is not None:
+            print(f"✓ Dictionnaire {lang} chargé depuis le cache ({len(words)} mots)")
+            return words
         
         # Télécharger depuis GitHub
-        if lang in self.DICT_URLS:
-            try:
-                print(f"⏳ Téléchargement du dictionnaire {lang}...")
-                
-                # Contourner la vérification SSL pour les anciens systèmes
-                context = ssl._create_unverified_context()
-                
-                with urllib.request.urlopen(self.DICT_URLS[lang], context=context, timeout=10) as response:
-                    content = response.read().decode('utf-8')
-                    words = set()
-                    
-                    for line in content.split('\n'):
-                        word = line.strip().upper()
-                        # Filtrer les mots valides (3-15 lettres, alphabétiques)
-                        if 3 <= len(word) <= 15 and word.isalpha():
-                            words.add(word)
-                    
-                    # Sauvegarder dans le cache
-                    with open(cache_path, 'w', encoding='utf-8') as f:
-                        for word in sorted(words):
-                            f.write(word + '\n')
-                    
+        if self.read_only:
+            print(f"⚠ Dictionnaire {lang} absent du cache préparé (lecture seule)")
+        elif lang in self.DICT_URLS:
+            print(f"⏳ Téléchargement du dictionnaire {lang}...")
+            if self.fetcher.fetch(lang) != DictionaryFetcher.FAILED:
+                words = self._open_compiled(lang)
+                if words is not None:
                     print(f"✓ Dictionnaire {lang} téléchargé ({len(words)} mots)")
                     return words
-                    
-            except Exception as e:
-                print(f"⚠ Erreur téléchargement {lang}: {e}")
         
-        return set()
+        return None
     
-    def _load_dictionaries(self):
-        """Charge tous les dictionnaires disponibles."""
-        for lang in ['fr', 'en', 'es']:
-            words = self._download_dictionary(lang)
-            
-            if not words:
-                # Utiliser les mots de secours
-                print(f"⚠ Utilisation des mots de secours pour {lang}")
-                if lang == 'fr':
-                    words = set(self.FALLBACK_FRENCH_WORDS)
-                elif lang == 'en':
-                    words = set(self.FALLBACK_ENGLISH_WORDS)
-                elif lang == 'es':
-                    words = set(self.FALLBACK_SPANISH_WORDS)
-            
-            self.word_cache[lang] = list(words)
+    def _get_fallback_words(self, lang: str) -> List[str]:
+        """Retourne les mots de secours d'une langue."""
+        if lang == 'en':
+            return self.FALLBACK_ENGLISH_WORDS
+        if lang == 'es':
+            return self.FALLBACK_SPANISH_WORDS
+        return self.FALLBACK_FRENCH_WORDS
+    
+    def _language_lock(self, lang: str) -> threading.Lock:
+        """Retourne le verrou de chargement d'une langue."""
+        with self._cache_lock:
+            if lang not in self._language_locks:
+                self._language_locks[lang] = threading.Lock()
+            return self._language_locks[lang]
+    
+    def _get_language_words(self, lang: str) -> Sequence[str]:
+        """
+        Retourne les mots d'une langue en les chargeant au premier appel.
+        
+        Le verrou de la langue garantit qu'elle n'est lue qu'une seule fois,
+        même si le préchargement en arrière-plan la demande en même temps ;
+        le téléchargement d'une langue ne bloque pas l'accès aux autres.
+        
+        Args:
+            lang: Code de langue
+        
+        Returns:
+            Dictionnaire compilé des mots en majuscules
+        """
+        words = self.word_cache.get(lang)
+        if words is not None:
+            return words
+        
+        with self._language_lock(lang):
+            if lang not in self.word_cache:
+                loaded = self._download_dictionary(lang)
+                
+                if not loaded:
+                    # Utiliser les mots de secours
+                    print(f"⚠ Utilisation des mots de secours pour {lang}")
+                    loaded = CompiledDictionary.from_words(self._get_fallback_words(lang), lang)
+                
+                self.word_cache[lang] = loaded
+            return self.word_cache[lang]
+    
+    def _needs_download(self, lang: str) -> bool:
+        """Indique si une langue n'a encore aucun cache local."""
+        return (lang not in self.word_cache
+                and not self.read_only
+                and lang in self.DICT_URLS
+                and not os.path.exists(self._get_compiled_path(lang))
+                and not os.path.exists(self._get_cache_path(lang)))
+    
+    def _fetch_language(self, lang: str) -> str:
+        """
+        Télécharge une langue absente du cache, sous le verrou de la langue.
+        
+        Un chargement au premier plan et un préchargement ne peuvent donc pas
+        reprendre en même temps le même fichier `.part`.
+        
+        Returns:
+            Statut du téléchargement (voir `DictionaryFetcher`)
+        """
+        with self._language_lock(lang):
+            # Chargée ou téléchargée entre-temps par un autre thread
+            if not self._needs_download(lang):
+                return DictionaryFetcher.CACHED
+            return self.fetcher.fetch(lang)
+    
+    def _load_dictionaries(self, languages: Optional[Iterable[str]] = None):
+        """Charge les dictionnaires demandés (toutes les langues par défaut)."""
+        languages = ['fr', 'en', 'es'] if languages is None else list(languages)
+        
+        # Télécharger en parallèle les langues absentes du cache
+        missing = [lang for lang in languages if self._needs_download(lang)]
+        if len(missing) > 1:
+            print(f"⏳ Téléchargement des dictionnaires {', '.join(missing)}...")
+            with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix='dict-fetch') as pool:
+                list(pool.map(self._fetch_language, missing))
+        
+        for lang in languages:
+            self._get_language_words(lang)
+    
+    def refresh_dictionaries(self, languages: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Vérifie auprès du serveur si les dictionnaires en cache sont à jour.
+        
+        Seules les langues modifiées sont retéléchargées (requêtes conditionnelles
+        ETag / Last-Modified). Les fichiers ouverts d'une langue vérifiée sont
+        fermés avant (un fichier mappé ne peut pas être remplacé sous
+        Windows) ; la langue sera rechargée au prochain accès, et les
+        dictionnaires obtenus auparavant ne doivent plus être utilisés.
+        
+        Args:
+            languages: Langues à vérifier (toutes par défaut)
+        
+        Returns:
+            Statut de chaque langue (voir `DictionaryFetcher`)
+        """
+        languages = [lang for lang in (self.DICT_URLS if languages is None else languages) if lang in self.DICT_URLS]
+        if not languages:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(languages), thread_name_prefix='dict-fetch') as pool:
+            return dict(zip(languages, pool.map(self._revalidate_language, languages)))
+    
+    def _revalidate_language(self, lang: str) -> str:
+        """Ferme les fichiers d'une langue puis la revalide, sous le verrou de la langue."""
+        with self._language_lock(lang):
+            for cache in (self.word_cache, self.dawg_cache):
+                opened = cache.pop(lang, None)
+                if opened is not None:
+                    opened.close()
+            return self.fetcher.fetch(lang, revalidate=True)
+    
+    def is_loaded(self, lang: Optional[str] = None) -> bool:
+        """Indique si le dictionnaire d'une langue est déjà en mémoire."""
+        return (lang or self.language) in self.word_cache
+    
+    def prefetch(self, languages: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        Précharge des dictionnaires dans un thread d'arrière-plan.
+        
+        Args:
+            languages: Langues à précharger (par défaut toutes sauf la courante)
+        
+        Returns:
+            Le thread de préchargement (démon)
+        """
+        if languages is None:
+            languages = [lang for lang in ['fr', 'en', 'es'] if lang != self.language]
+        languages = [lang for lang in languages if lang not in self.word_cache]
+        
+        self._prefetch_thread = threading.Thread(
+            target=self._load_dictionaries,
+            args=(languages,),
+            name="dict-prefetch",
+            daemon=True
+        )
+        self._prefetch_thread.start()
+        return self._prefetch_thread
     
     def set_language(self, language: str):
-        """Change la langue."""
+        """Change la langue et charge son dictionnaire si nécessaire."""
         self.language = language
+        self._get_language_words(language)
+    
+    def get_index(self, language: Optional[str] = None) -> CompiledDictionary:
+        """
+        Retourne le dictionnaire indexé par longueur d'une langue.
+        
+        Contrairement à `get_words`, aucune copie n'est faite : utiliser
+        `sample()` pour tirer des mots sans parcourir tout le dictionnaire.
+        
+        Args:
+            language: Code de langue (None = langue courante)
+        """
+        words = self._get_language_words(language or self.language)
+        if not len(words):
+            print(f"⚠ Aucun mot disponible pour {language or self.language}, utilisation du français")
+            words = self._get_language_words('fr')
+        return words
+    
+    def get_dawg(self, language: Optional[str] = None) -> Dawg:
+        """
+        Retourne le graphe de mots d'une langue, pour tester rapidement si une
+        chaîne est un mot (`in`) ou un préfixe de mot (`has_prefix`).
+        
+        Le graphe est construit une seule fois depuis le dictionnaire compilé
+        puis mis en cache sur disque ; il est reconstruit si le dictionnaire change.
+        
+        Args:
+            language: Code de langue (None = langue courante)
+        """
+        index = self.get_index(language)
+        lang = index.language
+        dawg = self.dawg_cache.get(lang)
+        if dawg is not None and dawg.source_digest == index.digest:
+            return dawg
+        
+        with self._language_lock(lang):
+            dawg_path = self._get_dawg_path(lang)
+            try:
+                dawg = Dawg.open(dawg_path) if os.path.exists(dawg_path) else None
+            except (OSError, ValueError):
+                dawg = None
+            
+            if dawg is None or dawg.source_digest != index.digest:
+                if dawg is not None:
+                    dawg.close()
+                if os.path.exists(self._get_compiled_path(lang)) and not self.read_only:
+                    print(f"⏳ Construction du graphe de mots {lang}...")
+                    write_dawg(index, dawg_path)
+                    dawg = Dawg.open(dawg_path)
+                else:
+                    # Mots de secours ou cache en lecture seule : graphe en mémoire uniquement
+                    dawg = Dawg.from_words(lexicographic_words(index), index.digest)
+            
+            self.dawg_cache[lang] = dawg
+            return dawg
     
     def get_words(self, count: int = None) -> List[str]:
         """
@@ -246,18 +463,14 @@ class WordGenerator:
         Returns:
             Liste de mots en majuscules
         """
-        # Récupérer les mots du cache
-        if self.language not in self.word_cache or not self.word_cache[self.language]:
-            print(f"⚠ Aucun mot disponible pour {self.language}, utilisation du français")
-            words = self.word_cache.get('fr', self.FALLBACK_FRENCH_WORDS.copy())
-        else:
-            words = self.word_cache[self.language].copy()
+        index = self.get_index()
+        
+        if count and count < len(index):
+            return index.sample(count)
         
         # Mélanger pour varier
+        words = list(index)
         random.shuffle(words)
-        
-        if count and count < len(words):
-            return words[:count]
         return words
     
     def get_random_words(self, count: int) -> List[str]:
@@ -270,16 +483,31 @@ class WordGenerator:
         Returns:
             Liste de mots aléatoires
         """
-        all_words = self.get_words()
-        return random.sample(all_words, min(count, len(all_words)))
-
+        return self.get_index().sample(count)
+    
 
 # Instance globale
 _word_generator_instance = None
+_word_generator_lock = threading.Lock()  # Création unique, même depuis plusieurs threads
 
-def get_word_generator() -> WordGenerator:
-    """Retourne l'instance globale du générateur."""
+def get_word_generator(prefetch: bool = False) -> WordGenerator:
+    """
+    Retourne l'instance globale du générateur.
+    
+    Args:
+        prefetch: Précharger les autres langues en arrière-plan
+    """
     global _word_generator_instance
     if _word_generator_instance is None:
-        _word_generator_instance = WordGenerator()
+        with _word_generator_lock:
+            if _word_generator_instance is None:
+                instance = WordGenerator()
+                if prefetch:
+                    instance.prefetch()
+                _word_generator_instance = instance
     return _word_generator_instance
+    
+
+if __name__ == "__main__":
+    from src.cache_builder import main
+    main()